@@ -0,0 +1,326 @@
+"""Local JSON API serving the dashboard's aggregates to other tools.
+
+Endpoints (GET or HEAD):
+
+    /api                          index of endpoints and current data versions
+    /api/enrollment/summary       enrollment per province and education level
+    /api/enrollment/gender        the same, split by gender
+    /api/enrollment/grades        enrollment per province and grade
+    /api/teachers                 teachers per province, gender and level
+    /api/age-groups               enrolled children per year, province and age group
+    /api/hpi/rankings?metric=HPI  countries ranked by an HPI metric (all metrics by default)
+    /api/attendance?year=2020     school attendance per Area Council (all years by default)
+
+Every response carries an ETag derived from the fingerprints of the files it
+is computed from, and a request whose If-None-Match matches gets an empty 304.
+Response bodies are encoded once per data version and then served from
+memory, so a request costs a stat of its source files and a dictionary lookup.
+
+Run it next to the app with DASHBOARD_API_PORT=8600 (it then shares the app's
+caches), or on its own with ``python manage.py serve-api``.
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from data_loader import dataset_fingerprint, frame_fingerprint, load_dataset
+from geography import ATTENDANCE_YEARS, boundary_fingerprint
+from materialized import aggregate
+
+logger = logging.getLogger(__name__)
+
+API_PORT_ENV = "DASHBOARD_API_PORT"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+
+_RESPONSE_CACHE_SIZE = 256
+_response_lock = threading.Lock()
+_response_cache = OrderedDict()
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    One API route.
+
+    Attributes:
+        description (str): Shown in the /api index.
+        sources (tuple of str): Data sources the response is computed from;
+            "boundaries" or a dataset name.
+        build (callable): Takes the query parameters (dict) and returns a
+            DataFrame or a dict of DataFrames.
+        params (dict): Accepted query parameter -> tuple of allowed values.
+    """
+    description: str
+    sources: tuple
+    build: callable
+    params: dict = field(default_factory=dict)
+
+
+def _detailed_enrollment():
+    return load_dataset("Detailed Enrollment")
+
+
+def _enrollment_summary(params):
+    return aggregate("enrollment_summary", _detailed_enrollment())
+
+
+def _gender_summary(params):
+    return aggregate("gender_enrollment_summary", _detailed_enrollment())
+
+
+def _grade_trends(params):
+    return aggregate("enrollment_by_grade", _detailed_enrollment())
+
+
+def _teachers(params):
+    return aggregate("teacher_totals", load_dataset("Teachers Distribution"))
+
+
+def _age_groups(params):
+    return aggregate("age_group_totals", load_dataset("Age Distribution"))
+
+
+def _hpi_rankings(params):
+    from hpi_rankings import HPI_METRICS, get_hpi_rankings
+
+    hpi_data = load_dataset("HPI")
+    rankings = get_hpi_rankings(hpi_data, frame_fingerprint(hpi_data))
+    metrics = [params["metric"]] if "metric" in params else list(HPI_METRICS)
+    return {metric: rankings.ranking_table(metric).drop(columns="display") for metric in metrics}
+
+
+def _attendance(params):
+    from geography import attendance_table
+
+    table = attendance_table()
+    years = [params["year"]] if "year" in params else ATTENDANCE_YEARS
+    return table[["geocode", "name", "province", "province_code"] + [f"attendance_{year}" for year in years]]
+
+
+def _hpi_metric_names():
+    from hpi_rankings import HPI_METRICS
+
+    return tuple(HPI_METRICS)
+
+
+ENDPOINTS = {
+    "/api/enrollment/summary": Endpoint(
+        "Enrollment per province and education level", ("Detailed Enrollment",), _enrollment_summary),
+    "/api/enrollment/gender": Endpoint(
+        "Enrollment per province, gender and education level", ("Detailed Enrollment",), _gender_summary),
+    "/api/enrollment/grades": Endpoint(
+        "Enrollment per province and grade", ("Detailed Enrollment",), _grade_trends),
+    "/api/teachers": Endpoint(
+        "Teachers per province, gender and education level", ("Teachers Distribution",), _teachers),
+    "/api/age-groups": Endpoint(
+        "Enrolled children per year, province and age group", ("Age Distribution",), _age_groups),
+    "/api/hpi/rankings": Endpoint(
+        "Countries ranked by each Happy Planet Index metric", ("HPI",), _hpi_rankings,
+        params={"metric": _hpi_metric_names()}),
+    "/api/attendance": Endpoint(
+        "School attendance per Area Council", ("boundaries",), _attendance,
+        params={"year": tuple(ATTENDANCE_YEARS)}),
+}
+
+
+def source_versions(sources):
+    """Returns source -> SHA-256 of its file for the given sources, from the fingerprint caches."""
+    return {source: (boundary_fingerprint() if source == "boundaries" else dataset_fingerprint(source)).sha256
+            for source in sources}
+
+
+def _etag(path, params, versions):
+    digest = hashlib.sha256(json.dumps([path, sorted(params.items()), sorted(versions.items())]).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _to_json(value):
+    if isinstance(value, pd.DataFrame):
+        # pandas writes NaN as null and numpy scalars as plain numbers
+        return json.loads(value.to_json(orient="records"))
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    return value
+
+
+def get_response(path, params):
+    """
+    Returns the encoded response for an endpoint, building it once per data version.
+
+    Args:
+        path (str): A key of ENDPOINTS.
+        params (dict): Validated query parameters.
+
+    Returns:
+        tuple: (ETag, JSON body as bytes)
+    """
+    endpoint = ENDPOINTS[path]
+    versions = source_versions(endpoint.sources)
+    key = (path, tuple(sorted(params.items())), tuple(sorted(versions.items())))
+    with _response_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return cached
+    etag = _etag(path, params, versions)
+    body = {"endpoint": path, "params": params, "sources": versions, "data": _to_json(endpoint.build(params))}
+    response = (etag, json.dumps(body, separators=(",", ":")).encode("utf-8"))
+    with _response_lock:
+        _response_cache[key] = response
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return response
+
+
+def warm_responses():
+    """Builds every endpoint's default response, so the first requests are served from memory."""
+    for path in ENDPOINTS:
+        try:
+            get_response(path, {})
+        except Exception:
+            logger.exception("Error precomputing %s", path)
+
+
+def clear_response_cache():
+    """Drops all encoded responses."""
+    with _response_lock:
+        _response_cache.clear()
+
+
+def _index():
+    endpoints = {}
+    for path, endpoint in ENDPOINTS.items():
+        endpoints[path] = {
+            "description": endpoint.description,
+            "params": {name: list(values) for name, values in endpoint.params.items()},
+            "sources": source_versions(endpoint.sources),
+        }
+    return json.dumps({"endpoints": endpoints}, separators=(",", ":")).encode("utf-8")
+
+
+def _matches(if_none_match, etag):
+    """Whether an If-None-Match header matches etag (weak comparison, as RFC 9110 requires)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Serves ENDPOINTS; keep-alive connections, JSON bodies, ETags and 304s."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs stall keep-alive clients
+    disable_nagle_algorithm = True
+    server_version = "VanuatuEducationAPI/1"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path == "/api":
+            self._send(HTTPStatus.OK, _index(), send_body=send_body)
+            return
+        endpoint = ENDPOINTS.get(path)
+        if endpoint is None:
+            self._error(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{path}'. See /api for the list.", send_body)
+            return
+
+        params = {}
+        for name, values in parse_qs(url.query).items():
+            allowed = endpoint.params.get(name)
+            if allowed is None:
+                self._error(HTTPStatus.BAD_REQUEST, f"Unknown parameter '{name}'", send_body)
+                return
+            if values[-1] not in allowed:
+                self._error(HTTPStatus.BAD_REQUEST,
+                            f"Invalid {name} '{values[-1]}'. Expected one of: {', '.join(allowed)}", send_body)
+                return
+            params[name] = values[-1]
+
+        try:
+            etag, body = get_response(path, params)
+        except Exception:
+            logger.exception("Error serving %s", path)
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, "Could not compute the response", send_body)
+            return
+        if _matches(self.headers.get("If-None-Match", ""), etag):
+            self._send(HTTPStatus.NOT_MODIFIED, b"", etag=etag, send_body=False)
+            return
+        self._send(HTTPStatus.OK, body, etag=etag, send_body=send_body)
+
+    def _error(self, status, message, send_body):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self._send(status, body, send_body=send_body)
+
+    def _send(self, status, body, etag=None, send_body=True):
+        self.send_response(status)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            # Clients may keep responses but must revalidate them with If-None-Match
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Per-request logging would dominate the cost of a cached response
+        pass
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Creates (but does not start) the threaded API server."""
+    server = ThreadingHTTPServer((host, port), APIRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+_server = None
+_server_error = None
+_server_lock = threading.Lock()
+
+
+def start_api_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Starts the process-wide API server in a background thread once.
+
+    Later calls return the running server. Responses are precomputed in the
+    background right after the server starts. If the server cannot start
+    (e.g. the port is taken), the error is logged once and the dashboard
+    runs without the API.
+
+    Returns:
+        ThreadingHTTPServer or None: The server, or None if it could not start.
+    """
+    global _server, _server_error
+    with _server_lock:
+        if _server is None and _server_error is None:
+            try:
+                _server = make_server(host, port)
+            except OSError as e:
+                _server_error = e
+                logger.error("Could not start the dashboard API on %s:%s: %s", host, port, e)
+                return None
+            threading.Thread(target=_server.serve_forever, name="api-server", daemon=True).start()
+            threading.Thread(target=warm_responses, name="api-warm", daemon=True).start()
+        return _server
@@ -0,0 +1,351 @@
+"""Performance benchmarks for the loaders, transforms, figure builders and the full app.
+
+Every scale runs in its own worker process pointed (via DASHBOARD_DATA_DIR) at
+its own data directory, so caches, imports and peak memory start cold each
+time. Scale 1 is the real data; larger scales are synthetic (see synthetic_data).
+
+Usage:
+    python manage.py benchmark [--scales 1 10 100 1000] [--save-baseline]
+                               [--threshold 0.25] [--no-app]
+    python manage.py import-report [MODULE ...] [--budget 0.75]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from synthetic_data import generate_data_dir
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ROOT, "app.py")
+PAGES_DIR = os.path.join(ROOT, "report_pages")
+SOURCE_DATA_DIR = os.path.join(ROOT, "data")
+BASELINE_PATH = os.path.join(ROOT, "benchmark_baseline.json")
+
+SCALES = [1, 10, 100, 1000]
+DEFAULT_REPEAT = 3
+# A metric regresses when it exceeds the baseline by more than this fraction...
+DEFAULT_THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.25))
+# ...and, for timings, by more than this many seconds (timer noise on tiny benchmarks).
+MIN_SECONDS = 0.005
+APP_TIMEOUT = 600
+
+SEED = 0
+
+# Modules a fresh worker needs to load data and build tables. They must import
+# without the rendering and geo libraries, within IMPORT_BUDGET seconds each.
+DATA_MODULES = ["data_loader", "schemas", "enrollment_transforms", "transforms", "stacked_enrollment",
+                "enrollment_store", "hpi_rankings", "geography", "spatial_aggregation", "data_watcher",
+                "materialized", "sql_explorer"]
+RENDERING_LIBRARIES = ("streamlit", "plotly", "geopandas", "shapely", "pyproj")
+IMPORT_BUDGET = float(os.environ.get("IMPORT_BUDGET_SECONDS", 0.75))
+
+
+def scale_data_dir(target, factor, seed=SEED):
+    """
+    Fills target with the data for one scale.
+
+    Scale 1 is a copy of the real files; larger scales are written by
+    synthetic_data with factor times as many provinces, countries and councils.
+
+    Args:
+        target (str): Directory to write into; created if needed.
+        factor (int): Scale factor.
+        seed (int): Seed for the synthetic files.
+    """
+    if factor == 1:
+        # Only the source files: snapshots, materialized tables and the
+        # enrollment store are rebuilt by the runs that use them.
+        shutil.copytree(SOURCE_DATA_DIR, target, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(".snapshot", ".derived", ".materialized", "enrollment"))
+    else:
+        generate_data_dir(target, scale=factor, seed=seed)
+
+
+def _measure(function, repeat):
+    """
+    Times function (best of repeat runs), then runs it once more under tracemalloc.
+
+    Returns:
+        tuple: (metrics dict with seconds and peak_bytes, the last return value)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}, result
+
+
+def _builder_cases(data):
+    """The figure builders the pages render, with the arguments of each page's default view."""
+    import detailed_enrollment_visualizations as dev
+    import visualizations as vis
+    from data_loader import load_dataset
+    from enrollment_store import read_enrollment, store_years
+    from enrollment_transforms import preprocess_data
+    from geography import ATTENDANCE_YEARS
+
+    detailed = preprocess_data(data["Detailed Enrollment"])
+    population = load_dataset("Population")
+    latest_year = ATTENDANCE_YEARS[-1]
+    cases = {
+        "create_teacher_distribution": lambda: vis.create_teacher_distribution(data["Teachers Distribution"]),
+        "create_gender_ratio_plot": lambda: vis.create_gender_ratio_plot(data["Detailed Enrollment"], "enrollment"),
+        "create_age_distribution_analysis": lambda: vis.create_age_distribution_analysis(data["Age Distribution"]),
+        "create_population_trend_visualization": lambda: vis.create_population_trend_visualization(population, True),
+        "create_attendance_choropleth": lambda: vis.create_attendance_choropleth(latest_year),
+        "create_province_choropleth": lambda: vis.create_province_choropleth("School attendance", latest_year),
+        # The enrollment page's province tabs
+        "create_total_enrollment_bar_chart": lambda: dev.create_total_enrollment_bar_chart(detailed),
+        "create_enrollment_type_pie_chart": lambda: dev.create_enrollment_type_pie_chart(detailed),
+        "create_gender_distribution_bar_chart": lambda: dev.create_gender_distribution_bar_chart(detailed),
+        "create_grade_enrollment_line_chart": lambda: dev.create_grade_enrollment_line_chart(detailed),
+        "create_total_vs_secondary_scatter": lambda: dev.create_total_vs_secondary_scatter(detailed),
+    }
+    if len(store_years()) > 1:
+        history = read_enrollment()
+        cases["create_enrollment_trend_chart"] = lambda: dev.create_enrollment_trend_chart(history)
+    return cases
+
+
+def run_benchmarks(repeat=DEFAULT_REPEAT, app=True):
+    """
+    Runs every benchmark against the data directory this process was started with.
+
+    Returns:
+        dict: Benchmark name -> metrics (seconds, peak_bytes and, for figures, figure_bytes).
+    """
+    from data_loader import DATASETS, clean_percentage, clear_cache, dataset_path, load_data, parse_percentage_column
+    from enrollment_transforms import clear_enrollment_cube_cache, preprocess_data
+    from figure_cache import FIGURE_CACHE
+
+    results = {}
+
+    def cold_load():
+        clear_cache()
+        return load_data()
+
+    results["load_data"], data = _measure(cold_load, repeat)
+
+    raw_ner = pd.read_csv(dataset_path("NER for ECCE"), dtype=str)
+    percentages = raw_ner.filter(regex=r"_\d{4}$").stack()
+    results["clean_percentage"], _ = _measure(lambda: percentages.map(clean_percentage), repeat)
+    results["parse_percentage_column"], _ = _measure(lambda: parse_percentage_column(percentages), repeat)
+
+    results["preprocess_data"], _ = _measure(lambda: preprocess_data(data["Detailed Enrollment"]), repeat)
+
+    for name, build in _builder_cases(data).items():
+        def uncached():
+            # Time the real build, not a cache hit
+            FIGURE_CACHE.clear()
+            clear_enrollment_cube_cache()
+            return build()
+
+        metrics, fig = _measure(uncached, repeat)
+        metrics["figure_bytes"] = len(fig.to_json()) if fig is not None else 0
+        results[name] = metrics
+
+    if app:
+        from streamlit.testing.v1 import AppTest
+
+        def first_run():
+            clear_cache()
+            FIGURE_CACHE.clear()
+            clear_enrollment_cube_cache()
+            at = AppTest.from_file(APP_PATH, default_timeout=APP_TIMEOUT)
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"app.py raised: {at.exception[0].value}")
+            return at
+
+        results["app_first_run"], at = _measure(first_run, 1)
+        results["app_rerun"], _ = _measure(at.run, repeat)
+        for page in sorted(os.listdir(PAGES_DIR)):
+            if not page.endswith(".py"):
+                continue
+            # Switching pages reruns only that page's script against the warm caches
+            at.switch_page(os.path.join(PAGES_DIR, page))
+            results[f"page_{page[:-3]}"], _ = _measure(at.run, repeat)
+
+    results["datasets"] = {"rows": {name: int(len(frame)) for name, frame in data.items()},
+                           "files": sorted(DATASETS.values())}
+    return results
+
+
+def _parse_importtime(stderr):
+    """Parses ``python -X importtime`` output into (depth, module, self seconds, cumulative seconds) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return rows
+
+
+def import_report(module, top=5):
+    """
+    Imports module in a fresh interpreter and reports what it cost.
+
+    Args:
+        module (str): Module to import.
+        top (int): How many of its most expensive dependencies to list.
+
+    Returns:
+        dict: seconds (cumulative import time), heaviest ([(module, seconds)]
+        among its direct imports) and rendering (the RENDERING_LIBRARIES it loaded).
+    """
+    probe = (f"import sys, json; import {module}; "
+             f"print(json.dumps(sorted(name for name in {list(RENDERING_LIBRARIES)!r} if name in sys.modules)))")
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", probe], cwd=ROOT,
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    rendering = json.loads(completed.stdout.strip().splitlines()[-1])
+    rows = _parse_importtime(completed.stderr)
+    # A module is listed after everything it imported; its subtree is the deeper rows just before it
+    end = max((index for index, row in enumerate(rows) if row[:2] == (0, module)), default=None)
+    if end is None:
+        return {"seconds": 0.0, "heaviest": [], "rendering": rendering}
+    start = end
+    while start > 0 and rows[start - 1][0] > 0:
+        start -= 1
+    dependencies = sorted((row for row in rows[start:end] if row[0] == 1), key=lambda row: row[3], reverse=True)
+    return {
+        "seconds": rows[end][3],
+        "heaviest": [(name, cumulative) for _, name, _, cumulative in dependencies[:top]],
+        "rendering": rendering,
+    }
+
+
+def check_import_budget(modules=DATA_MODULES, budget=IMPORT_BUDGET):
+    """
+    Reports the cold import cost of each module and checks it against the budget.
+
+    Returns:
+        tuple: (report lines, list of problems). A module is a problem when it
+        takes longer than budget seconds or loads a rendering library.
+    """
+    lines = [f"{'module':<28}{'seconds':>9}  heaviest imports"]
+    problems = []
+    for module in modules:
+        report = import_report(module)
+        heaviest = ", ".join(f"{name} {seconds:.3f}" for name, seconds in report["heaviest"][:3])
+        lines.append(f"{module:<28}{report['seconds']:>9.3f}  {heaviest}")
+        if report["seconds"] > budget:
+            problems.append(f"{module} takes {report['seconds']:.3f} s to import (budget {budget:.3f} s)")
+        if report["rendering"]:
+            problems.append(f"{module} imports {', '.join(report['rendering'])}")
+    return lines, problems
+
+
+def _run_worker(factor, repeat, app):
+    """Runs run_benchmarks in a fresh process against a data directory scaled by factor."""
+    with tempfile.TemporaryDirectory(prefix=f"benchmark-x{factor}-") as data_dir:
+        scale_data_dir(data_dir, factor)
+        env = dict(os.environ, DASHBOARD_DATA_DIR=data_dir)
+        command = [sys.executable, os.path.abspath(__file__), "--worker", "--repeat", str(repeat)]
+        if not app:
+            command.append("--no-app")
+        completed = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark worker at scale {factor} failed:\n{completed.stderr[-2000:]}")
+    # The worker prints its results as the last line of stdout
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_suite(scales=SCALES, repeat=DEFAULT_REPEAT, app=True):
+    """
+    Runs the benchmarks at every scale.
+
+    Returns:
+        dict: {"meta": {...}, "results": {scale: {benchmark: metrics}}}
+    """
+    results = {}
+    for factor in scales:
+        print(f"Running benchmarks at {factor}x ...", flush=True)
+        results[str(factor)] = _run_worker(factor, repeat, app)
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, min_seconds=MIN_SECONDS):
+    """
+    Compares a suite run with a baseline run.
+
+    Only benchmarks and scales present in both are compared.
+
+    Returns:
+        list of str: One message per metric that regressed beyond the threshold.
+    """
+    regressions = []
+    for scale, benchmarks in current["results"].items():
+        base_benchmarks = baseline.get("results", {}).get(scale, {})
+        for name, metrics in benchmarks.items():
+            base = base_benchmarks.get(name)
+            if name == "datasets" or base is None:
+                continue
+            for metric in ("seconds", "peak_bytes", "figure_bytes"):
+                if metric not in metrics or not base.get(metric):
+                    continue
+                now, before = metrics[metric], base[metric]
+                if now <= before * (1 + threshold):
+                    continue
+                if metric == "seconds" and now - before <= min_seconds:
+                    continue
+                regressions.append(f"{scale}x {name} {metric}: {before:,.4g} -> {now:,.4g} "
+                                   f"(+{(now / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def format_report(suite):
+    """Formats a suite run as a table of seconds, peak memory and figure size per benchmark."""
+    lines = []
+    for scale, benchmarks in suite["results"].items():
+        lines.append(f"\n{scale}x  {json.dumps(benchmarks.get('datasets', {}).get('rows', {}))}")
+        lines.append(f"{'benchmark':<40}{'seconds':>10}{'peak MiB':>10}{'figure KiB':>12}")
+        for name, metrics in benchmarks.items():
+            if name == "datasets":
+                continue
+            figure = metrics.get("figure_bytes")
+            lines.append(f"{name:<40}{metrics['seconds']:>10.4f}{metrics['peak_bytes'] / 2**20:>10.2f}"
+                         f"{'' if figure is None else f'{figure / 1024:.1f}':>12}")
+    return "\n".join(lines)
+
+
+def _worker_main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--worker", action="store_true")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--no-app", action="store_true")
+    args = parser.parse_args(argv)
+    print(json.dumps(run_benchmarks(repeat=args.repeat, app=not args.no_app)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_worker_main(sys.argv[1:]))
@@ -1,9 +1,87 @@
 import pandas as pd
 import numpy as np
+import hashlib
+import json
+import logging
 import os
+import threading
+import weakref
+from dataclasses import dataclass
+
+from schemas import apply_schema
+
+logger = logging.getLogger(__name__)
+
+# DASHBOARD_DATA_DIR points the whole app at another copy of data/, e.g. a scaled one.
+DATA_DIR = (os.environ.get("DASHBOARD_DATA_DIR")
+            or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+
+# Dataset name -> CSV file in DATA_DIR. ``load_data`` returns the CORE_DATASETS;
+# the remaining entries are loaded individually through ``load_dataset``.
+DATASETS = {
+    "NER for ECCE": "ner_ecce.csv",
+    "Enrollment by School Type": "enrollment_by_school.csv",
+    "Detailed Enrollment": "detailed_enrollment.csv",
+    "Teachers Distribution": "teacher_distribution.csv",
+    "Age Distribution": "age_distribution.csv",
+    "HPI": "hpi.csv",
+    "Population": "Population.csv",
+}
+CORE_DATASETS = [
+    "NER for ECCE",
+    "Enrollment by School Type",
+    "Detailed Enrollment",
+    "Teachers Distribution",
+    "Age Distribution",
+]
+
+# Columnar snapshot of the CSVs, written by ``python manage.py compile-data``.
+SNAPSHOT_DIR = os.path.join(DATA_DIR, ".snapshot")
+SNAPSHOT_MANIFEST = os.path.join(SNAPSHOT_DIR, "manifest.json")
+SNAPSHOT_FORMAT_VERSION = 2
+
+_HASH_CHUNK_SIZE = 1 << 20
+_NUMBER_PATTERN = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of a data file: its path, size, modification time and content hash."""
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    fingerprint: FileFingerprint
+    frame: pd.DataFrame
+
+
+# One cache per process, so every Streamlit session shares the parsed frames.
+# _cache_lock guards the dicts only; hashing and parsing a dataset happen under
+# that dataset's own lock, so one slow file does not hold up the others.
+_cache_lock = threading.RLock()
+_dataset_locks = {}
+_frame_cache = {}
+_manifest_cache = {}
+# id(frame) -> (weak reference, data objects, shallow copy, fingerprint) for
+# frames whose content is known without hashing it: those load_dataset hands
+# out and frames derived from them. The data objects are the index, columns and
+# arrays the frame held when it was tagged; the shallow copy shares those
+# arrays, so under copy-on-write a write to the frame has to replace them.
+_known_lock = threading.Lock()
+_known_fingerprints = {}
+
 
 def clean_percentage(value):
-    """Clean percentage values and convert to float."""
+    """
+    Clean a single percentage value and convert it to float.
+
+    Whole columns should go through ``parse_percentage_column``, which also
+    puts bare numbers and "%"-suffixed values on the same scale.
+    """
     if pd.isna(value):
         return np.nan
     if isinstance(value, str):
@@ -15,21 +93,350 @@ def clean_percentage(value):
             return np.nan
     return value
 
+
+@dataclass(frozen=True)
+class ParsedPercentages:
+    """Result of parsing one column of percentage values."""
+    values: pd.Series
+    unit: str
+    invalid: pd.Series
+
+
+def parse_percentage_column(series):
+    """
+    Parses a column of percentages into fractions (0.62 for "62%") in one vectorized pass.
+
+    The unit is decided per cell: a cell with a "%" sign is in percentage
+    points. Bare numbers are percentage points if any bare number in the
+    column is above 1, and fractions otherwise, so "0.62" and "62%" in one
+    column both become 0.62.
+
+    Args:
+        series (pd.Series): Raw column, either numeric or text such as "62%" or "1,234".
+
+    Returns:
+        ParsedPercentages: Parsed fractions, the detected unit ("percent",
+        "fraction", or "mixed" when cells with and without a "%" sign need
+        different scaling) and the raw values of non-empty cells that could not
+        be parsed.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        numbers = series.astype("float64")
+        has_sign = pd.Series(False, index=series.index)
+        invalid = series.iloc[0:0]
+    else:
+        text = series.astype("string").str.strip()
+        has_sign = text.str.endswith("%").fillna(False).astype(bool)
+        cleaned = text.str.rstrip("%").str.replace(",", "", regex=False).str.strip()
+        valid = cleaned.str.fullmatch(_NUMBER_PATTERN).fillna(False).astype(bool)
+        numbers = cleaned.where(valid).astype("float64")
+        invalid = series[~valid & cleaned.fillna("").ne("")]
+
+    bare_percent = bool(numbers[~has_sign].abs().max() > 1)
+    signed_any = bool((numbers.notna() & has_sign).any())
+    bare_any = bool((numbers.notna() & ~has_sign).any())
+    numbers = numbers.where(~(has_sign | bare_percent), numbers / 100.0)
+    if signed_any and bare_any and not bare_percent:
+        unit = "mixed"
+    elif signed_any or bare_percent:
+        unit = "percent"
+    else:
+        unit = "fraction"
+    return ParsedPercentages(numbers.rename(series.name), unit, invalid)
+
+
+def _clean_ner_table(frame):
+    """Clean percentage values in the 'NER for ECCE' table."""
+    for col in frame.columns[2:]:
+        parsed = parse_percentage_column(frame[col])
+        frame[col] = parsed.values
+        if not parsed.invalid.empty:
+            cells = ", ".join(f"row {idx}: {value!r}" for idx, value in parsed.invalid.items())
+            logger.warning("Could not parse percentages in NER for ECCE column '%s' (%s)", col, cells)
+    return frame
+
+
+# Cleaning applied once per file version, before the frame enters the cache.
+_POSTPROCESSORS = {
+    "NER for ECCE": _clean_ner_table,
+}
+
+
+def dataset_path(name):
+    """Returns the path of the CSV file backing a dataset."""
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset '{name}'. Expected one of: {', '.join(DATASETS)}")
+    return os.path.join(DATA_DIR, DATASETS[name])
+
+
+def file_fingerprint(path, previous=None):
+    """
+    Fingerprints a file by path, size, mtime and SHA-256 of its contents.
+
+    Args:
+        path (str): The file to fingerprint.
+        previous (FileFingerprint, optional): An earlier fingerprint of the same file.
+            Its hash is reused when size and mtime are unchanged, so an untouched
+            file is never re-read.
+
+    Returns:
+        FileFingerprint: The current fingerprint of the file.
+    """
+    stat = os.stat(path)
+    if previous is not None and (previous.size, previous.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        return previous
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return FileFingerprint(path, stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+def write_atomic(path, write):
+    """
+    Writes a file so readers see either the old version or the complete new one.
+
+    Args:
+        path (str): The file to replace.
+        write (callable): Called with a temporary path next to path; must write
+            the whole file there. The temporary file is removed if it raises.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_snapshot_manifest():
+    """Returns the snapshot manifest, or None if no snapshot has been compiled."""
+    try:
+        stat = os.stat(SNAPSHOT_MANIFEST)
+    except FileNotFoundError:
+        return None
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _cache_lock:
+        if key not in _manifest_cache:
+            with open(SNAPSHOT_MANIFEST, encoding="utf-8") as handle:
+                _manifest_cache.clear()
+                _manifest_cache[key] = json.load(handle)
+        return _manifest_cache[key]
+
+
+def _load_snapshot(name, fingerprint):
+    """Reads a dataset from the columnar snapshot, or returns None if it is missing or stale."""
+    manifest = read_snapshot_manifest()
+    if not manifest or manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    entry = manifest["datasets"].get(name)
+    if entry is None or entry["sha256"] != fingerprint.sha256:
+        return None
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    try:
+        table = feather.read_table(os.path.join(SNAPSHOT_DIR, entry["snapshot"]), memory_map=True)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable snapshot for %s: %s", name, e)
+        return None
+    return table.to_pandas()
+
+
+def _read_dataset(name, path, fingerprint):
+    frame = _load_snapshot(name, fingerprint)
+    if frame is None:
+        frame = pd.read_csv(path)
+    postprocess = _POSTPROCESSORS.get(name)
+    if postprocess is not None:
+        frame = postprocess(frame)
+    return apply_schema(name, frame)
+
+
+def _copy_on_write_enabled():
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return getattr(pd.options.mode, "copy_on_write", False) is True
+
+
+def _read_only_view(frame):
+    """
+    Hands out a cached frame without exposing it to caller mutations.
+
+    Under copy-on-write a shallow copy is enough: it shares the cached buffers
+    read-only and copies them only if the caller writes. Older pandas gets a deep copy.
+    """
+    return frame.copy(deep=not _copy_on_write_enabled())
+
+
+def _dataset_lock(path):
+    with _cache_lock:
+        return _dataset_locks.setdefault(path, threading.Lock())
+
+
+def load_dataset(name):
+    """
+    Loads a single dataset through the process-wide cache.
+
+    The file is only parsed again when its content hash changes; other
+    datasets keep their cached frames.
+
+    Args:
+        name (str): A key of DATASETS, e.g. "HPI" or "Population".
+
+    Returns:
+        pd.DataFrame: The parsed (and, where applicable, cleaned) frame. It is the
+        caller's to modify; changes do not reach the cache or other callers.
+    """
+    path = dataset_path(name)
+    with _dataset_lock(path):
+        with _cache_lock:
+            entry = _frame_cache.get(path)
+        fingerprint = file_fingerprint(path, entry.fingerprint if entry else None)
+        if entry is None or entry.fingerprint.sha256 != fingerprint.sha256:
+            entry = _CacheEntry(fingerprint, _read_dataset(name, path, fingerprint))
+        elif entry.fingerprint != fingerprint:
+            # Touched but unchanged: keep the frame, remember the new stat.
+            entry = _CacheEntry(fingerprint, entry.frame)
+        with _cache_lock:
+            _frame_cache[path] = entry
+        view = _read_only_view(entry.frame)
+    digest = hashlib.sha256(f"dataset:{name}:{fingerprint.sha256}".encode())
+    return tag_fingerprint(view, digest.hexdigest())
+
+
+def _forget_fingerprint(frame_id):
+    with _known_lock:
+        _known_fingerprints.pop(frame_id, None)
+
+
+def _data_objects(frame):
+    return (frame.index, frame.columns, *(block.values for block in frame._mgr.blocks))
+
+
+def tag_fingerprint(frame, fingerprint):
+    """
+    Records the content fingerprint of frame, so frame_fingerprint need not hash it.
+
+    Only for frames whose content is known from where they came from, such as
+    a dataset read from a fingerprinted file. Callers may still modify the
+    frame: under copy-on-write any change replaces the index, columns or an
+    array the frame holds, and known_fingerprint drops the tag when it sees
+    that. Without copy-on-write nothing is tagged.
+    The tag is forgotten when the frame is garbage collected.
+
+    Returns:
+        pd.DataFrame: frame itself.
+    """
+    if not _copy_on_write_enabled():
+        return frame
+    frame_id = id(frame)
+    reference = weakref.ref(frame, lambda _, frame_id=frame_id: _forget_fingerprint(frame_id))
+    with _known_lock:
+        _known_fingerprints[frame_id] = (reference, _data_objects(frame), frame.copy(deep=False), fingerprint)
+    return frame
+
+
+def known_fingerprint(frame):
+    """Returns the fingerprint tagged on frame, or None if it was not tagged or has changed since."""
+    with _known_lock:
+        entry = _known_fingerprints.get(id(frame))
+    if entry is None or entry[0]() is not frame:
+        return None
+    current, recorded = _data_objects(frame), entry[1]
+    if len(current) != len(recorded) or any(a is not b for a, b in zip(current, recorded)):
+        _forget_fingerprint(id(frame))
+        return None
+    return entry[3]
+
+
+def derive_fingerprint(result, source, step):
+    """
+    Tags result, computed from source by the deterministic step, if source is tagged.
+
+    Args:
+        result (pd.DataFrame): The derived frame.
+        source (pd.DataFrame): The frame it was computed from.
+        step (str): Names the computation, e.g. "preprocess_data".
+
+    Returns:
+        pd.DataFrame: result itself.
+    """
+    parent = known_fingerprint(source)
+    if parent is not None:
+        tag_fingerprint(result, hashlib.sha256(f"{step}:{parent}".encode()).hexdigest())
+    return result
+
+
+def frame_fingerprint(frame):
+    """
+    Content hash of a DataFrame, covering its columns, dtypes, index and values.
+
+    Used to key caches of objects derived from a frame, so an edited or
+    filtered frame never hits an entry built from different data. Frames from
+    load_dataset (and those derived from them through derive_fingerprint) are
+    identified by their source file's hash instead, without reading them, for
+    as long as they are not modified.
+    """
+    known = known_fingerprint(frame)
+    if known is not None:
+        return known
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in frame.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(name):
+    """Returns the current FileFingerprint of a dataset's source file."""
+    path = dataset_path(name)
+    with _dataset_lock(path):
+        with _cache_lock:
+            entry = _frame_cache.get(path)
+        return file_fingerprint(path, entry.fingerprint if entry else None)
+
+
+def clear_cache(name=None):
+    """Drops the cached frame of one dataset, or of all datasets when name is None."""
+    with _cache_lock:
+        if name is None:
+            _frame_cache.clear()
+        else:
+            _frame_cache.pop(dataset_path(name), None)
+
+
+def memory_report(names=None):
+    """
+    Reports how much memory the declared schemas save, per dataset.
+
+    Each source file is read again with a plain ``pd.read_csv`` to measure
+    the untyped frame, whether or not the dataset is served from the snapshot.
+
+    Args:
+        names (list of str, optional): Datasets to report. Defaults to all of DATASETS.
+
+    Returns:
+        pd.DataFrame: dataset, rows, bytes_before (plain read_csv), bytes_after
+        (as load_dataset returns it) and saved_pct, from ``memory_usage(deep=True)``.
+    """
+    names = names or list(DATASETS)
+    rows = []
+    for name in names:
+        frame = load_dataset(name)
+        before = pd.read_csv(dataset_path(name)).memory_usage(deep=True).sum()
+        rows.append((name, len(frame), int(before), int(frame.memory_usage(deep=True).sum())))
+    report = pd.DataFrame(rows, columns=["dataset", "rows", "bytes_before", "bytes_after"])
+    report["saved_pct"] = (1 - report["bytes_after"] / report["bytes_before"]) * 100
+    return report
+
+
 def load_data():
-    """Loads data from individual CSV files."""
+    """Loads the core datasets from their CSV files via the shared cache."""
     try:
-        data_dir = "data"
-        data = {
-            "NER for ECCE": pd.read_csv(os.path.join(data_dir, "ner_ecce.csv")),
-            "Enrollment by School Type": pd.read_csv(os.path.join(data_dir, "enrollment_by_school.csv")),
-            "Detailed Enrollment": pd.read_csv(os.path.join(data_dir, "detailed_enrollment.csv")),
-            "Teachers Distribution": pd.read_csv(os.path.join(data_dir, "teacher_distribution.csv")),
-            "Age Distribution": pd.read_csv(os.path.join(data_dir, "age_distribution.csv"))
-        }
-        # Clean percentage values in 'NER for ECCE' table
-        for col in data["NER for ECCE"].columns[2:]:
-            data["NER for ECCE"][col] = data["NER for ECCE"][col].apply(clean_percentage)
-        return data
+        return {name: load_dataset(name) for name in CORE_DATASETS}
     except Exception as e:
         print(f"Error loading data: {e}")
         raise Exception(f"Error loading data: {str(e)}")
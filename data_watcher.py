@@ -0,0 +1,224 @@
+"""Watches the data directory and invalidates only what a changed file feeds.
+
+Sources are files; artefacts are the cached objects derived from them.
+DEPENDENCIES spells out, for every artefact, what it is computed from, so a
+change to teacher_distribution.csv drops the teacher frame and the teacher
+figures but leaves the HPI rankings, the enrollment cube and the map geometry
+warm. ``python manage.py show-dependencies`` prints the graph.
+"""
+import logging
+import threading
+from collections import deque
+
+from data_loader import DATASETS, clear_cache, dataset_path, file_fingerprint, load_dataset
+from enrollment_store import STORE_MANIFEST
+from geography import GEOJSON_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def _figures(builder):
+    return f"figures:{builder}"
+
+
+# Artefact -> the sources ("dataset:<name>", "boundaries", "enrollment_store")
+# and other artefacts it is derived from.
+DEPENDENCIES = {
+    **{f"frame:{name}": [f"dataset:{name}"] for name in DATASETS},
+    "store_partitions": ["enrollment_store"],
+    "enrollment_cube": ["frame:Detailed Enrollment", "store_partitions"],
+    "hpi_rankings": ["frame:HPI"],
+    "geometry": ["boundaries"],
+    _figures("visualizations.create_percentage_plot"): ["frame:NER for ECCE"],
+    _figures("visualizations.create_enrollment_heatmap"): ["frame:Enrollment by School Type"],
+    _figures("visualizations.create_teacher_distribution"): ["frame:Teachers Distribution"],
+    _figures("visualizations.create_gender_ratio_plot"): ["frame:Detailed Enrollment"],
+    _figures("visualizations.create_age_distribution_analysis"): ["frame:Age Distribution"],
+    _figures("visualizations.create_population_trend_visualization"): ["frame:Population"],
+    _figures("create_attendance_choropleth"): ["geometry"],
+    _figures("create_province_choropleth"): ["geometry", "frame:Detailed Enrollment", "frame:Teachers Distribution"],
+    **{_figures(f"detailed_enrollment_visualizations.{builder}"): ["enrollment_cube"] for builder in [
+        "create_total_enrollment_bar_chart",
+        "create_enrollment_type_pie_chart",
+        "create_gender_distribution_bar_chart",
+        "create_grade_enrollment_line_chart",
+        "create_total_vs_secondary_scatter",
+    ]},
+    _figures("detailed_enrollment_visualizations.create_enrollment_trend_chart"): ["store_partitions"],
+}
+
+
+def source_paths():
+    """Returns source name -> watched file path."""
+    paths = {f"dataset:{name}": dataset_path(name) for name in DATASETS}
+    paths["boundaries"] = GEOJSON_PATH
+    paths["enrollment_store"] = STORE_MANIFEST
+    return paths
+
+
+def _discard_figures(builder):
+    from figure_cache import FIGURE_CACHE
+
+    return lambda: FIGURE_CACHE.discard(lambda key: key[0] == builder)
+
+
+def _clear_cube():
+    from enrollment_transforms import clear_enrollment_cube_cache
+
+    clear_enrollment_cube_cache()
+
+
+def _clear_rankings():
+    from hpi_rankings import clear_hpi_rankings_cache
+
+    clear_hpi_rankings_cache()
+
+
+def _clear_geometry():
+    from geography import clear_geography_cache
+
+    clear_geography_cache()
+
+
+def _clear_store():
+    from enrollment_store import clear_store_cache
+
+    clear_store_cache()
+
+
+def _invalidator(artefact):
+    """Returns the callable that drops one artefact from its cache."""
+    kind, _, name = artefact.partition(":")
+    if kind == "frame":
+        return lambda: clear_cache(name)
+    if kind == "figures":
+        return _discard_figures(name)
+    return {
+        "store_partitions": _clear_store,
+        "enrollment_cube": _clear_cube,
+        "hpi_rankings": _clear_rankings,
+        "geometry": _clear_geometry,
+    }[artefact]
+
+
+def dependents(changed, graph=DEPENDENCIES):
+    """
+    Returns every artefact derived, directly or transitively, from the changed nodes.
+
+    Args:
+        changed (iterable of str): Source or artefact names.
+        graph (dict): Artefact -> the nodes it depends on.
+
+    Returns:
+        list of str: The affected artefacts, in the order they appear in graph.
+    """
+    consumers = {}
+    for artefact, inputs in graph.items():
+        for node in inputs:
+            consumers.setdefault(node, []).append(artefact)
+    affected = set()
+    queue = deque(changed)
+    while queue:
+        for artefact in consumers.get(queue.popleft(), []):
+            if artefact not in affected:
+                affected.add(artefact)
+                queue.append(artefact)
+    return [artefact for artefact in graph if artefact in affected]
+
+
+class DataWatcher:
+    """
+    Polls the data files and invalidates the artefacts of the ones that changed.
+
+    Files are compared by content hash, so touching a file without changing it
+    invalidates nothing. A changed dataset is re-read straight away, so the
+    next page run finds it warm.
+    """
+
+    def __init__(self, graph=DEPENDENCIES, paths=None, reload=True):
+        self.graph = graph
+        self.paths = paths or source_paths()
+        self.reload = reload
+        self._fingerprints = {source: self._fingerprint(path, None) for source, path in self.paths.items()}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _fingerprint(path, previous):
+        try:
+            return file_fingerprint(path, previous)
+        except FileNotFoundError:
+            return None
+
+    def changed_sources(self):
+        """Returns the sources whose content changed (or that appeared or vanished) since the last check."""
+        changed = []
+        for source, path in self.paths.items():
+            previous = self._fingerprints[source]
+            current = self._fingerprint(path, previous)
+            self._fingerprints[source] = current
+            if (previous and previous.sha256) != (current and current.sha256):
+                changed.append(source)
+        return changed
+
+    def check(self):
+        """
+        Looks for changed files once and invalidates what depends on them.
+
+        Returns:
+            dict: The changed sources and the artefacts that were invalidated.
+        """
+        with self._lock:
+            changed = self.changed_sources()
+            if not changed:
+                return {"changed": [], "invalidated": []}
+            invalidated = dependents(changed, self.graph)
+            for artefact in invalidated:
+                _invalidator(artefact)()
+            logger.info("Data changed: %s; invalidated %d cached artefacts", ", ".join(changed), len(invalidated))
+            if self.reload:
+                for source in changed:
+                    kind, _, name = source.partition(":")
+                    if kind != "dataset":
+                        continue
+                    try:
+                        load_dataset(name)
+                    except Exception:
+                        logger.exception("Error reloading %s", name)
+            return {"changed": changed, "invalidated": invalidated}
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Data watcher check failed")
+
+    def start(self, interval=2.0):
+        """Starts polling every interval seconds on a daemon thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), name="data-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def start_watcher(interval=2.0):
+    """Starts the process-wide watcher once; later calls return the running one."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = DataWatcher().start(interval)
+        return _watcher
@@ -0,0 +1,254 @@
+"""Year-partitioned store of detailed enrollment, built from yearly MoE extracts.
+
+Each yearly extract, in the stacked layout of detailed_enrollment.csv, is
+tidied into one row per (Year, Province, Gender) and written to its own Arrow
+partition:
+
+    data/enrollment/year=2021/part.arrow                    (partitioned by year)
+    data/enrollment/year=2021/province=Sanma/part.arrow     (by year and province)
+
+Appending a year rewrites only that year's partitions, and a manifest records
+each partition's hash, so readers re-read only partitions that changed.
+"""
+import copy
+import json
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import pandas as pd
+
+from data_loader import DATA_DIR, file_fingerprint, write_atomic
+from enrollment_transforms import preprocess_data
+
+STORE_DIR = os.path.join(DATA_DIR, "enrollment")
+STORE_MANIFEST = os.path.join(STORE_DIR, "manifest.json")
+STORE_FORMAT_VERSION = 1
+PARTITION_SCHEMES = {"year": ["Year"], "year-province": ["Year", "Province"]}
+
+# A row is identified by these; appending a row with the same key replaces the old one.
+KEY_COLUMNS = ["Year", "Province", "Gender"]
+GENDER_ORDER = {"Overall": 0, "F": 1, "M": 2}
+
+_store_lock = threading.Lock()
+_partition_cache = {}
+# (size, mtime) of the manifest file -> the manifest read from it
+_manifest_cache = {}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise RuntimeError("The enrollment store requires pyarrow (pip install pyarrow)") from e
+    return pa, feather
+
+
+def tidy_extract(stacked, year):
+    """
+    Turns one stacked MoE extract into one row per province and gender.
+
+    Args:
+        stacked (pd.DataFrame): An extract in the layout of detailed_enrollment.csv.
+        year (int): The school year the extract covers.
+
+    Returns:
+        pd.DataFrame: Year, Province, Gender ("Overall", "F" or "M") and the count
+        columns of the extract. The "Grand Total" row is dropped.
+    """
+    rows = preprocess_data(stacked)
+    rows = rows[rows["Province_Name"] != "Grand Total"]
+    counts = [col for col in stacked.columns if col != "Province"]
+    tidy = rows[["Province_Name", "Gender"] + counts].rename(columns={"Province_Name": "Province"})
+    tidy.insert(0, "Year", int(year))
+    # The last row wins when an extract lists a province twice
+    return tidy.drop_duplicates(KEY_COLUMNS, keep="last", ignore_index=True)
+
+
+def read_store_manifest():
+    """
+    Returns the store manifest, or None if nothing has been appended yet.
+
+    The file is parsed again only when its size or modification time changes;
+    callers share the returned dict and must not modify it.
+    """
+    try:
+        stat = os.stat(STORE_MANIFEST)
+    except FileNotFoundError:
+        return None
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _store_lock:
+        manifest = _manifest_cache.get(key)
+    if manifest is None:
+        try:
+            with open(STORE_MANIFEST, encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except FileNotFoundError:
+            return None
+        with _store_lock:
+            _manifest_cache.clear()
+            _manifest_cache[key] = manifest
+    if manifest.get("version") != STORE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported enrollment store version {manifest.get('version')!r}")
+    return manifest
+
+
+def _partition_path(scheme, year, province=None):
+    parts = [f"year={year}"]
+    if scheme == "year-province":
+        parts.append(f"province={quote(province, safe='')}")
+    return "/".join(parts + ["part.arrow"])
+
+
+def _read_partition(entry):
+    """Reads one partition, reusing the cached frame while its hash is unchanged."""
+    with _store_lock:
+        cached = _partition_cache.get(entry["path"])
+        if cached is not None and cached[0] == entry["sha256"]:
+            return cached[1]
+    _, feather = _pyarrow()
+    frame = feather.read_table(os.path.join(STORE_DIR, entry["path"]), memory_map=True).to_pandas()
+    with _store_lock:
+        _partition_cache[entry["path"]] = (entry["sha256"], frame)
+    return frame
+
+
+def append_extract(source, year, partition_by=None):
+    """
+    Adds one yearly extract to the store, writing only the partitions it touches.
+
+    Rows are de-duplicated by year, province and gender: a province already
+    stored for that year is replaced by the new extract's figures.
+
+    Args:
+        source (str or pd.DataFrame): Path to the extract CSV, or the extract itself.
+        year (int): The school year the extract covers.
+        partition_by (str, optional): "year" or "year-province". Fixed when the
+            store is created (default "year"); later appends must match it.
+
+    Returns:
+        dict: The partitions written, the number of rows appended and how many
+        of them replaced rows that were already stored.
+    """
+    pa, feather = _pyarrow()
+    stacked = pd.read_csv(source) if isinstance(source, str) else source
+    extract = tidy_extract(stacked, year)
+
+    manifest = copy.deepcopy(read_store_manifest()) or {
+        "version": STORE_FORMAT_VERSION,
+        "partition_by": partition_by or "year",
+        "partitions": {},
+    }
+    scheme = manifest["partition_by"]
+    if partition_by is not None and partition_by != scheme:
+        raise ValueError(f"Store is partitioned by '{scheme}', not '{partition_by}'")
+    if scheme not in PARTITION_SCHEMES:
+        raise ValueError(f"Unknown partition scheme '{scheme}'. Expected one of: {', '.join(PARTITION_SCHEMES)}")
+
+    written, replaced = [], 0
+    for key, rows in extract.groupby(PARTITION_SCHEMES[scheme], sort=True):
+        path = _partition_path(scheme, *key)
+        entry = manifest["partitions"].get(path)
+        if entry is not None:
+            existing = _read_partition(entry)
+            replaced += len(existing.merge(rows[KEY_COLUMNS], on=KEY_COLUMNS))
+            rows = pd.concat([existing, rows], ignore_index=True).drop_duplicates(KEY_COLUMNS, keep="last")
+        rows = (rows.assign(_order=rows["Gender"].map(GENDER_ORDER))
+                .sort_values(["Province", "_order"], kind="stable", ignore_index=True)
+                .drop(columns="_order"))
+
+        target = os.path.join(STORE_DIR, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        write_atomic(target, lambda tmp: feather.write_feather(table, tmp, compression="uncompressed"))
+        manifest["partitions"][path] = {
+            "path": path,
+            "year": int(key[0]),
+            "province": key[1] if scheme == "year-province" else None,
+            "rows": len(rows),
+            "sha256": file_fingerprint(target).sha256,
+        }
+        written.append(path)
+
+    manifest["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+    def write_manifest(tmp):
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+
+    write_atomic(STORE_MANIFEST, write_manifest)
+    return {"partitions": written, "rows": len(extract), "replaced": replaced}
+
+
+def _select_partitions(start_year=None, end_year=None, provinces=None):
+    manifest = read_store_manifest()
+    if manifest is None:
+        return []
+    selected = []
+    for entry in manifest["partitions"].values():
+        if start_year is not None and entry["year"] < start_year:
+            continue
+        if end_year is not None and entry["year"] > end_year:
+            continue
+        if provinces is not None and entry["province"] is not None and entry["province"] not in provinces:
+            continue
+        selected.append(entry)
+    return sorted(selected, key=lambda entry: entry["path"])
+
+
+def store_years():
+    """Returns the years held in the store, oldest first."""
+    return sorted({entry["year"] for entry in _select_partitions()})
+
+
+def store_version(start_year=None, end_year=None, provinces=None):
+    """Identifies the partitions a query would read; changes whenever one of them does."""
+    return tuple((entry["path"], entry["sha256"]) for entry in _select_partitions(start_year, end_year, provinces))
+
+
+def read_enrollment(start_year=None, end_year=None, provinces=None):
+    """
+    Reads the stored enrollment for a range of years.
+
+    Only partitions inside the range (and, for a store partitioned by
+    province, for the requested provinces) are read.
+
+    Args:
+        start_year (int, optional): First year to include.
+        end_year (int, optional): Last year to include.
+        provinces (list of str, optional): Only include these provinces.
+
+    Returns:
+        pd.DataFrame: One row per Year, Province and Gender with the count columns,
+        ordered by year. Empty if the store holds nothing in the range.
+    """
+    partitions = [_read_partition(entry) for entry in _select_partitions(start_year, end_year, provinces)]
+    if not partitions:
+        return pd.DataFrame(columns=KEY_COLUMNS)
+    frame = pd.concat(partitions, ignore_index=True)
+    if provinces is not None:
+        frame = frame[frame["Province"].isin(provinces)]
+    return frame.sort_values("Year", kind="stable", ignore_index=True)
+
+
+def to_detailed_layout(frame):
+    """
+    Puts one year of stored rows into the shape ``preprocess_data`` produces.
+
+    The result can be passed to the province chart builders exactly like the
+    preprocessed detailed_enrollment.csv.
+    """
+    detailed = frame.drop(columns="Year").rename(columns={"Province": "Province_Name"})
+    counts = [col for col in detailed.columns if col not in ("Province_Name", "Gender")]
+    detailed.insert(0, "Province", detailed["Province_Name"].where(detailed["Gender"] == "Overall",
+                                                                   detailed["Gender"]))
+    return detailed[["Province"] + counts + ["Province_Name", "Gender"]].reset_index(drop=True)
+
+
+def clear_store_cache():
+    """Drops all cached partition frames and the cached manifest."""
+    with _store_lock:
+        _partition_cache.clear()
+        _manifest_cache.clear()
@@ -0,0 +1,170 @@
+"""Detailed enrollment tables: unstacking the MoE layout and the aggregates the charts use.
+
+Pure pandas; importing this module does not load Streamlit or Plotly, so
+loaders, the enrollment store and command-line tools can use it directly.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from data_loader import derive_fingerprint, frame_fingerprint
+
+
+GRADE_COLS = ['Grade_1', 'Grade_2', 'Grade_3', 'Grade_4', 'Grade_5', 'Grade_6',
+              'Grade_7', 'Grade_8', 'Grade_9', 'Grade_10', 'Grade_11', 'Grade_12',
+              'Grade_13', 'Grade_14']
+
+# Education level -> the grade columns it is made of, in display order.
+LEVEL_GRADES = {
+    'PreSchool': ['PreSchool'],
+    'Primary': GRADE_COLS[:6],
+    'Secondary': GRADE_COLS[6:],
+}
+LEVEL_TOTAL_COLS = [f'{level}_Total' for level in LEVEL_GRADES]
+
+_CUBE_CACHE_SIZE = 8
+_cube_lock = threading.Lock()
+_cube_cache = OrderedDict()
+
+
+def preprocess_data(data):
+    """
+    We need to preprocess the CSV so that it is unstacked
+    The raw data from the MoE is stacked, so we should preserve it.
+    Preprocess the CSV so that:
+      - Rows with an overall province total (i.e. not "F", "M", or "Grand Total") are marked as 'Overall'
+      - Gender rows (where Province is "F" or "M") inherit the province name from the previous overall row.
+      - The "Grand Total" row keeps "Grand Total" as its province name.
+    Returns a new DataFrame; the input frame is not modified.
+    """
+    # Plain strings, so the labels below need not be categories of a typed column
+    province = data['Province'].astype(str)
+    is_gender = province.isin(['F', 'M'])
+    is_grand_total = province == 'Grand Total'
+    province_name = province.where(~(is_gender | is_grand_total)).ffill()
+    return derive_fingerprint(data.assign(
+        Province_Name=province_name.where(~is_grand_total, 'Grand Total'),
+        Gender=province.where(is_gender, 'Overall'),
+    ), data, 'preprocess_data')
+
+
+def _build_cube(data):
+    if 'Gender' not in data.columns:
+        data = preprocess_data(data)
+    data = data[data['Province_Name'] != 'Grand Total']
+
+    grade_of_level = {grade: level for level, grades in LEVEL_GRADES.items() for grade in grades}
+    grades = list(grade_of_level)
+    cube = data.melt(id_vars=['Province_Name', 'Gender'], value_vars=grades,
+                     var_name='Grade', value_name='Enrollment')
+    cube = cube.rename(columns={'Province_Name': 'Province'})
+    cube['Level'] = cube['Grade'].map(grade_of_level)
+
+    provinces = sorted(data['Province_Name'].dropna().unique())
+    cube['Province'] = pd.Categorical(cube['Province'], categories=provinces)
+    cube['Gender'] = pd.Categorical(cube['Gender'], categories=['Overall', 'F', 'M'])
+    cube['Level'] = pd.Categorical(cube['Level'], categories=list(LEVEL_GRADES), ordered=True)
+    cube['Grade'] = pd.Categorical(cube['Grade'], categories=grades, ordered=True)
+    return (cube.groupby(['Province', 'Gender', 'Level', 'Grade'], observed=True)[['Enrollment']]
+            .sum()
+            .sort_index())
+
+
+def _cube_entry(data):
+    key = frame_fingerprint(data)
+    with _cube_lock:
+        entry = _cube_cache.get(key)
+        if entry is not None:
+            _cube_cache.move_to_end(key)
+            return entry
+    entry = {'cube': _build_cube(data)}
+    with _cube_lock:
+        _cube_cache[key] = entry
+        while len(_cube_cache) > _CUBE_CACHE_SIZE:
+            _cube_cache.popitem(last=False)
+    return entry
+
+
+def _cube_view(data, name, build):
+    """Returns a copy of a table derived from the cube, building it at most once per data version."""
+    entry = _cube_entry(data)
+    if name not in entry:
+        entry[name] = build(entry['cube'])
+    return entry[name].copy()
+
+
+def build_enrollment_cube(data):
+    """
+    Builds the long-format enrollment cube for detailed enrollment data.
+
+    The cube has one row per (Province, Gender, Level, Grade) with an
+    'Enrollment' count, all four index levels categorical. Gender is
+    'Overall', 'F' or 'M'; the "Grand Total" row is left out. Cubes are
+    memoized by the content of ``data``, which is never modified.
+
+    Args:
+        data (pd.DataFrame): Detailed enrollment data, raw or already preprocessed.
+
+    Returns:
+        pd.DataFrame: The cube, indexed by Province, Gender, Level and Grade.
+    """
+    return _cube_view(data, 'cube', lambda cube: cube)
+
+
+def _level_totals(cube, gender):
+    totals = (cube.xs(gender, level='Gender')['Enrollment']
+              .groupby(level=['Province', 'Level'], observed=True).sum()
+              .unstack('Level'))
+    totals.columns = [f'{level}_Total' for level in totals.columns]
+    totals['Total'] = totals[LEVEL_TOTAL_COLS].sum(axis=1)
+    return totals
+
+
+def clear_enrollment_cube_cache():
+    """Drops all memoized enrollment cubes and the tables derived from them."""
+    with _cube_lock:
+        _cube_cache.clear()
+
+
+def create_enrollment_summary(data):
+    """Creates a summary table of overall enrollment data."""
+    def build(cube):
+        summary = _level_totals(cube, 'Overall').reset_index()
+        summary['Province'] = summary['Province'].astype(str)
+        return summary
+    return _cube_view(data, 'summary', build)
+
+def create_gender_enrollment_summary(data):
+    """Creates a summary table of enrollment data by gender."""
+    def build(cube):
+        by_gender = pd.concat({gender: _level_totals(cube, gender) for gender in ['F', 'M']},
+                              names=['Gender'])
+        gender_summary = by_gender.reset_index()[['Province', 'Gender'] + LEVEL_TOTAL_COLS + ['Total']]
+        gender_summary['Province'] = gender_summary['Province'].astype(str)
+        return gender_summary.sort_values(['Province', 'Gender'], kind='stable', ignore_index=True)
+    return _cube_view(data, 'gender_summary', build)
+
+def create_enrollment_by_grade(data):
+    """Creates a DataFrame of enrollment by grade using overall rows."""
+    def build(cube):
+        overall = cube.xs('Overall', level='Gender')['Enrollment']
+        by_grade = overall.droplevel('Level').unstack('Grade')[GRADE_COLS].reset_index()
+        by_grade.columns.name = None
+        by_grade['Province'] = by_grade['Province'].astype(str)
+        return by_grade
+    return _cube_view(data, 'by_grade', build)
+
+
+def enrollment_totals_by_year(history):
+    """
+    Sums the overall rows of stored enrollment per year and education level.
+
+    Args:
+        history (pd.DataFrame): Rows from enrollment_store.read_enrollment.
+
+    Returns:
+        pd.DataFrame: Year plus one *_Total column per education level.
+    """
+    overall = history[history['Gender'] == 'Overall']
+    return overall.groupby('Year')[LEVEL_TOTAL_COLS].sum().reset_index()
@@ -0,0 +1,168 @@
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from data_loader import frame_fingerprint
+from profiler import record_build
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """
+    Process-wide LRU cache of serialized Plotly figures.
+
+    Entries are figure JSON strings, so a cache hit hands every caller its own
+    freshly decoded figure. Memory is bounded by the total JSON size; the least
+    recently used figures are evicted first.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Returns the cached figure JSON for key, or None on a miss."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key, payload):
+        """Stores figure JSON under key, evicting least recently used entries to fit."""
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = payload
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def discard(self, predicate):
+        """Removes every entry whose key satisfies predicate; returns how many were removed."""
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                self._bytes -= len(self._entries.pop(key))
+            return len(doomed)
+
+    def clear(self):
+        """Drops all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns hit/miss counters and current memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+FIGURE_CACHE = FigureCache(int(os.environ.get("FIGURE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)))
+
+
+def _fingerprint_arg(value):
+    """Turns a builder argument into a hashable cache-key component."""
+    if isinstance(value, pd.DataFrame):
+        return ("frame", frame_fingerprint(value))
+    if isinstance(value, pd.Series):
+        return ("series", frame_fingerprint(value.to_frame()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprint_arg(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _fingerprint_arg(item)) for key, item in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def figure_cache_key(builder_name, arguments):
+    """Builds the cache key for a builder call: its name, data fingerprints and parameters."""
+    return (builder_name,) + tuple((name, _fingerprint_arg(value)) for name, value in arguments.items())
+
+
+def cached_build(key, build):
+    """
+    Returns the figure cached under key, calling build() to create it on a miss.
+
+    For figures whose inputs are not plain builder arguments; key must capture
+    everything the figure depends on, including data fingerprints. The cache
+    holds the minimized figure's JSON; each caller gets a fresh figure decoded
+    from it, which it is free to modify.
+    """
+    from figure_payload import figure_from_payload, minimized_payload
+
+    start = time.perf_counter()
+    payload = FIGURE_CACHE.get(key)
+    if payload is not None:
+        fig = figure_from_payload(payload)
+        record_build(key[0], time.perf_counter() - start, True, len(payload))
+        return fig
+    fig = build()
+    if fig is None:
+        record_build(key[0], time.perf_counter() - start, False)
+        return None
+    payload = minimized_payload(fig)
+    FIGURE_CACHE.put(key, payload)
+    record_build(key[0], time.perf_counter() - start, False, len(payload))
+    return figure_from_payload(payload)
+
+
+def cached_figure(builder):
+    """
+    Decorator that serves a figure builder's output from FIGURE_CACHE.
+
+    Identical calls (same builder, same input data, same parameters) build the
+    figure once per process. Builders returning None are not cached. The
+    undecorated builder stays available as ``builder.uncached``.
+    """
+    name = f"{builder.__module__}.{builder.__qualname__}"
+    signature = inspect.signature(builder)
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        # Bind to the signature so positional, keyword and default arguments share one key
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = figure_cache_key(name, bound.arguments)
+        return cached_build(key, lambda: builder(*args, **kwargs))
+
+    wrapper.uncached = builder
+    return wrapper
+
+
+def figure_cache_stats():
+    """Returns the statistics of the process-wide figure cache."""
+    return FIGURE_CACHE.stats()
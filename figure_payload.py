@@ -0,0 +1,238 @@
+"""Shrinks Plotly figures before they are sent to the browser.
+
+Every chart in app.py goes through ``plotly_chart``, which minimizes the
+figure first:
+
+- numeric data arrays are sent as typed binary arrays: whole numbers as the
+  narrowest integer type, other values rounded to SIGNIFICANT_DIGITS
+  significant digits each and stored as float32;
+- GeoJSON coordinates are rounded to COORDINATE_DECIMALS;
+- the embedded template keeps only the trace defaults for trace types the
+  figure uses;
+- empty attributes, and text settings of traces without text, are dropped.
+
+The result looks the same as the input. A figure still larger than
+FIGURE_BYTE_BUDGET after minimizing is sent anyway, with a logged warning.
+
+Figures from the figure cache are minimized once, when they are built, and
+carry their serialized size, so a rerun that hits the cache does not encode
+them again before handing them to Streamlit.
+"""
+import base64
+import functools
+import json
+import logging
+import os
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from profiler import record_chart
+
+logger = logging.getLogger(__name__)
+
+# Serialized bytes a single figure may use before a warning is printed.
+FIGURE_BYTE_BUDGET = int(os.environ.get("FIGURE_BYTE_BUDGET", 256 * 1024))
+# Significant digits kept in each fractional value; float32 holds them exactly.
+SIGNIFICANT_DIGITS = 6
+# 5 decimal places of a degree is about a metre.
+COORDINATE_DECIMALS = 5
+
+# Trace attributes that hold one value per point.
+_DATA_ARRAYS = {"x", "y", "z", "values", "customdata", "lat", "lon", "r", "theta", "base", "width",
+                "open", "high", "low", "close", "a", "b", "c"}
+_MARKER_ARRAYS = {"color", "size", "opacity"}
+_TEXT_ATTRIBUTES = ("textposition", "textfont", "textangle", "insidetextanchor", "insidetextfont",
+                    "outsidetextfont")
+
+
+def _decode_typed_array(spec):
+    """Turns a plotly.js typed array spec ({"dtype": "f8", "bdata": ...}) back into a numpy array."""
+    array = np.frombuffer(base64.b64decode(spec["bdata"]), dtype=np.dtype(spec["dtype"]).newbyteorder("<"))
+    if "shape" in spec:
+        array = array.reshape([int(size) for size in str(spec["shape"]).split(",")])
+    return array
+
+
+def _round_significant(array):
+    """Rounds every element of a float array to SIGNIFICANT_DIGITS significant digits."""
+    magnitude = np.zeros(array.shape)
+    nonzero = np.isfinite(array) & (array != 0)
+    magnitude[nonzero] = np.floor(np.log10(np.abs(array[nonzero])))
+    scale = 10.0 ** (SIGNIFICANT_DIGITS - 1 - magnitude)
+    with np.errstate(invalid="ignore", over="ignore"):
+        rounded = np.round(array * scale) / scale
+    # Values too large or small to scale keep their own precision
+    return np.where(np.isfinite(rounded), rounded, array)
+
+
+def _compact_array(values):
+    """
+    Returns numeric values as a compact typed array, or unchanged if they are not numeric.
+
+    Integers and whole-number floats are kept exactly. Other floats are rounded
+    to SIGNIFICANT_DIGITS significant digits each (so small values next to large
+    ones keep their precision) and sent as float32 when they fit its range.
+    """
+    if isinstance(values, dict):
+        if "bdata" not in values:
+            return values
+        values = _decode_typed_array(values)
+    array = np.asarray(values)
+    if array.dtype == object or array.dtype.kind not in "iuf" or array.size == 0:
+        return values
+    if array.dtype.kind in "iu":
+        # plotly encodes int64 as the narrowest integer type that fits
+        return array.astype(np.int64, copy=False)
+    finite = np.isfinite(array)
+    if np.array_equal(array[finite], np.round(array[finite])):
+        if finite.all() and np.abs(array).max(initial=0) < 2**31:
+            return array.astype(np.int64)
+        if np.abs(array[finite]).max(initial=0) < 2**24:
+            return array.astype(np.float32)
+        return array
+    rounded = _round_significant(array.astype(np.float64))
+    magnitudes = np.abs(rounded[finite & (rounded != 0)])
+    if magnitudes.size == 0 or (magnitudes.max() < 1e38 and magnitudes.min() > 1e-37):
+        return rounded.astype(np.float32)
+    return rounded
+
+
+def _round_coordinates(coordinates):
+    if isinstance(coordinates, (list, tuple)):
+        if coordinates and isinstance(coordinates[0], (int, float)):
+            return [round(value, COORDINATE_DECIMALS) for value in coordinates]
+        return [_round_coordinates(part) for part in coordinates]
+    return coordinates
+
+
+def _round_geojson(geojson):
+    if not isinstance(geojson, dict):
+        return geojson
+    if "coordinates" in geojson:
+        return dict(geojson, coordinates=_round_coordinates(geojson["coordinates"]))
+    rounded = dict(geojson)
+    if "features" in geojson:
+        rounded["features"] = [_round_geojson(feature) for feature in geojson["features"]]
+    for key in ("geometry", "geometries"):
+        if key in geojson:
+            value = geojson[key]
+            rounded[key] = [_round_geojson(part) for part in value] if isinstance(value, list) else _round_geojson(value)
+    return rounded
+
+
+def _drop_empty(value):
+    """Removes empty strings and containers that became empty, recursively."""
+    if isinstance(value, dict):
+        kept = {}
+        for key, item in value.items():
+            item = _drop_empty(item)
+            if not (isinstance(item, (str, dict)) and len(item) == 0):
+                kept[key] = item
+        return kept
+    if isinstance(value, list):
+        return [_drop_empty(item) for item in value]
+    return value
+
+
+def _minimize_trace(trace):
+    trace = _drop_empty(trace)
+    for key in _DATA_ARRAYS & trace.keys():
+        trace[key] = _compact_array(trace[key])
+    marker = trace.get("marker")
+    if isinstance(marker, dict):
+        for key in _MARKER_ARRAYS & marker.keys():
+            marker[key] = _compact_array(marker[key])
+    if "geojson" in trace:
+        trace["geojson"] = _round_geojson(trace["geojson"])
+    if "text" not in trace and "texttemplate" not in trace:
+        for key in _TEXT_ATTRIBUTES:
+            trace.pop(key, None)
+    return trace
+
+
+@functools.lru_cache(maxsize=64)
+def _pruned_template(template_json, trace_types):
+    """Keeps the template's layout and the trace defaults of trace_types; shared across figures."""
+    template = json.loads(template_json)
+    data = template.get("data", {})
+    template["data"] = {kind: data[kind] for kind in trace_types if kind in data}
+    return template
+
+
+def minimize_spec(fig):
+    """
+    Returns the minimized figure as a plain dict.
+
+    Streamlit validates whatever it is given into a new Figure, so handing it
+    this dict avoids building the figure twice.
+
+    Args:
+        fig (plotly.graph_objects.Figure): The figure to send.
+
+    Returns:
+        dict: data, layout and frames of the minimized figure.
+    """
+    spec = fig.to_plotly_json()
+    data = [_minimize_trace(trace) for trace in spec.get("data", [])]
+    layout = dict(spec.get("layout", {}))
+    template = layout.pop("template", None)
+    layout = _drop_empty(layout)
+    if template:
+        trace_types = tuple(sorted({trace.get("type", "scatter") for trace in data}))
+        layout["template"] = _pruned_template(json.dumps(template, sort_keys=True), trace_types)
+    return {"data": data, "layout": layout, "frames": spec.get("frames", [])}
+
+
+def minimize_figure(fig):
+    """
+    Returns a copy of fig that serializes smaller but renders the same.
+
+    Args:
+        fig (plotly.graph_objects.Figure): The figure to send.
+
+    Returns:
+        plotly.graph_objects.Figure: The minimized figure.
+    """
+    return go.Figure(minimize_spec(fig))
+
+
+def minimized_payload(fig):
+    """Returns the JSON of fig's minimized spec, the form the figure cache stores."""
+    return pio.to_json(minimize_spec(fig), validate=False)
+
+
+def figure_from_payload(payload):
+    """Decodes a minimized_payload back into a figure the caller is free to modify."""
+    return pio.from_json(payload)
+
+
+def _check_budget(title, payload_bytes):
+    if payload_bytes > FIGURE_BYTE_BUDGET:
+        logger.warning("Figure '%s' is %s KiB, over the budget of %s KiB", title,
+                       f"{payload_bytes / 1024:,.0f}", f"{FIGURE_BYTE_BUDGET / 1024:,.0f}")
+
+
+def plotly_chart(fig, **kwargs):
+    """
+    ``st.plotly_chart`` for a minimized copy of fig.
+
+    The figure is measured as it is sent, so changes made after it was built or
+    restored from the figure cache count. Logs a warning when the figure is
+    over FIGURE_BYTE_BUDGET, and records its size and send time in the profile
+    when profiling is on.
+    """
+    import streamlit as st
+
+    if fig is None:
+        return st.plotly_chart(fig, **kwargs)
+    start = time.perf_counter()
+    title = fig.layout.title.text or "chart"
+    spec = minimize_spec(fig)
+    payload_bytes = len(pio.to_json(spec, validate=False))
+    _check_budget(title, payload_bytes)
+    result = st.plotly_chart(spec, **kwargs)
+    record_chart(title, time.perf_counter() - start, payload_bytes)
+    return result
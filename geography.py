@@ -0,0 +1,184 @@
+import json
+import math
+import os
+import threading
+
+import pandas as pd
+
+from data_loader import DATA_DIR, file_fingerprint
+
+GEOJSON_PATH = os.path.join(DATA_DIR, "indicator_school-attendance.geojson")
+ATTENDANCE_YEARS = ["2016", "2020"]
+
+# Precomputed levels of detail, finest first: simplification tolerance and
+# coordinate grid, both in degrees. Level 0 keeps every vertex.
+DETAIL_LEVELS = [
+    {"tolerance": 0.0, "grid": 1e-5},
+    {"tolerance": 0.001, "grid": 1e-4},
+    {"tolerance": 0.004, "grid": 1e-3},
+    {"tolerance": 0.016, "grid": 1e-3},
+]
+
+# Width in pixels the map is assumed to fill when fitting a viewport.
+MAP_WIDTH_PX = 800
+
+_geo_lock = threading.Lock()
+_geo_cache = {}
+_fingerprint = None
+
+
+def boundary_fingerprint():
+    """Returns the current FileFingerprint of the Area Council GeoJSON."""
+    global _fingerprint
+    with _geo_lock:
+        _fingerprint = file_fingerprint(GEOJSON_PATH, _fingerprint)
+        return _fingerprint
+
+
+def memoize_for_boundaries(name, build):
+    """
+    Caches build() under name for the current version of the boundary file.
+
+    Anything derived from the GeoJSON should be cached through here: when the
+    file changes, every entry is dropped together.
+    """
+    version = boundary_fingerprint().sha256
+    with _geo_lock:
+        if _geo_cache.get("version") != version:
+            _geo_cache.clear()
+            _geo_cache["version"] = version
+        if name in _geo_cache:
+            return _geo_cache[name]
+    value = build()
+    with _geo_lock:
+        if _geo_cache.get("version") == version:
+            _geo_cache[name] = value
+    return value
+
+
+def clear_geography_cache():
+    """Drops the loaded councils and all simplified geometry."""
+    with _geo_lock:
+        _geo_cache.clear()
+
+
+def _read_area_councils():
+    import geopandas as gpd
+
+    raw = gpd.read_file(GEOJSON_PATH)
+    values = pd.DataFrame.from_records(
+        [(entry[0] if isinstance(entry, list) and entry else {}) for entry in raw["values"]],
+        index=raw.index, columns=ATTENDANCE_YEARS)
+    # Councils without attendance data carry their code and name only in the admin2 fields
+    councils = gpd.GeoDataFrame({
+        "geocode": raw["geocode"].fillna(raw["admin2Pcode"]),
+        "name": raw["name"].fillna(raw["admin2Name_en"]),
+        "province": raw["admin1Name_en"],
+        "province_code": raw["admin1Pcode"],
+    }, geometry=raw.geometry, crs=raw.crs)
+    for year in ATTENDANCE_YEARS:
+        councils[f"attendance_{year}"] = pd.to_numeric(values[year], errors="coerce")
+    return councils
+
+
+def load_area_councils():
+    """
+    Loads the Area Council polygons with their school attendance values.
+
+    Returns:
+        geopandas.GeoDataFrame: One row per council with geocode, name, province,
+        province_code, attendance_<year> columns and full-resolution geometry.
+    """
+    return memoize_for_boundaries("councils", _read_area_councils)
+
+
+def attendance_table():
+    """Returns the council attributes and attendance values without geometry."""
+    return pd.DataFrame(load_area_councils().drop(columns="geometry"))
+
+
+def _compact_store():
+    from geometry_store import GeometryStore
+
+    return GeometryStore.from_file(GEOJSON_PATH, id_field=["geocode", "admin2Pcode"],
+                                   grid=DETAIL_LEVELS[0]["grid"])
+
+
+def area_council_store():
+    """
+    Returns the Area Council boundaries as a compact GeometryStore.
+
+    Coordinates are quantized to the level 0 grid and borders shared by
+    neighbouring councils are stored once. Built once per version of the
+    boundary file by streaming it.
+    """
+    return memoize_for_boundaries("store", _compact_store)
+
+
+def _simplify(level):
+    import shapely
+
+    if DETAIL_LEVELS[level]["tolerance"] == 0:
+        # Full resolution needs no simplification; encode straight from the compact store
+        return area_council_store().to_plotly_geojson()
+    councils = load_area_councils()
+    settings = DETAIL_LEVELS[level]
+    geometry = councils.geometry.values
+    # Councils share borders, so simplify them as one coverage: a shared edge is
+    # simplified once and neighbours stay gap- and overlap-free.
+    if hasattr(shapely, "coverage_simplify"):
+        geometry = shapely.coverage_simplify(geometry, settings["tolerance"])
+    else:
+        geometry = shapely.simplify(geometry, settings["tolerance"], preserve_topology=True)
+    geometry = shapely.set_precision(geometry, settings["grid"])
+    features = [
+        {"type": "Feature", "id": geocode, "properties": {}, "geometry": json.loads(shape)}
+        for geocode, shape in zip(councils["geocode"], shapely.to_geojson(geometry))
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def area_council_geometry(level):
+    """
+    Returns the Area Council boundaries at one level of detail, as GeoJSON.
+
+    Feature ids are the council geocodes. Each level is computed once per
+    version of the boundary file.
+
+    Args:
+        level (int): Index into DETAIL_LEVELS; 0 is full resolution.
+    """
+    return memoize_for_boundaries(("geometry", level), lambda: _simplify(level))
+
+
+def level_for_zoom(zoom):
+    """
+    Returns the lightest level of detail whose simplification is invisible at zoom.
+
+    A level qualifies when its tolerance is no larger than one screen pixel at
+    that web-map zoom. Callers pass the zoom viewport() fits to the current
+    selection; zooming in the browser afterwards keeps the level drawn.
+    """
+    degrees_per_pixel = 360.0 / (256 * 2 ** zoom)
+    level = 0
+    for index, settings in enumerate(DETAIL_LEVELS):
+        if settings["tolerance"] <= degrees_per_pixel:
+            level = index
+    return level
+
+
+def viewport(province=None):
+    """
+    Fits the map to all councils, or to one province's councils.
+
+    Returns:
+        tuple: (center dict with lat/lon, zoom) for a map MAP_WIDTH_PX wide.
+    """
+    councils = load_area_councils()
+    if province is not None:
+        councils = councils[councils["province"] == province]
+    min_x, min_y, max_x, max_y = councils.total_bounds
+    span = max(max_x - min_x, max_y - min_y, 1e-6)
+    zoom = math.log2(360.0 * MAP_WIDTH_PX / (256 * span)) - 0.3
+    center = {"lat": (min_y + max_y) / 2, "lon": (min_x + max_x) / 2}
+    return center, min(max(zoom, 0.0), 14.0)
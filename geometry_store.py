@@ -0,0 +1,324 @@
+"""Compact, topology-sharing storage for polygon boundary files.
+
+Boundaries are kept the way TopoJSON keeps them: coordinates are quantized to
+an integer grid, rings are cut into arcs at junctions, an arc shared by two
+neighbouring polygons is stored once, and each arc is delta-encoded. Instead
+of nested Python lists everything lives in a handful of flat NumPy buffers
+with offset arrays.
+"""
+import json
+import math
+
+import numpy as np
+
+# Quantization grid origin; keeps every grid coordinate non-negative.
+ORIGIN = np.array([-180.0, -90.0])
+DEFAULT_GRID = 1e-6
+
+_READ_SIZE = 1 << 16
+
+
+def iter_geojson_features(path, read_size=_READ_SIZE):
+    """
+    Streams the features of a GeoJSON FeatureCollection one at a time.
+
+    Only the feature currently being decoded is held in memory, so boundary
+    files larger than RAM can be read. Other top-level members are skipped.
+
+    Args:
+        path (str): Path to the GeoJSON file.
+        read_size (int): Least number of characters read from the file per refill.
+
+    Yields:
+        dict: One GeoJSON Feature.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as handle:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def refill(size=read_size):
+            nonlocal buf, pos, eof
+            chunk = handle.read(size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            return not eof
+
+        def next_char():
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not refill():
+                    raise ValueError(f"Unexpected end of GeoJSON in {path}")
+
+        def expect(char):
+            nonlocal pos
+            if next_char() != char:
+                raise ValueError(f"Expected '{char}' in {path}, found '{buf[pos]}'")
+            pos += 1
+
+        def decode():
+            nonlocal pos
+            while True:
+                next_char()
+                # Each retry decodes from the start of the value again, so at least
+                # double what is buffered: a large feature is then re-parsed a
+                # logarithmic number of times, not once per read_size.
+                grow = max(read_size, len(buf) - pos)
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if refill(grow):
+                        continue
+                    raise
+                # A number cut off by the buffer edge decodes "successfully"; read on to be sure
+                if end == len(buf) and refill(grow):
+                    continue
+                pos = end
+                return value
+
+        expect("{")
+        while next_char() != "}":
+            key = decode()
+            expect(":")
+            if key != "features":
+                decode()
+            else:
+                expect("[")
+                while next_char() != "]":
+                    yield decode()
+                    if next_char() == ",":
+                        pos += 1
+                pos += 1
+            if next_char() == ",":
+                pos += 1
+
+
+def _quantize_ring(coords, grid):
+    """Turns one ring into closed int64 point keys (x << 32 | y) on the grid."""
+    points = np.asarray(coords, dtype=np.float64)[:, :2]
+    q = np.rint((points - ORIGIN) / grid).astype(np.int64)
+    keep = np.ones(len(q), dtype=bool)
+    keep[1:] = np.any(q[1:] != q[:-1], axis=1)
+    q = q[keep]
+    keys = (q[:, 0] << 32) | q[:, 1]
+    if keys[0] != keys[-1]:
+        keys = np.append(keys, keys[0])
+    return keys
+
+
+def _junctions(rings):
+    """Point keys where rings meet or diverge: points without exactly two distinct neighbours."""
+    starts = np.concatenate([ring[:-1] for ring in rings])
+    ends = np.concatenate([ring[1:] for ring in rings])
+    edges = np.unique(np.stack([np.minimum(starts, ends), np.maximum(starts, ends)], axis=1), axis=0)
+    points, degree = np.unique(edges.ravel(), return_counts=True)
+    return points[degree != 2]
+
+
+class GeometryStore:
+    """
+    Polygons stored as shared, quantized, delta-encoded arcs in flat buffers.
+
+    Attributes:
+        ids (list): Feature ids, one per feature.
+        properties (list of dict): Feature properties, one per feature.
+        grid (float): Quantization step in coordinate units.
+        arc_offsets (np.ndarray): Start of each arc in arc_deltas (length n_arcs + 1).
+        arc_deltas (np.ndarray): int32 (n, 2); each arc's first point absolute, then deltas.
+        ring_arc_offsets (np.ndarray): Start of each ring in ring_arcs (length n_rings + 1).
+        ring_arcs (np.ndarray): int32 arc references; ~i means arc i reversed.
+        polygon_ring_offsets (np.ndarray): Start of each polygon in the rings (exterior first).
+        feature_polygon_offsets (np.ndarray): Start of each feature in the polygons.
+        multi (np.ndarray): Whether each feature was a MultiPolygon.
+    """
+
+    def __init__(self, ids, properties, grid, arc_offsets, arc_deltas, ring_arc_offsets,
+                 ring_arcs, polygon_ring_offsets, feature_polygon_offsets, multi):
+        self.ids = ids
+        self.properties = properties
+        self.grid = grid
+        self.arc_offsets = arc_offsets
+        self.arc_deltas = arc_deltas
+        self.ring_arc_offsets = ring_arc_offsets
+        self.ring_arcs = ring_arcs
+        self.polygon_ring_offsets = polygon_ring_offsets
+        self.feature_polygon_offsets = feature_polygon_offsets
+        self.multi = multi
+        self._decoded_arcs = None
+
+    @classmethod
+    def from_features(cls, features, id_field=None, grid=DEFAULT_GRID):
+        """
+        Builds a store from an iterable of GeoJSON Polygon/MultiPolygon features.
+
+        Features are consumed one at a time, so a generator such as
+        iter_geojson_features never has to be materialized.
+
+        Args:
+            features (iterable of dict): GeoJSON features.
+            id_field (str or list of str, optional): Property to use as the feature id,
+                or several tried in order until one is present; defaults to the
+                feature's "id" member.
+            grid (float): Quantization step; the default 1e-6 degrees is about 0.1 m.
+        """
+        id_fields = [id_field] if isinstance(id_field, str) else id_field
+        ids, properties, multi = [], [], []
+        rings, polygon_ring_offsets, feature_polygon_offsets = [], [0], [0]
+        for feature in features:
+            props = feature.get("properties") or {}
+            geometry = feature["geometry"]
+            if geometry["type"] == "Polygon":
+                polygons = [geometry["coordinates"]]
+            elif geometry["type"] == "MultiPolygon":
+                polygons = geometry["coordinates"]
+            else:
+                raise ValueError(f"Unsupported geometry type '{geometry['type']}'")
+            for polygon in polygons:
+                rings.extend(_quantize_ring(ring, grid) for ring in polygon)
+                polygon_ring_offsets.append(len(rings))
+            feature_polygon_offsets.append(len(polygon_ring_offsets) - 1)
+            if id_fields:
+                ids.append(next((props[f] for f in id_fields if props.get(f) is not None), None))
+            else:
+                ids.append(feature.get("id"))
+            properties.append(props)
+            multi.append(geometry["type"] == "MultiPolygon")
+
+        junctions = _junctions(rings) if rings else np.empty(0, dtype=np.int64)
+        arc_index, arcs, ring_arcs, ring_arc_offsets = {}, [], [], [0]
+        for ring in rings:
+            body = ring[:-1]
+            cuts = np.flatnonzero(np.isin(body, junctions))
+            if len(cuts) == 0:
+                # A ring touching nothing is one closed arc; start it at its smallest
+                # point so an identical ring elsewhere produces the same arc
+                body = np.roll(body, -int(np.argmin(body)))
+                cuts = np.array([0])
+            else:
+                body = np.roll(body, -int(cuts[0]))
+                cuts = cuts - cuts[0]
+            closed = np.append(body, body[0])
+            bounds = np.append(cuts, len(body))
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                arc = closed[start:stop + 1]
+                forward = arc.tobytes()
+                if forward in arc_index:
+                    ring_arcs.append(arc_index[forward])
+                    continue
+                backward = arc[::-1].tobytes()
+                if backward in arc_index:
+                    ring_arcs.append(~arc_index[backward])
+                    continue
+                arc_index[forward] = len(arcs)
+                ring_arcs.append(len(arcs))
+                arcs.append(arc)
+            ring_arc_offsets.append(len(ring_arcs))
+
+        lengths = np.array([len(arc) for arc in arcs], dtype=np.int64)
+        keys = np.concatenate(arcs) if arcs else np.empty(0, dtype=np.int64)
+        points = np.stack([keys >> 32, keys & 0xFFFFFFFF], axis=1)
+        deltas = points.copy()
+        deltas[1:] -= points[:-1]
+        arc_offsets = np.concatenate([[0], np.cumsum(lengths)])
+        deltas[arc_offsets[:-1][lengths > 0]] = points[arc_offsets[:-1][lengths > 0]]
+
+        return cls(
+            ids=ids,
+            properties=properties,
+            grid=grid,
+            arc_offsets=arc_offsets,
+            arc_deltas=deltas.astype(np.int32),
+            ring_arc_offsets=np.asarray(ring_arc_offsets, dtype=np.int64),
+            ring_arcs=np.asarray(ring_arcs, dtype=np.int32),
+            polygon_ring_offsets=np.asarray(polygon_ring_offsets, dtype=np.int64),
+            feature_polygon_offsets=np.asarray(feature_polygon_offsets, dtype=np.int64),
+            multi=np.asarray(multi, dtype=bool),
+        )
+
+    @classmethod
+    def from_file(cls, path, id_field=None, grid=DEFAULT_GRID):
+        """Builds a store by streaming the features of a GeoJSON file."""
+        return cls.from_features(iter_geojson_features(path), id_field=id_field, grid=grid)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the geometry buffers (ids and properties excluded)."""
+        return sum(buffer.nbytes for buffer in (
+            self.arc_offsets, self.arc_deltas, self.ring_arc_offsets, self.ring_arcs,
+            self.polygon_ring_offsets, self.feature_polygon_offsets, self.multi))
+
+    def summary(self):
+        """Returns counts of features, rings, arcs and stored points, plus buffer size."""
+        return {
+            "features": len(self.ids),
+            "rings": len(self.ring_arc_offsets) - 1,
+            "arcs": len(self.arc_offsets) - 1,
+            "arc_references": len(self.ring_arcs),
+            "points": len(self.arc_deltas),
+            "nbytes": self.nbytes,
+        }
+
+    def _arcs(self):
+        """Decodes every arc to absolute coordinates, once."""
+        if self._decoded_arcs is None:
+            totals = np.cumsum(self.arc_deltas.astype(np.int64), axis=0)
+            starts = self.arc_offsets[:-1]
+            lengths = np.diff(self.arc_offsets)
+            # Each arc restarts from an absolute point: subtract what earlier arcs accumulated
+            carried = np.zeros((len(starts), 2), dtype=np.int64)
+            carried[1:] = totals[starts[1:] - 1]
+            absolute = totals - np.repeat(carried, lengths, axis=0)
+            decimals = max(0, math.ceil(-math.log10(self.grid)))
+            coords = np.round(absolute * self.grid + ORIGIN, decimals)
+            self._decoded_arcs = np.split(coords, self.arc_offsets[1:-1])
+        return self._decoded_arcs
+
+    def _ring(self, index, arcs):
+        refs = self.ring_arcs[self.ring_arc_offsets[index]:self.ring_arc_offsets[index + 1]]
+        parts = [arcs[ref] if ref >= 0 else arcs[~ref][::-1] for ref in refs]
+        # Consecutive arcs share their end points
+        return np.concatenate([parts[0]] + [part[1:] for part in parts[1:]]).tolist()
+
+    def feature_geometry(self, index):
+        """Returns the GeoJSON geometry of one feature."""
+        arcs = self._arcs()
+        polygons = []
+        for polygon in range(self.feature_polygon_offsets[index], self.feature_polygon_offsets[index + 1]):
+            first, last = self.polygon_ring_offsets[polygon], self.polygon_ring_offsets[polygon + 1]
+            polygons.append([self._ring(ring, arcs) for ring in range(first, last)])
+        if self.multi[index]:
+            return {"type": "MultiPolygon", "coordinates": polygons}
+        return {"type": "Polygon", "coordinates": polygons[0]}
+
+    def to_geojson(self, ids=None, properties=True):
+        """
+        Encodes the store (or the features with the given ids) as a GeoJSON FeatureCollection.
+
+        Coordinates are written at the precision of the quantization grid.
+
+        Args:
+            ids (iterable, optional): Only include features with these ids.
+            properties (bool): Include feature properties; Plotly only needs ids.
+        """
+        wanted = None if ids is None else set(ids)
+        features = []
+        for index, feature_id in enumerate(self.ids):
+            if wanted is not None and feature_id not in wanted:
+                continue
+            features.append({
+                "type": "Feature",
+                "id": feature_id,
+                "properties": self.properties[index] if properties else {},
+                "geometry": self.feature_geometry(index),
+            })
+        return {"type": "FeatureCollection", "features": features}
+
+    def to_plotly_geojson(self, ids=None):
+        """GeoJSON for Plotly map traces: geometry and ids only, matched via ``locations``."""
+        return self.to_geojson(ids, properties=False)
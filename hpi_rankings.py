@@ -0,0 +1,220 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Metric -> description, whether lower values are better, display precision, and
+# whether countries are ranked on the displayed (rounded) value. Only the HPI
+# score itself is: the report has always ranked it at one decimal.
+HPI_METRICS = {
+    'HPI': {
+        'description': 'Happy Planet Index - measures sustainable wellbeing for all',
+        'inverse': False,
+        'decimals': 1,
+        'rank_rounded': True,
+    },
+    'Life Expectancy in Years': {
+        'description': 'Average number of years a person is expected to live',
+        'inverse': False,
+        'decimals': 2,
+        'rank_rounded': False,
+    },
+    'Ladder Of Life': {
+        'description': 'Subjective wellbeing score (0-10)',
+        'inverse': False,
+        'decimals': 2,
+        'rank_rounded': False,
+    },
+    'Ecological Footprint': {
+        'description': 'Per capita Ecological Footprint (global hectares) - lower is better',
+        'inverse': True,
+        'decimals': 2,
+        'rank_rounded': False,
+    },
+}
+
+_RANKINGS_CACHE_SIZE = 4
+_rankings_lock = threading.Lock()
+_rankings_cache = OrderedDict()
+
+
+@dataclass(frozen=True)
+class RankedValue:
+    """One country's standing on one metric."""
+    country: str
+    value: float
+    display: str
+    rank: int
+    total: int
+    percentile: float
+
+
+class _MetricRanking:
+    """Precomputed ranking of every country on one metric, stored as aligned arrays."""
+
+    def __init__(self, countries, values, inverse, decimals, rank_rounded=False):
+        self.inverse = inverse
+        valid = ~np.isnan(values)
+        rounded = np.round(values, decimals)
+        if rank_rounded:
+            values = rounded
+        ranks = pd.Series(values).rank(ascending=inverse, method='min').to_numpy()
+        self.total = int(valid.sum())
+
+        self.values = values
+        self.ranks = np.where(valid, ranks, 0).astype(np.int64)
+        self.percentiles = np.where(valid, (self.total - self.ranks) / max(self.total, 1) * 100.0, np.nan)
+        self.display = np.where(valid, np.char.mod(f'%.{decimals}f', np.nan_to_num(rounded)), '')
+
+        # Row positions of ranked countries, best first (stable on ties)
+        order = np.argsort(np.where(valid, self.ranks, np.iinfo(np.int64).max), kind='stable')
+        self.order = order[:self.total]
+        self.table = pd.DataFrame({
+            'country': countries[self.order],
+            'value': values[self.order],
+            'display': self.display[self.order],
+            'ranking': self.ranks[self.order],
+            'percentile': self.percentiles[self.order],
+        })
+        # Position of each ranked row within the sorted table
+        self.table_position = np.full(len(values), -1, dtype=np.int64)
+        self.table_position[self.order] = np.arange(self.total)
+
+
+class HPIRankings:
+    """
+    Ranks, percentiles and formatted values for every HPI metric, computed once.
+
+    Looking up a country's standing is a dictionary access plus array
+    indexing, so switching the comparison country never re-ranks the table.
+    """
+
+    def __init__(self, hpi_data, metrics=HPI_METRICS):
+        self.metrics = metrics
+        self.countries = hpi_data['country'].astype(str).to_numpy()
+        self._row = {country: i for i, country in enumerate(self.countries)}
+        self._rankings = {
+            metric: _MetricRanking(self.countries,
+                                   hpi_data[metric].to_numpy(dtype='float64'),
+                                   info['inverse'], info['decimals'], info.get('rank_rounded', False))
+            for metric, info in metrics.items()
+        }
+
+    def total(self, metric):
+        """Number of countries with a value for metric."""
+        return self._rankings[metric].total
+
+    def lookup(self, country, metric):
+        """
+        Returns a country's standing on a metric.
+
+        Returns:
+            RankedValue or None: None if the country is unknown or has no value.
+        """
+        row = self._row.get(country)
+        ranking = self._rankings[metric]
+        if row is None or ranking.ranks[row] == 0:
+            return None
+        return RankedValue(country, float(ranking.values[row]), str(ranking.display[row]),
+                           int(ranking.ranks[row]), ranking.total, float(ranking.percentiles[row]))
+
+    def position(self, country, metric):
+        """Returns the row position of country in ``ranking_table(metric)``, or None."""
+        row = self._row.get(country)
+        if row is None:
+            return None
+        position = int(self._rankings[metric].table_position[row])
+        return position if position >= 0 else None
+
+    def ranking_table(self, metric):
+        """
+        Returns all ranked countries for a metric, best first.
+
+        Columns are country, value, display (formatted value), ranking and percentile.
+        """
+        return self._rankings[metric].table
+
+    def window_rows(self, metric, focus, radius=5):
+        """
+        Returns the rows within radius places of each focus country, best first.
+
+        Windows around different countries are merged; rows between them are left out.
+        Unknown focus countries are ignored, and the top of the table is shown
+        if none of them is ranked.
+        """
+        ranking = self._rankings[metric]
+        centers = [p for p in (self.position(c, metric) for c in focus) if p is not None] or [0]
+        spans = [np.arange(max(c - radius, 0), min(c + radius + 1, ranking.total)) for c in centers]
+        return ranking.table.iloc[np.unique(np.concatenate(spans))]
+
+    def page_count(self, metric, page_size):
+        """Number of pages of page_size rows in the ranking table for metric."""
+        return max(1, -(-self._rankings[metric].total // page_size))
+
+    def page_of(self, country, metric, page_size):
+        """Returns the 1-based page that holds country, or 1 if it is not ranked."""
+        position = self.position(country, metric)
+        return 1 if position is None else position // page_size + 1
+
+    def page_rows(self, metric, page, page_size):
+        """Returns one 1-based page of the ranking table for metric."""
+        start = (page - 1) * page_size
+        return self._rankings[metric].table.iloc[start:start + page_size]
+
+    def chart_rows(self, metric, highlight, n=10):
+        """
+        Returns the n best countries on metric plus the highlighted ones, best first.
+
+        Args:
+            metric (str): One of the metric names.
+            highlight (list of str): Countries that must always be included.
+            n (int): How many other countries to include from the top of the ranking.
+        """
+        ranking = self._rankings[metric]
+        highlight_rows = {self._row[c] for c in highlight if c in self._row}
+        top = [row for row in ranking.order[:n + len(highlight_rows)] if row not in highlight_rows][:n]
+        rows = set(top) | {row for row in highlight_rows if ranking.ranks[row] > 0}
+        positions = np.sort(ranking.table_position[list(rows)])
+        return ranking.table.iloc[positions]
+
+
+def mark_highlights(rows, primary, secondary):
+    """
+    Adds a 'highlight' column: 'primary' for the primary country, 'secondary'
+    for the secondary one and '' for every other row.
+    """
+    countries = rows['country'].to_numpy()
+    highlight = np.select([countries == primary, countries == secondary], ['primary', 'secondary'], '')
+    return rows.assign(highlight=highlight)
+
+
+def get_hpi_rankings(hpi_data, version):
+    """
+    Returns the HPIRankings for hpi_data, built at most once per data version.
+
+    Args:
+        hpi_data (pd.DataFrame): The HPI dataset.
+        version (str): Identifies hpi_data, normally ``frame_fingerprint(hpi_data)``,
+            which for a frame from load_dataset is its source file's tag rather
+            than a pass over the frame.
+    """
+    key = version
+    with _rankings_lock:
+        rankings = _rankings_cache.get(key)
+        if rankings is not None:
+            _rankings_cache.move_to_end(key)
+            return rankings
+    rankings = HPIRankings(hpi_data)
+    with _rankings_lock:
+        _rankings_cache[key] = rankings
+        while len(_rankings_cache) > _RANKINGS_CACHE_SIZE:
+            _rankings_cache.popitem(last=False)
+    return rankings
+
+
+def clear_hpi_rankings_cache():
+    """Drops all memoized HPI rankings."""
+    with _rankings_lock:
+        _rankings_cache.clear()
@@ -0,0 +1,262 @@
+"""Command-line entry points for maintaining the dashboard's data directory.
+
+Usage:
+    python manage.py compile-data [--force] [DATASET ...]
+    python manage.py materialize [--force] [AGGREGATE ...]
+    python manage.py generate-data TARGET [--scale N] [--seed S] [--years Y ...] [--councils N]
+    python manage.py append-enrollment EXTRACT --year YEAR [--partition-by {year,year-province}]
+    python manage.py ingest-stacked EXTRACT TARGET.arrow [--year YEAR] [--chunk-rows N]
+    python manage.py show-dependencies [SOURCE ...]
+    python manage.py memory-report [DATASET ...]
+    python manage.py benchmark [--scales N ...] [--save-baseline] [--threshold F]
+    python manage.py import-report [MODULE ...] [--budget SECONDS]
+    python manage.py serve-api [--host HOST] [--port PORT]
+"""
+import argparse
+import json
+import sys
+
+
+def _compile_data(args):
+    from data_snapshot import compile_data, snapshot_status
+
+    compile_data(args.datasets or None, force=args.force)
+    for name, status in snapshot_status().items():
+        print(f"{status:>8}  {name}")
+    return 0
+
+
+def _materialize(args):
+    from materialized import materialize, materialized_status
+
+    materialize(args.aggregates or None, force=args.force)
+    for name, status in materialized_status().items():
+        print(f"{status:>8}  {name}")
+    return 0
+
+
+def _generate_data(args):
+    from synthetic_data import generate_data_dir
+
+    written = generate_data_dir(args.target, scale=args.scale, seed=args.seed,
+                                years=args.years, councils=args.councils)
+    for name, rows in written.items():
+        print(f"{rows:>10}  {name}")
+    return 0
+
+
+def _append_enrollment(args):
+    from enrollment_store import append_extract, store_years
+
+    result = append_extract(args.extract, args.year, partition_by=args.partition_by)
+    for path in result["partitions"]:
+        print(f"wrote  {path}")
+    print(f"{result['rows']} rows for {args.year} ({result['replaced']} replaced); "
+          f"store holds {', '.join(map(str, store_years()))}")
+    return 0
+
+
+def _ingest_stacked(args):
+    from stacked_enrollment import ParseReport, iter_stacked_records, write_records_arrow
+
+    report = ParseReport()
+    records = iter_stacked_records(args.extract, year=args.year, chunk_rows=args.chunk_rows, report=report)
+    written = write_records_arrow(records, args.target)
+    print(f"{report.rows} rows in {report.chunks} chunks -> {written} records in {args.target}")
+    for line, label, reason in report.orphans:
+        print(f"orphan  line {line}: '{label}' row {reason}")
+    return 0 if report.ok else 1
+
+
+def _show_dependencies(args):
+    from data_watcher import DEPENDENCIES, dependents, source_paths
+
+    if not args.sources:
+        for artefact, inputs in DEPENDENCIES.items():
+            print(f"{artefact}  <-  {', '.join(inputs)}")
+        return 0
+    paths = source_paths()
+    for source in args.sources:
+        # Accept a source name or the file name it watches
+        matches = [name for name, path in paths.items() if source in (name, path, path.rsplit("/", 1)[-1])]
+        if not matches:
+            print(f"Unknown source '{source}'. Expected one of: {', '.join(paths)}")
+            return 1
+        for artefact in dependents(matches):
+            print(f"{matches[0]}  ->  {artefact}")
+    return 0
+
+
+def _memory_report(args):
+    from data_loader import memory_report
+    from schemas import SchemaError
+
+    try:
+        report = memory_report(args.datasets or None)
+    except SchemaError as e:
+        print(f"Schema check failed: {e}")
+        return 1
+    print(report.to_string(index=False, float_format=lambda pct: f"{pct:.1f}"))
+    before, after = report["bytes_before"].sum(), report["bytes_after"].sum()
+    print(f"\nTotal: {before:,} -> {after:,} bytes ({(1 - after / before) * 100:.1f}% saved)")
+    return 0
+
+
+def _benchmark(args):
+    from benchmark import (
+        BASELINE_PATH,
+        DEFAULT_REPEAT,
+        DEFAULT_THRESHOLD,
+        SCALES,
+        compare,
+        format_report,
+        run_suite,
+    )
+
+    args.baseline = args.baseline or BASELINE_PATH
+    if args.threshold is None:
+        args.threshold = DEFAULT_THRESHOLD
+    suite = run_suite(args.scales or SCALES, repeat=args.repeat or DEFAULT_REPEAT, app=not args.no_app)
+    print(format_report(suite))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(suite, handle, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(suite, handle, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    try:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    except FileNotFoundError:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(suite, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION  {regression}")
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%} of the baseline")
+    return 1 if regressions else 0
+
+
+def _import_report(args):
+    from benchmark import DATA_MODULES, IMPORT_BUDGET, check_import_budget
+
+    budget = IMPORT_BUDGET if args.budget is None else args.budget
+    try:
+        lines, problems = check_import_budget(args.modules or DATA_MODULES, budget=budget)
+    except RuntimeError as e:
+        print(e)
+        return 1
+    print("\n".join(lines))
+    for problem in problems:
+        print(f"OVER BUDGET  {problem}")
+    return 1 if problems else 0
+
+
+def _serve_api(args):
+    from api_server import DEFAULT_HOST, DEFAULT_PORT, make_server, warm_responses
+    from data_watcher import start_watcher
+
+    host = args.host or DEFAULT_HOST
+    server = make_server(host, args.port or DEFAULT_PORT)
+    warm_responses()
+    start_watcher()
+    print(f"Serving the dashboard API on http://{host}:{server.server_port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Vanuatu Education Dashboard data tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile-data", help="Compile the CSVs in data/ into a columnar snapshot")
+    compile_parser.add_argument("datasets", nargs="*", help="Dataset names (default: all)")
+    compile_parser.add_argument("--force", action="store_true", help="Rebuild fresh snapshots too")
+    compile_parser.set_defaults(handler=_compile_data)
+
+    materialize_parser = commands.add_parser(
+        "materialize", help="Precompute the tables the charts aggregate into data/.materialized")
+    materialize_parser.add_argument("aggregates", nargs="*", metavar="AGGREGATE",
+                                    help="Aggregates to write (default: all)")
+    materialize_parser.add_argument("--force", action="store_true", help="Rewrite fresh tables too")
+    materialize_parser.set_defaults(handler=_materialize)
+
+    generate_parser = commands.add_parser(
+        "generate-data", help="Write synthetic data files with the real schemas at any scale")
+    generate_parser.add_argument("target", help="Directory to write the files into")
+    generate_parser.add_argument("--scale", type=int, default=1, help="Multiple of the real data size")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    generate_parser.add_argument("--years", type=int, nargs="+", help="Survey years (default: 2018 2019 2020)")
+    generate_parser.add_argument("--councils", type=int, help="Number of Area Councils (default: 66 x scale)")
+    generate_parser.set_defaults(handler=_generate_data)
+
+    append_parser = commands.add_parser(
+        "append-enrollment", help="Add a yearly detailed enrollment extract to the enrollment store")
+    append_parser.add_argument("extract", help="CSV in the stacked layout of detailed_enrollment.csv")
+    append_parser.add_argument("--year", type=int, required=True, help="School year the extract covers")
+    append_parser.add_argument("--partition-by", choices=["year", "year-province"],
+                               help="Partitioning for a new store (default: year)")
+    append_parser.set_defaults(handler=_append_enrollment)
+
+    ingest_parser = commands.add_parser(
+        "ingest-stacked", help="Stream a stacked enrollment extract into tidy records in an Arrow file")
+    ingest_parser.add_argument("extract", help="CSV in the stacked layout of detailed_enrollment.csv")
+    ingest_parser.add_argument("target", help="Arrow IPC file to write")
+    ingest_parser.add_argument("--year", type=int, help="Add this Year to every record")
+    ingest_parser.add_argument("--chunk-rows", type=int, default=100_000, help="Rows read at a time")
+    ingest_parser.set_defaults(handler=_ingest_stacked)
+
+    deps_parser = commands.add_parser(
+        "show-dependencies", help="Print which cached artefacts depend on which data files")
+    deps_parser.add_argument("sources", nargs="*", help="Show what these sources (or file names) invalidate")
+    deps_parser.set_defaults(handler=_show_dependencies)
+
+    memory_parser = commands.add_parser(
+        "memory-report", help="Check every dataset against its schema and show the memory it saves")
+    memory_parser.add_argument("datasets", nargs="*", help="Dataset names (default: all)")
+    memory_parser.set_defaults(handler=_memory_report)
+
+    bench_parser = commands.add_parser(
+        "benchmark", help="Time loaders, transforms, figure builders and app reruns at several data scales")
+    bench_parser.add_argument("--scales", type=int, nargs="+", help="Scale factors to run (default: 1 10 100 1000)")
+    bench_parser.add_argument("--repeat", type=int, help="Timed runs per benchmark (default 3)")
+    bench_parser.add_argument("--no-app", action="store_true", help="Skip the full app.py runs")
+    bench_parser.add_argument("--baseline", help="Baseline results file (default: benchmark_baseline.json)")
+    bench_parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    bench_parser.add_argument("--threshold", type=float,
+                              help="Allowed slowdown/growth over the baseline, as a fraction "
+                                   "(default 0.25, or BENCHMARK_THRESHOLD)")
+    bench_parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    bench_parser.set_defaults(handler=_benchmark)
+
+    import_parser = commands.add_parser(
+        "import-report", help="Time cold imports of the data modules against a startup budget")
+    import_parser.add_argument("modules", nargs="*", help="Modules to check (default: the data modules)")
+    import_parser.add_argument("--budget", type=float,
+                               help="Allowed import time per module, in seconds "
+                                    "(default 0.75, or IMPORT_BUDGET_SECONDS)")
+    import_parser.set_defaults(handler=_import_report)
+
+    api_parser = commands.add_parser("serve-api", help="Serve the dashboard aggregates as a local JSON API")
+    api_parser.add_argument("--host", help="Interface to listen on (default 127.0.0.1)")
+    api_parser.add_argument("--port", type=int, help="Port to listen on (default 8600)")
+    api_parser.set_defaults(handler=_serve_api)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""Derived tables computed once per data release instead of on every rerun.
+
+``python manage.py materialize`` runs every transform in AGGREGATES over the
+current datasets and writes the results as Arrow files to
+``<DATA_DIR>/.materialized``, with a manifest recording, per table, the
+source file it came from and the fingerprints of the input frames it is valid
+for. Chart builders call ``aggregate(name, data)``: when ``data`` matches a
+recorded input the stored table is returned, otherwise (new data, a filtered
+frame, no materialized tables at all) the transform runs as before.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+
+from data_loader import (
+    DATA_DIR,
+    dataset_path,
+    file_fingerprint,
+    frame_fingerprint,
+    load_dataset,
+    write_atomic,
+)
+from enrollment_transforms import (
+    create_enrollment_by_grade,
+    create_enrollment_summary,
+    create_gender_enrollment_summary,
+    preprocess_data,
+)
+from transforms import age_group_totals, population_by_age_group, teacher_totals
+
+logger = logging.getLogger(__name__)
+
+MATERIALIZED_DIR = os.path.join(DATA_DIR, ".materialized")
+MATERIALIZED_MANIFEST = os.path.join(MATERIALIZED_DIR, "manifest.json")
+MATERIALIZED_FORMAT_VERSION = 2
+
+
+def _as_loaded(frame):
+    return frame
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """
+    A derived table that can be materialized.
+
+    Attributes:
+        dataset (str): The dataset it is computed from.
+        build (callable): Computes the table from the dataset's frame.
+        inputs (tuple of callable): The forms of the loaded frame builders
+            receive; the stored table is used for any of them.
+    """
+    dataset: str
+    build: callable
+    inputs: tuple = (_as_loaded,)
+
+
+# The enrollment transforms accept raw or preprocessed frames, and pages pass both.
+_ENROLLMENT_INPUTS = (_as_loaded, preprocess_data)
+
+AGGREGATES = {
+    "enrollment_summary": Aggregate("Detailed Enrollment", create_enrollment_summary, _ENROLLMENT_INPUTS),
+    "gender_enrollment_summary": Aggregate("Detailed Enrollment", create_gender_enrollment_summary,
+                                           _ENROLLMENT_INPUTS),
+    "enrollment_by_grade": Aggregate("Detailed Enrollment", create_enrollment_by_grade, _ENROLLMENT_INPUTS),
+    "teacher_totals": Aggregate("Teachers Distribution", teacher_totals),
+    "age_group_totals": Aggregate("Age Distribution", age_group_totals),
+    "population_by_age_group": Aggregate("Population", population_by_age_group),
+    "population_by_school_age_group": Aggregate("Population", partial(population_by_age_group,
+                                                                      school_age_only=True)),
+}
+
+_lock = threading.Lock()
+_manifest_cache = {}
+# Aggregate name -> (manifest entry it was read for, table).
+_table_cache = {}
+
+
+def read_materialized_manifest():
+    """Returns the manifest of materialized tables, or None if none have been written."""
+    try:
+        stat = os.stat(MATERIALIZED_MANIFEST)
+    except FileNotFoundError:
+        return None
+    key = (stat.st_size, stat.st_mtime_ns)
+    with _lock:
+        if key not in _manifest_cache:
+            with open(MATERIALIZED_MANIFEST, encoding="utf-8") as handle:
+                _manifest_cache.clear()
+                _manifest_cache[key] = json.load(handle)
+        return _manifest_cache[key]
+
+
+def _manifest_entries():
+    manifest = read_materialized_manifest() or {}
+    if manifest.get("version") != MATERIALIZED_FORMAT_VERSION:
+        return {}
+    return manifest.get("aggregates", {})
+
+
+def materialize(names=None, force=False):
+    """
+    Computes aggregates and writes them, with their input fingerprints, to MATERIALIZED_DIR.
+
+    Args:
+        names (list of str, optional): Aggregates to write. Defaults to all of AGGREGATES.
+        force (bool): Rewrite tables whose source file has not changed too.
+
+    Returns:
+        dict: The manifest that was written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise RuntimeError("materialize requires pyarrow (pip install pyarrow)") from e
+
+    for name in names or []:
+        if name not in AGGREGATES:
+            raise KeyError(f"Unknown aggregate '{name}'. Expected one of: {', '.join(AGGREGATES)}")
+
+    os.makedirs(MATERIALIZED_DIR, exist_ok=True)
+    entries = dict(_manifest_entries())
+    for name in names or list(AGGREGATES):
+        spec = AGGREGATES[name]
+        source = file_fingerprint(dataset_path(spec.dataset))
+        old = entries.get(name)
+        table_file = f"{name}.arrow"
+        if (not force and old is not None and old["sha256"] == source.sha256
+                and os.path.exists(os.path.join(MATERIALIZED_DIR, table_file))):
+            continue
+
+        frame = load_dataset(spec.dataset)
+        table = pa.Table.from_pandas(spec.build(frame), preserve_index=False)
+        write_atomic(
+            os.path.join(MATERIALIZED_DIR, table_file),
+            lambda tmp: feather.write_feather(table, tmp, compression="uncompressed"),
+        )
+        entries[name] = {
+            "dataset": spec.dataset,
+            "table": table_file,
+            "sha256": source.sha256,
+            "inputs": sorted({frame_fingerprint(prepare(frame)) for prepare in spec.inputs}),
+            "rows": table.num_rows,
+            "columns": {field.name: str(field.type) for field in table.schema},
+        }
+
+    manifest = {
+        "version": MATERIALIZED_FORMAT_VERSION,
+        "format": "arrow-ipc",
+        "materialized_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "aggregates": entries,
+    }
+
+    def write_manifest(tmp):
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+
+    write_atomic(MATERIALIZED_MANIFEST, write_manifest)
+    return manifest
+
+
+def materialized_status():
+    """
+    Reports, for every aggregate, whether its stored table matches the current source file.
+
+    Returns:
+        dict: Aggregate name -> "fresh", "stale" or "missing".
+    """
+    entries = _manifest_entries()
+    status = {}
+    for name, spec in AGGREGATES.items():
+        entry = entries.get(name)
+        if entry is None or not os.path.exists(os.path.join(MATERIALIZED_DIR, entry["table"])):
+            status[name] = "missing"
+        elif entry["sha256"] != file_fingerprint(dataset_path(spec.dataset)).sha256:
+            status[name] = "stale"
+        else:
+            status[name] = "fresh"
+    return status
+
+
+def _stored_table(name, fingerprint):
+    """Returns the materialized table of name if it was computed from a frame with fingerprint."""
+    entry = _manifest_entries().get(name)
+    if entry is None or fingerprint not in entry["inputs"]:
+        return None
+    with _lock:
+        cached = _table_cache.get(name)
+        if cached is not None and cached[0] == entry:
+            return cached[1]
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    try:
+        table = feather.read_table(os.path.join(MATERIALIZED_DIR, entry["table"]), memory_map=True).to_pandas()
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable materialized table %s: %s", name, e)
+        return None
+    with _lock:
+        _table_cache[name] = (entry, table)
+    return table
+
+
+def aggregate(name, data):
+    """
+    Returns an aggregate of data, from the materialized table when there is a matching one.
+
+    Args:
+        name (str): A key of AGGREGATES.
+        data (pd.DataFrame): The frame the builder was given.
+
+    Returns:
+        pd.DataFrame: The aggregate; the caller may modify it.
+    """
+    table = _stored_table(name, frame_fingerprint(data))
+    if table is None:
+        return AGGREGATES[name].build(data)
+    return table.copy()
+
+
+def clear_materialized_cache():
+    """Drops the materialized tables read into memory."""
+    with _lock:
+        _table_cache.clear()
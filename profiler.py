@@ -0,0 +1,295 @@
+"""Opt-in profiling of app.py runs.
+
+Profiling is turned on per browser session with the ``?profile=1`` query
+parameter, or for every session with ``DASHBOARD_PROFILE=1``. While it is on,
+each script run records:
+
+- sections: the wall time of each part of the page, marked in app.py;
+- builds: every figure built or served from a cache, with cache hit or miss;
+- charts: the serialized size of every figure sent to the browser.
+
+The sidebar shows one row per section. The same data can be downloaded as a
+JSON trace, or written to ``DASHBOARD_PROFILE_TRACE_DIR`` after every run,
+for offline comparison.
+
+This module does not import Streamlit until a profile is rendered, so the
+figure cache can report to it from any context.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "DASHBOARD_PROFILE"
+TRACE_DIR_ENV = "DASHBOARD_PROFILE_TRACE_DIR"
+QUERY_PARAM = "profile"
+TRACE_FORMAT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+_SESSION_KEY = "_profile"
+# The profile of the script run executing on this thread, if profiling is on.
+_local = threading.local()
+
+
+class Profile:
+    """
+    Timings of one script run (or fragment rerun), grouped by section.
+
+    Sections nest: a builder or chart is recorded against the innermost
+    section open when it ran.
+    """
+
+    def __init__(self, run):
+        self.run = run
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.sections = []
+        self.events = []
+        self._stack = []
+        self._mark = None
+
+    @property
+    def section_name(self):
+        return self._stack[-1]["name"] if self._stack else None
+
+    def has_open_sections(self):
+        """Returns whether a section is open, i.e. the profile is mid-run."""
+        return bool(self._stack)
+
+    def open_section(self, name):
+        entry = {"name": name, "parent": self.section_name, "start": time.perf_counter() - self._start,
+                 "seconds": None}
+        self.sections.append(entry)
+        self._stack.append(entry)
+        return entry
+
+    def close_section(self, entry):
+        entry["seconds"] = time.perf_counter() - self._start - entry["start"]
+        self._stack.remove(entry)
+
+    @contextmanager
+    def section(self, name):
+        """Times the enclosed block as section name."""
+        entry = self.open_section(name)
+        try:
+            yield entry
+        finally:
+            self.close_section(entry)
+
+    def mark(self, name):
+        """Ends the section started by the previous mark, if any, and starts section name."""
+        if self._mark is not None:
+            self.close_section(self._mark)
+        self._mark = self.open_section(name) if name is not None else None
+
+    def record(self, kind, name, seconds, cache=None, payload_bytes=None):
+        """
+        Records one build or chart against the current section.
+
+        Args:
+            kind (str): "build" for a figure builder, "chart" for a figure sent to the page.
+            name (str): The builder or chart name.
+            seconds (float): Wall time it took.
+            cache (str, optional): "hit" or "miss" for cached builds.
+            payload_bytes (int, optional): Size of the serialized figure.
+        """
+        self.events.append({"kind": kind, "name": name, "section": self.section_name,
+                            "seconds": seconds, "cache": cache, "payload_bytes": payload_bytes})
+
+    def finish(self):
+        """Closes any sections still open."""
+        self.mark(None)
+        while self._stack:
+            self.close_section(self._stack[-1])
+
+    def section_rows(self):
+        """
+        Summarizes the run per section.
+
+        Returns:
+            list of dict: name, seconds, builds, hits, misses and payload_bytes,
+            in page order. Builds and charts of nested sections count towards
+            their parent too.
+        """
+        rows = []
+        for entry in self.sections:
+            names = self._descendants(entry["name"])
+            events = [event for event in self.events if event["section"] in names]
+            builds = [event for event in events if event["kind"] == "build"]
+            rows.append({
+                "section": entry["name"],
+                "seconds": entry["seconds"],
+                "builds": len(builds),
+                "hits": sum(event["cache"] == "hit" for event in builds),
+                "misses": sum(event["cache"] == "miss" for event in builds),
+                "payload_bytes": sum(event["payload_bytes"] or 0 for event in events if event["kind"] == "chart"),
+            })
+        return rows
+
+    def _descendants(self, name):
+        names = {name}
+        for entry in self.sections:
+            if entry["parent"] in names:
+                names.add(entry["name"])
+        return names
+
+    def to_trace(self):
+        """Returns the run as a JSON-serializable trace."""
+        return {
+            "version": TRACE_FORMAT_VERSION,
+            "run": self.run,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "seconds": time.perf_counter() - self._start,
+            "sections": self.section_rows(),
+            "events": self.events,
+        }
+
+    def write_trace(self, directory):
+        """Writes the trace to directory as profile-<timestamp>-<run>.json; returns the path."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        path = os.path.join(directory, f"profile-{stamp}-{self.run}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_trace(), handle, indent=2)
+        return path
+
+
+def current_profile():
+    """Returns the profile of the run on this thread, or None when profiling is off."""
+    return getattr(_local, "profile", None)
+
+
+def profiling_requested():
+    """Whether this session asked for profiling, by query parameter or environment variable."""
+    import streamlit as st
+
+    if os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    return st.query_params.get(QUERY_PARAM, "") in ("1", "true", "yes")
+
+
+def start_profile():
+    """
+    Starts profiling this script run if the session asked for it.
+
+    Call once at the top of app.py.
+
+    Returns:
+        Profile or None: The run's profile, or None when profiling is off.
+    """
+    import streamlit as st
+
+    profile = None
+    if profiling_requested():
+        runs = st.session_state.get(_SESSION_KEY, {}).get("runs", 0) + 1
+        profile = Profile(runs)
+        st.session_state[_SESSION_KEY] = {"runs": runs, "last": profile}
+    else:
+        st.session_state.pop(_SESSION_KEY, None)
+    _local.profile = profile
+    return profile
+
+
+def mark(name):
+    """Starts the next top-level section of the page; a no-op when profiling is off."""
+    profile = current_profile()
+    if profile is not None:
+        profile.mark(name)
+
+
+def profiled_fragment(name):
+    """
+    Decorator for fragment functions, so their reruns are profiled too.
+
+    During a full run the fragment is timed by the enclosing section. When it
+    reruns on its own, the rerun is profiled as a run of its own with one
+    section, name, and its trace is written like a full run's.
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            import streamlit as st
+
+            state = st.session_state.get(_SESSION_KEY)
+            if state is None:
+                _local.profile = None
+                return function(*args, **kwargs)
+            if current_profile() is state["last"] and current_profile().has_open_sections():
+                # Part of a full run, timed by the section app.py marked around it
+                return function(*args, **kwargs)
+            state["runs"] += 1
+            profile = Profile(state["runs"])
+            _local.profile = profile
+            try:
+                with profile.section(name):
+                    return function(*args, **kwargs)
+            finally:
+                profile.finish()
+                state["fragments"] = state.get("fragments", [])[-9:] + [profile]
+                _write_configured_trace(profile)
+        return wrapper
+    return decorate
+
+
+def record_build(name, seconds, hit, payload_bytes=None):
+    """Records a figure cache lookup (and the build, on a miss) in the current profile."""
+    profile = current_profile()
+    if profile is not None:
+        profile.record("build", name, seconds, "hit" if hit else "miss", payload_bytes)
+
+
+def record_chart(name, seconds, payload_bytes):
+    """Records a figure sent to the page, with its serialized size, in the current profile."""
+    profile = current_profile()
+    if profile is not None:
+        profile.record("chart", name, seconds, payload_bytes=payload_bytes)
+
+
+def _write_configured_trace(profile):
+    directory = os.environ.get(TRACE_DIR_ENV)
+    if directory:
+        try:
+            profile.write_trace(directory)
+        except OSError:
+            logger.exception("Error writing profile trace to %s", directory)
+
+
+def render_profile():
+    """
+    Finishes this run's profile and shows it in the sidebar.
+
+    Call once at the end of app.py. Also writes the trace to
+    DASHBOARD_PROFILE_TRACE_DIR when that is set.
+    """
+    import pandas as pd
+    import streamlit as st
+
+    profile = current_profile()
+    if profile is None:
+        return
+    profile.finish()
+    _write_configured_trace(profile)
+
+    with st.sidebar.expander("Profile", expanded=True):
+        st.caption(f"Run {profile.run}: {profile.to_trace()['seconds']:.2f} s")
+        sections = pd.DataFrame(profile.section_rows())
+        st.dataframe(sections.style.format({"seconds": "{:.3f}", "payload_bytes": "{:,}"}),
+                     hide_index=True, width="stretch")
+        events = pd.DataFrame(profile.events)
+        if not events.empty:
+            st.caption("Builders and charts")
+            st.dataframe(events.style.format({"seconds": "{:.3f}", "payload_bytes": "{:,.0f}"}, na_rep=""),
+                         hide_index=True, width="stretch")
+        fragments = st.session_state[_SESSION_KEY].get("fragments", [])
+        if fragments:
+            st.caption("Fragment reruns since the last full run")
+            st.dataframe(pd.DataFrame([row | {"run": fragment.run} for fragment in fragments
+                                       for row in fragment.section_rows()]),
+                         hide_index=True, width="stretch")
+        st.download_button("Download JSON trace",
+                           json.dumps(profile.to_trace(), indent=2),
+                           file_name=f"profile-run-{profile.run}.json", mime="application/json")
@@ -0,0 +1,47 @@
+"""Geography: school attendance by Area Council."""
+import streamlit as st
+
+from figure_payload import plotly_chart
+from geography import ATTENDANCE_YEARS, attendance_table
+from profiler import mark, profiled_fragment
+from visualizations import PROVINCE_METRICS, create_attendance_choropleth, create_province_choropleth
+
+
+# -----------------------------------------------------------------------------
+# School Attendance by Area Council
+# -----------------------------------------------------------------------------
+mark("Attendance map")
+st.header("School Attendance by Area Council")
+
+
+@st.fragment
+@profiled_fragment("Attendance map")
+def attendance_map_section():
+    """Area Council or province choropleth; its controls rerun only this section."""
+    try:
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            granularity = st.radio("Map by", ["Area Council", "Province"], horizontal=True,
+                                   key="attendance_granularity")
+        with col2:
+            year = st.radio("Year", ATTENDANCE_YEARS[::-1], horizontal=True, key="attendance_year")
+        with col3:
+            if granularity == "Province":
+                metric = st.selectbox("Show", list(PROVINCE_METRICS), key="province_metric")
+            else:
+                provinces = sorted(attendance_table()['province'].dropna().unique())
+                area = st.selectbox("Area", ["All of Vanuatu"] + provinces, key="attendance_area")
+
+        if granularity == "Province":
+            fig = create_province_choropleth(metric, year)
+            plotly_chart(fig, width="stretch")
+            st.caption("Province totals; the year applies to school attendance only.")
+        else:
+            fig = create_attendance_choropleth(year, None if area == "All of Vanuatu" else area)
+            plotly_chart(fig, width="stretch")
+            st.caption("Councils without attendance data are left blank.")
+    except Exception as e:
+        st.error(f"Error creating attendance map: {e}")
+
+
+attendance_map_section()
@@ -0,0 +1,278 @@
+"""Enrollment: province enrollment, age-based enrollment and higher education."""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from data_loader import frame_fingerprint, load_dataset
+from detailed_enrollment_visualizations import (
+    create_enrollment_trend_chart,
+    create_enrollment_type_pie_chart,
+    create_gender_distribution_bar_chart,
+    create_grade_enrollment_line_chart,
+    create_total_enrollment_bar_chart,
+    create_total_vs_secondary_scatter,
+)
+from enrollment_store import read_enrollment, store_version, store_years, to_detailed_layout
+from enrollment_transforms import preprocess_data
+from figure_payload import plotly_chart
+from profiler import mark, profiled_fragment
+from visualizations import create_age_distribution_analysis, lazy_tabs, session_figure
+
+
+# -----------------------------------------------------------------------------
+# Province Data Visualizations Section
+# -----------------------------------------------------------------------------
+mark("Province visualizations")
+st.header("Province Data Visualizations")
+
+
+@st.fragment
+@profiled_fragment("Province visualizations")
+def province_visualizations_section():
+    """Province charts for the detailed enrollment data, rerun as one unit."""
+    try:
+        # Create tabs for different visualizations; only the open tab's chart is built
+        province_charts = {
+            "Total Enrollment": create_total_enrollment_bar_chart,
+            "Enrollment by Level": create_enrollment_type_pie_chart,
+            "Gender Distribution": create_gender_distribution_bar_chart,
+            "Grade Trends": create_grade_enrollment_line_chart,
+            "Total vs Secondary": create_total_vs_secondary_scatter,
+        }
+
+        # Yearly extracts appended to the enrollment store take over from the single CSV
+        years = store_years()
+        if years:
+            year = st.selectbox("School year", years[::-1], key="enrollment_year")
+            detailed_enrollment = to_detailed_layout(read_enrollment(year, year))
+            enrollment_version = store_version(year, year)
+            if len(years) > 1:
+                history = read_enrollment()
+                province_charts["Trends Over Time"] = lambda _: create_enrollment_trend_chart(history)
+                enrollment_version = (enrollment_version, store_version())
+        else:
+            detailed_enrollment = preprocess_data(load_dataset("Detailed Enrollment"))
+            # Keyed on the frame the charts are built from, so a file changing
+            # in between cannot store old charts under the new version
+            enrollment_version = frame_fingerprint(detailed_enrollment)
+        province_tabs = lazy_tabs(list(province_charts), key="province_tabs")
+
+        for (tab, is_open), (label, create_chart) in zip(province_tabs, province_charts.items()):
+            if not is_open:
+                continue
+            with tab:
+                fig = session_figure(("province", label), enrollment_version,
+                                     lambda: create_chart(detailed_enrollment))
+                if fig:
+                    plotly_chart(fig, width="stretch")
+
+    except Exception as e:
+        st.error(f"Error in Province Data Visualizations: {e}")
+
+
+province_visualizations_section()
+
+# -----------------------------------------------------------------------------
+# Age Distribution and Educational Access
+# -----------------------------------------------------------------------------
+mark("Age distribution")
+st.header("Age Distribution and Educational Access")
+st.subheader("Age-based Enrollment Patterns")
+
+col1, col2 = st.columns([3,1])
+with col1:
+    try:
+        age_data = load_dataset("Age Distribution")
+    except Exception as e:
+        st.error(f"Error loading age distribution data: {e}")
+        st.stop()
+    fig = create_age_distribution_analysis(age_data)
+    plotly_chart(fig, width="stretch")
+
+with col2:
+    st.markdown("""
+    **Age Distribution Insights**  
+    """)
+    
+    # Create expandable sections for better organization
+    with st.expander("Key Patterns", expanded=True):
+        st.markdown("""
+        - Early childhood enrollment (under 3) can be sporadic, though many provinces have 
+          started to introduce preschool programs in vernacular languages
+        - Core age groups (3-4 years) typically see the highest enrollment rates for early learning
+        - Over-age enrollment (>6 years in early grades) remains an issue
+        - Year-over-year trends indicate gradual improvements in early enrollment
+        """)
+    
+    with st.expander("Detailed Analysis"):
+        st.markdown("""
+        Early childhood enrollment has historically been low but is improving with new vernacular language programs. The 3-4 year age group now sees better participation rates.
+
+        A persistent challenge is over-age enrollment where children significantly older than expected (e.g., 8-9 year olds in Grade 1-2) are present due to late school entry or repetition.
+        
+        Dropout rates increase in upper primary and lower secondary years due to:
+        - Financial pressures
+        - Cultural factors (subsistence work, early marriage)
+        - Academic barriers (examination hurdles)
+        
+        While policies now favor automatic promotion and fee-free basic education, the effects of previous selection practices remain visible in the enrollment patterns.
+        """)
+
+# -----------------------------------------------------------------------------
+# Higher Education
+# -----------------------------------------------------------------------------
+mark("Higher education")
+st.header("Higher Education in Vanuatu")
+
+# Create tabs for institution-specific details
+tabs = st.tabs([
+    "National University of Vanuatu", 
+    "USP – Emalus Campus", 
+    "Other Institutions"
+])
+
+with tabs[0]:
+    st.markdown("""
+    ### National University of Vanuatu (NUV)
+    
+    Established under Act No. 34 of 2019 and officially published in January 2020, the National University of Vanuatu (NUV) is a public institution located in Port Vila. NUV consolidates existing post‐secondary entities (such as teacher training, technical, and nursing colleges) to provide comprehensive academic programs. Collaborative degree programs with international partners ensure adherence to global academic standards.
+    """)
+
+with tabs[1]:
+    st.markdown("""
+    ### University of the South Pacific (USP) – Emalus Campus
+    
+    The University of the South Pacific (USP) is a regional institution jointly owned by 12 Pacific countries. Its Emalus Campus in Port Vila, operating since 1989, offers a primary focus on legal studies alongside additional disciplines through flexible learning approaches. The campus contributes to regional higher education by providing both undergraduate and postgraduate courses.
+    """)
+
+with tabs[2]:
+    st.markdown("""
+    ### Other Recognized Higher Education Institutions in Vanuatu
+    
+    Vanuatu is also home to several accredited institutions offering vocational and specialized training:
+    
+    - **Vanuatu Institute of Teacher Education (VITE)** – Founded in 1962, offering diploma programs in teacher education.
+    - **Vanuatu Institute of Technology (VIT)** – Established in 1970, delivering certificate and diploma courses in technical and vocational fields.
+    - **Vanuatu College of Nursing Education (VCNE)** – Provides a 3-year Diploma in General Nursing with a midwifery component.
+    - **Vanuatu Agriculture College (VAC)** – Offers certificate and diploma programs in agriculture.
+    - **Vanuatu Maritime College (VMC)** – Established in 1999, specializing in maritime and seafaring skills.
+    - **Talua Theological Training Institute (TTTI)** – Since 1986, offering academic programs in theological studies.
+    - **Australia-Pacific Technical College (APTC)** – A regional vocational training provider supported by the Australian Government.
+    """)
+
+mark("Higher education timeline")
+# Persistent Timeline Section (displayed below the tabs)
+st.markdown("### Timeline of Higher Education Development in Vanuatu")
+
+# Data for timeline
+institutions_data = pd.DataFrame({
+    'Institution': ['VITE', 'VIT', 'USP', 'TTTI', 'USP Emalus', 'VMC', 'APTC', 'NUV'],
+    'Year': [1962, 1970, 1968, 1986, 1989, 1999, 2006, 2019],
+    'Type': ['Specialized', 'Technical', 'Regional University', 'Specialized', 'Regional Campus', 'Technical', 'Technical', 'National University'],
+    'Full_Name': [
+        'Vanuatu Institute of Teacher Education',
+        'Vanuatu Institute of Technology',
+        'University of the South Pacific',
+        'Talua Theological Training Institute',
+        'USP – Emalus Campus',
+        'Vanuatu Maritime College',
+        'Australia-Pacific Technical College',
+        'National University of Vanuatu'
+    ]
+})
+
+# Color mapping for institution types
+color_map = {
+    "Specialized": "#1f77b4",
+    "Technical": "#ff7f0e",
+    "Regional University": "#2ca02c",
+    "National University": "#d62728",
+    "Regional Campus": "#9467bd"
+}
+
+fig = go.Figure()
+
+# Sort data by year to ensure chronological order
+institutions_data = institutions_data.sort_values('Year')
+
+# Add markers for each institution on the timeline
+for i, row in institutions_data.iterrows():
+    fig.add_trace(go.Scatter(
+        x=[row['Year']],
+        y=[0],
+        mode="markers+text",
+        marker=dict(
+            size=16,
+            color=color_map[row['Type']],
+            line=dict(width=2, color="DarkSlateGrey")
+        ),
+        text=[row['Institution']],
+        textposition="top center",
+        name=row['Institution'],
+        hovertemplate=f"<b>{row['Full_Name']}</b><br>Established: {row['Year']}<extra></extra>"
+    ))
+
+# Define timeline bounds
+min_year = institutions_data['Year'].min() - 5
+max_year = institutions_data['Year'].max() + 5
+
+# Draw the main timeline line
+fig.add_shape(
+    type="line",
+    x0=min_year,
+    y0=0,
+    x1=max_year,
+    y1=0,
+    line=dict(color="gray", width=2)
+)
+
+# Add decade markers with minimal design elements
+for decade in range((institutions_data['Year'].min() // 10) * 10, institutions_data['Year'].max() + 10, 10):
+    fig.add_shape(
+        type="line",
+        x0=decade,
+        y0=-0.05,
+        x1=decade,
+        y1=0.05,
+        line=dict(color="gray", width=1)
+    )
+    fig.add_annotation(
+        x=decade,
+        y=-0.1,
+        text=str(decade),
+        showarrow=False,
+        font=dict(size=10, color="gray")
+    )
+
+fig.update_layout(
+    template="simple_white",
+    title="Timeline of Higher Education Institutions in Vanuatu",
+    showlegend=False,
+    xaxis=dict(
+        title="Year",
+        range=[min_year, max_year],
+        tickmode="linear",
+        dtick=5,
+        zeroline=False
+    ),
+    yaxis=dict(visible=False),
+    margin=dict(l=20, r=20, t=50, b=50),
+    height=300
+)
+
+plotly_chart(fig, width="stretch")
+
+st.markdown("""
+The development of higher education in Vanuatu has accelerated in recent years, marked most prominently by the establishment of the National University of Vanuatu (NUV). Officially created by Act No. 34 of 2019 and opened in early 2020, NUV is a public institution in Port Vila that consolidates existing post-secondary programs (such as teacher training, technical institutes, and nursing colleges) under one umbrella. NUV also engages in collaborative degree programs with international partners to ensure its offerings meet global academic standards. This milestone reflects Vanuatu's effort to build domestic tertiary capacity and reduce reliance on regional universities abroad (Figure 2 – Timeline of Higher Education Institutions in Vanuatu is referenced here).
+
+#### Access and Affordability
+Access to higher education in Vanuatu has historically been limited, but it is gradually improving. Only a small fraction of students progress from secondary school to the tertiary level, due in part to the sharp pyramid shape of the education system. For example, around 8,000 children start primary Grade 1 each year, but only on the order of a few hundred complete Year 13, and an even smaller number enroll in university studies. In concrete terms, Ministry of Education data indicate that in 2019 only 1,064 students were enrolled in Year 13, compared with 8,150 who began in Year 1 in 2007—an approximately 87% attrition rate through the end of secondary (Trauma.massey.ac.nz, n.d.).
+
+Cost has been a major barrier to tertiary participation. Studying abroad (in Fiji, Australia, or France, for instance) incurs high expenses that most Ni-Vanuatu families cannot afford. The government and international donors provide a limited number of scholarships each year (about 40–50) to help bridge this gap. Recognizing the demand, the Vanuatu government has made it a priority to expand local tertiary opportunities so that more students can study "at home" at lower cost. The establishment of NUV and the strengthening of vocational colleges are expected to reduce the need for expensive overseas study, allowing hundreds of students to earn degrees in-country each year.
+
+#### Challenges in Higher Education
+Despite recent progress, Vanuatu's higher education system faces several challenges. There are capacity and quality concerns, including a shortage of local faculty with Ph.D. qualifications, limited research output, and a nascent quality assurance framework for programs. Infrastructure limitations are evident as well: universities and colleges have limited classroom space, libraries, and laboratory facilities, constraining the learning environment. Another challenge is alignment with national needs—ensuring that graduates are trained in priority sectors like engineering, medicine, agriculture, and technical sciences that are critical for Vanuatu's development. Moreover, brain drain remains an issue: it is estimated that approximately 80% of Ni-Vanuatu who graduate overseas do not return to work in the domestic public sector, representing a loss of talent for the country.
+
+#### Role of Regional Universities and Workforce Development
+For decades, regional universities played an outsized role in shaping Vanuatu's skilled workforce. The University of the South Pacific (USP), for example, with its Emalus Campus in Port Vila, has produced many of Vanuatu's leaders in education, government, and business. Similarly, francophone Ni-Vanuatu have often studied at universities in New Caledonia, Tahiti, or France, given the historical ties. By developing NUV, Vanuatu hopes to retain more talent and tailor higher education to the local context. Courses can be designed to address Vanuatu's unique environment and needs (for instance, programs in disaster risk management or sustainable agriculture that directly apply to local challenges). The establishment of a National University is also a step toward educational sovereignty, a move away from complete reliance on regional institutions and toward building home-grown capacity. With a youthful population (nearly half of Ni-Vanuatu are under 20), investment in tertiary education is crucial for the nation's future, providing advanced skills and knowledge to drive development.
+""")
@@ -0,0 +1,73 @@
+"""Equity: gender distribution in enrollment."""
+import streamlit as st
+
+from data_loader import load_dataset
+from figure_payload import plotly_chart
+from profiler import mark
+from visualizations import create_gender_ratio_plot
+
+
+# -----------------------------------------------------------------------------
+# Gender Equity in Education
+# -----------------------------------------------------------------------------
+mark("Gender equity")
+st.header("Gender Equity in Education")
+st.subheader("Gender Distribution Analysis")
+
+col1, col_spacer, col2 = st.columns([2, 0.1, 1.9])
+
+with col1:
+    try:
+        enrollment_details = load_dataset("Detailed Enrollment")
+        fig = create_gender_ratio_plot(enrollment_details, "enrollment")
+        plotly_chart(fig, width="stretch")
+    except Exception as e:
+        st.error(f"Error creating gender ratio plot: {e}")
+
+with col2:
+    # Create tabs to organize the content more effectively
+    gender_tabs = st.tabs(["Overview", "Primary Education", "Secondary Education", "Challenges"])
+    
+    with gender_tabs[0]:
+        st.markdown("""
+        **Gender Equity Assessment**  
+        
+        The research base on gender-specific outcomes in Vanuatu shows generally balanced enrollment rates at primary level 
+        with some variations at secondary level. Recent policies have helped improve gender parity, though cultural 
+        and socioeconomic factors still create barriers in some contexts.
+        """)
+    
+    with gender_tabs[1]:
+        st.markdown("""
+        **Primary Education**
+        
+        Parity has largely been achieved in primary schooling (Education.gov.vu, n.d.-a). After some fluctuations 
+        (such as a slight dip in girls' enrollment after 2015, possibly due to economic pressures following disasters), 
+        the overall gender parity index in basic education has improved.
+        """)
+        
+    with gender_tabs[2]:
+        st.markdown("""
+        **Secondary Education**
+        
+        Recent data indicate that at the junior secondary level, girls' enrollment and retention can even surpass 
+        that of boys in some cohorts (Education.gov.vu, n.d.-b). In secondary schools there have been years where 
+        slightly more females are enrolled than males and females' drop-out rates are consistently lower than males 
+        (Education.gov.vu, n.d.-c). This trend of boys leaving school earlier is partly attributable to different 
+        social pressures on males (e.g., entering work) and initiatives encouraging girls' education.
+        """)
+        
+    with gender_tabs[3]:
+        st.markdown("""
+        **Ongoing Challenges**
+        
+        Disparities still emerge in later schooling, where economic factors, cultural expectations, or early marriage 
+        and pregnancy can disproportionately affect girls' continued education. Studies have found that adolescent 
+        pregnancy is a major reason for female students dropping out in Vanuatu (Warwick.ac.uk, 2010a; 2010b).
+        
+        The rate of teen pregnancy in Vanuatu is high compared to other Pacific countries, and once an unmarried girl 
+        becomes pregnant, it is often considered shameful or impractical for her to return to school (Warwick.ac.uk, 2010c). 
+        
+        Additionally, customary norms in some communities still encourage girls to marry at a young age, which can 
+        interrupt or terminate their schooling (Naidu, 2010).
+        """)
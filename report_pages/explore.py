@@ -0,0 +1,109 @@
+"""Explore: ad-hoc SQL and group/filter queries over every dataset."""
+import streamlit as st
+
+from profiler import mark, profiled_fragment
+from sql_explorer import (
+    AGGREGATE_FUNCTIONS,
+    FILTER_OPERATORS,
+    PAGE_SIZE,
+    QueryError,
+    build_query,
+    numeric_columns,
+    run_query,
+    table_columns,
+)
+
+EXAMPLE_QUERY = """SELECT Gender,
+       sum(ECE) AS ECE, sum(PS) AS PS, sum(SC) AS SC, sum(SS) AS SS
+FROM teacher_distribution
+GROUP BY Gender
+ORDER BY Gender"""
+
+
+# -----------------------------------------------------------------------------
+# Explore the Data
+# -----------------------------------------------------------------------------
+mark("Explore")
+st.header("Explore the Data")
+st.markdown("Query every dataset behind this report, either by picking a grouping or by writing SQL.")
+
+
+def guided_query(columns):
+    """Group/filter controls; returns the (sql, params) they describe."""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        table = st.selectbox("Table", list(columns), key="explore_table")
+    names = list(columns[table]['column_name'])
+    numeric = numeric_columns(columns[table])
+    with col2:
+        group_by = st.multiselect("Group by", names, key=f"explore_group_{table}")
+    with col3:
+        function = st.selectbox("Aggregate", AGGREGATE_FUNCTIONS, key="explore_function")
+        measured = st.multiselect("Of", numeric, key=f"explore_measures_{table}")
+
+    filters = []
+    if st.checkbox("Filter rows", key="explore_filter"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            column = st.selectbox("Column", names, key=f"explore_filter_column_{table}")
+        with col2:
+            operator = st.selectbox("Condition", FILTER_OPERATORS, key="explore_filter_operator")
+        with col3:
+            if column in numeric and operator != "contains":
+                value = st.number_input("Value", value=0.0, key="explore_filter_number")
+            else:
+                value = st.text_input("Value", key="explore_filter_text")
+        filters.append((column, operator, value))
+
+    measures = [(function, column) for column in measured]
+    if group_by and not measures:
+        measures = [("count", "*")]
+    sql, params = build_query(table, group_by, measures, filters)
+    st.code(sql, language="sql")
+    return sql, params
+
+
+@st.fragment
+@profiled_fragment("Explore")
+def explore_section():
+    """Query builder and paged results; its controls rerun only this section."""
+    try:
+        columns = table_columns()
+    except RuntimeError as e:
+        st.info(str(e))
+        return
+
+    with st.expander("Tables and columns"):
+        for table, table_frame in columns.items():
+            st.markdown(f"**{table}**: " + ", ".join(f"`{name}`" for name in table_frame['column_name']))
+
+    mode = st.radio("Query with", ["Guided builder", "SQL"], horizontal=True, key="explore_mode")
+    if mode == "SQL":
+        sql = st.text_area("SQL", EXAMPLE_QUERY, height=160, key="explore_sql")
+        params = []
+    else:
+        sql, params = guided_query(columns)
+
+    # A new query starts again from its first page
+    query = (sql, tuple(params))
+    if st.session_state.get("explore_query") != query:
+        st.session_state["explore_query"] = query
+        st.session_state["explore_page"] = 1
+
+    try:
+        result = run_query(sql, params, page=st.session_state.get("explore_page", 1))
+    except QueryError as e:
+        st.error(f"Query failed: {e}")
+        return
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.number_input(f"Page (of {result.page_count})", min_value=1, max_value=result.page_count,
+                        key="explore_page")
+    with col2:
+        st.caption(f"{result.total_rows:,} rows, {PAGE_SIZE} per page; "
+                   f"this page took {result.seconds * 1000:,.0f} ms")
+    st.dataframe(result.rows, hide_index=True, width="stretch")
+
+
+explore_section()
@@ -0,0 +1,149 @@
+"""Global Context: Vanuatu's Happy Planet Index standing against other countries."""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from data_loader import frame_fingerprint, load_dataset
+from figure_payload import plotly_chart
+from hpi_rankings import HPI_METRICS, get_hpi_rankings, mark_highlights
+from profiler import mark, profiled_fragment
+from visualizations import lazy_tabs, session_figure
+
+
+# -----------------------------------------------------------------------------
+# Vanuatu in Global Context (HPI and Comparisons)
+# -----------------------------------------------------------------------------
+mark("Global context")
+st.header("Vanuatu in Global Context")
+st.markdown("""
+Vanuatu consistently ranks high in the Happy Planet Index (HPI), reflecting relatively strong well-being outcomes paired with a low ecological footprint. In contrast, countries with high per-capita consumption (like the United States) often rank lower. This suggests that Vanuatu's focus on social cohesion, cultural vitality, and environmental stewardship aligns with broader measures of sustainable well-being. Educational policy in Vanuatu contributes to this balance by emphasizing community and environment, rather than purely economic metrics.
+""")
+
+
+# Rows shown around each highlighted country, and per page when browsing
+RANKING_WINDOW_RADIUS = 5
+RANKING_PAGE_SIZE = 15
+HIGHLIGHT_COLORS = {
+    'primary': 'background-color: #F3E5F5',
+    'secondary': 'background-color: #FFF3E0',
+}
+
+
+@st.fragment
+@profiled_fragment("Global context")
+def global_context_section():
+    """HPI comparison; choosing a country reruns only this section."""
+    try:
+        hpi_data = load_dataset("HPI")
+    except Exception as e:
+        st.error(f"Error loading HPI data: {e}")
+        return
+
+    # Keyed on the frame itself, so the rankings always match the data they were built from
+    hpi_version = frame_fingerprint(hpi_data)
+    rankings = get_hpi_rankings(hpi_data, hpi_version)
+    
+    available_countries = sorted(hpi_data['country'].unique().tolist())
+    default_country = "United States" if "United States" in available_countries else available_countries[0]
+    user_country = st.selectbox(
+        "Select a country for comparison:", 
+        available_countries, 
+        index=available_countries.index(default_country)
+    )
+    
+    metric_tabs = lazy_tabs(list(HPI_METRICS.keys()), key="hpi_metric_tabs")
+    
+    for (metric_tab, is_open), (metric, info) in zip(metric_tabs, HPI_METRICS.items()):
+        # Only the open tab is built; the others are filled in when selected
+        if not is_open:
+            continue
+        with metric_tab:
+            # Reference countries are lookups into the precomputed rankings
+            total_countries = rankings.total(metric)
+            vanuatu_standing = rankings.lookup('Vanuatu', metric)
+            user_country_standing = rankings.lookup(user_country, metric)
+            
+            col1, col2 = st.columns([2,1])
+            
+            with col1:
+                st.write(f"**{info['description']}**")
+                if vanuatu_standing is not None:
+                    st.write(f"Vanuatu ranks **{vanuatu_standing.rank}** out of {total_countries} countries")
+                if user_country_standing is not None:
+                    st.write(f"{user_country} ranks **{user_country_standing.rank}** out of {total_countries} countries")
+                
+                def build_metric_chart():
+                    # Top/bottom 10 countries plus Vanuatu and the selected country, best first
+                    plot_data = rankings.chart_rows(metric, ['Vanuatu', user_country], n=10)
+                    plot_data = plot_data.rename(columns={'value': metric})
+                
+                    # Create the bar chart
+                    color_scale = px.colors.sequential.YlGn_r if info['inverse'] else px.colors.sequential.YlGn
+                    fig = px.bar(
+                        plot_data,
+                        x='country',
+                        y=metric,
+                        title=f'{"Lowest" if info["inverse"] else "Highest"} Values for {metric}',
+                        color=metric,
+                        color_continuous_scale=color_scale
+                    )
+                
+                    fig.update_layout(
+                        showlegend=False,
+                        xaxis=dict(
+                            tickangle=45,
+                            tickmode='array',
+                            tickvals=plot_data['country'],
+                            ticktext=[
+                                f'<b>{c}</b>' if c in ['Vanuatu', user_country] else c 
+                                for c in plot_data['country']
+                            ]
+                        ),
+                        height=500,
+                        margin=dict(b=100)
+                    )
+                    return fig
+
+                fig = session_figure(("hpi", metric), (user_country, hpi_version), build_metric_chart)
+                plotly_chart(fig, width="stretch")
+            
+            with col2:
+                st.write("Rankings (sorted by performance):")
+                
+                # Only a window of the ranking is sent: rows around Vanuatu and the
+                # selected country, or one page of the full table
+                view = st.radio(
+                    "Show", ["Around highlighted countries", "Browse all"],
+                    horizontal=True, key=f"hpi_view_{metric}", label_visibility="collapsed"
+                )
+                if view == "Browse all":
+                    page = st.number_input(
+                        f"Page (of {rankings.page_count(metric, RANKING_PAGE_SIZE)})",
+                        min_value=1, max_value=rankings.page_count(metric, RANKING_PAGE_SIZE),
+                        value=rankings.page_of('Vanuatu', metric, RANKING_PAGE_SIZE),
+                        key=f"hpi_page_{metric}"
+                    )
+                    window = rankings.page_rows(metric, page, RANKING_PAGE_SIZE)
+                else:
+                    window = rankings.window_rows(metric, ['Vanuatu', user_country], radius=RANKING_WINDOW_RADIUS)
+                
+                window = mark_highlights(window, 'Vanuatu', user_country)
+                display_data = window[['country', 'display', 'ranking']].rename(columns={'display': metric})
+                
+                # Row colours come straight from the precomputed highlight column
+                row_colors = window['highlight'].map(HIGHLIGHT_COLORS).fillna('').to_numpy()
+                styles = pd.DataFrame(
+                    np.repeat(row_colors[:, None], display_data.shape[1], axis=1),
+                    index=display_data.index, columns=display_data.columns
+                )
+                st.dataframe(
+                    display_data.style.apply(lambda _: styles, axis=None),
+                    hide_index=True,
+                    width="stretch"
+                )
+                
+                st.caption("Vanuatu and the selected country are highlighted.")
+
+
+global_context_section()
@@ -0,0 +1,534 @@
+"""Overview: executive summary, historical background, curriculum reforms and recommendations."""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from figure_payload import plotly_chart
+from profiler import mark
+
+
+mark("Header and summary")
+# Report Header and Executive Summary
+col1, col2 = st.columns([3, 1])
+
+with col1:
+    st.title("State of Education in Vanuatu: Comprehensive Analysis")
+    st.markdown("*EDUC 310 Final Project - Ada Carter University of Washington*")
+    
+    # -----------------------------------------------------------------------------
+    # Executive Summary
+    # -----------------------------------------------------------------------------
+    st.header("Executive Summary")
+    st.markdown("""
+    ### Executive Summary
+    Vanuatu's education system has been the focus of ongoing reforms aimed at enhancing teaching quality, strengthening multilingual pedagogies, integrating traditional ecological knowledge (TEK), and improving student learning outcomes. Positioned within a broader context of cultural and linguistic diversity, as well as unique environmental challenges, these reforms have sought to address high attrition rates and notable disparities in educational access between provinces.
+
+    **Key Findings**  
+    1. **Decolonizing Educational Frameworks**  
+       - Vanuatu's postcolonial journey includes a gradual shift toward valuing vernacular languages, Bislama, 
+         and culturally grounded curricula. Early-childhood instruction in local languages supports student engagement 
+         and literacy development. Over time, these policies reflect an effort to decolonize education by embracing 
+         indigenous languages and knowledge.  
+
+    2. **Curriculum and TEK Integration**  
+       - Recent curriculum reforms emphasize learner-centered methods and the inclusion of TEK. These changes help reinforce 
+         cultural identity and environmental stewardship, reflecting a broader move toward holistic, context-relevant education. 
+         By embedding local knowledge of ecosystems and practices into lessons, schools foster students' connection to their 
+         heritage and surroundings.  
+
+    3. **Teacher Development and Sustainability**  
+       - Professional development initiatives have led to improved teaching quality and inclusive practices. However, 
+         challenges persist, especially for rural and remote schools, highlighting the need for sustained investment 
+         and follow-up support. Limited resources and geographic isolation mean that ongoing mentorship and equitable 
+         distribution of materials remain critical for long-term success.
+
+    Additional sections below detail Vanuatu's historical and policy context, language-in-education practices, 
+    gender equity considerations, resource distribution, demographic trends, and recommendations for future 
+    directions.
+    """)
+
+with col2:
+    # Create iframe for OpenStreetMap - zoomed in on Vanuatu
+    st.markdown("""
+    <iframe width="100%" height="800" frameborder="0" scrolling="no" marginheight="10" marginwidth="0"
+    src="https://www.openstreetmap.org/export/embed.html?bbox=166.0,-20.0,169.0,-14.0&layer=mapnik&marker=-16.5,167.5">
+    </iframe>
+    """, unsafe_allow_html=True)
+
+# -----------------------------------------------------------------------------
+# Expanded Introduction and Historical Context
+# -----------------------------------------------------------------------------
+mark("Historical background")
+st.subheader("Introduction and Historical Background")
+
+col1, col2 = st.columns([1,1])
+
+with col1:
+    # Create language distribution pie chart
+    language_data = pd.DataFrame({
+        'Language': ['Indigenous Languages', 'Bislama', 'English', 'French'],
+        'Percentage': [82.6, 14.5, 2.1, 0.8]
+    })
+
+    fig = px.pie(
+        language_data, 
+        values='Percentage', 
+        names='Language',
+        title='Language Distribution in Vanuatu (2020)',
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(
+        title_x=0.5,
+        margin=dict(t=50, b=20, l=20, r=20)
+    )
+    plotly_chart(fig, width="stretch")
+
+with col2:
+    st.markdown("""
+    ### Introduction and Historical Background
+    Vanuatu stands out as a nation with an exceptional level of linguistic diversity; with an estimated 138 indigenous languages, it has the world's highest linguistic density​ of over 82% of the population primarily speaks one of these 100+ indigenous languages, alongside Bislama (a creole lingua franca blending colonial and indigenous influences). Despite this rich linguistic tapestry, Vanuatu officially recognizes only three languages: English, French, and Bislama. This discrepancy between a diverse spoken landscape and a limited set of official languages presents inherent challenges in the education system. The disparity complicates standardized instruction and curriculum development. Creating educational materials and training teachers to effectively teach in so many languages is a complex undertaking. This can lead to inequities in access and outcomes, potentially marginalizing students who do not speak the official languages. The challenge lies in finding innovative, culturally sensitive approaches that harness linguistic diversity while ensuring all students have access to quality education.
+    """)
+
+st.markdown("""
+
+""")
+
+st.markdown("""
+### Independence Movement and Self-Reliance Ideology
+Vanuatu's 1970s independence movement was deeply influenced by socialist and anti‑colonial ideas. The leading party, Vanua'aku Pati (VP), espoused a philosophy of self‑reliance and Melanesian socialism as an alternative to colonial dependency. Father Walter Lini—an Anglican priest and the first Prime Minister—was a key figure who openly embraced socialist ideals in a Melanesian context (Premdas, 1987). He drew inspiration from leaders like Tanzania's Julius Nyerere, frequently praising "the good thoughts" of his "comrade Nyerere" in speeches (Premdas, 1987). Lini's concept of Melanesian socialism blended communal indigenous values with Christian and socialist principles, emphasizing collective welfare, egalitarian decision-making, and local empowerment (Premdas, 1987). This ideological foundation framed education as a tool for nation‑building and self‑determination, rejecting the notion that development should mirror former colonial powers' models.
+""")
+
+# Create tabs for detailed education reforms content
+reform_era_tabs = st.tabs([
+    "Radical Reforms (1980s)", 
+    "Lini's Influence", 
+    "Evolution & Challenges",
+    "Kastom & Modern Values",
+    "Reform Legacy"
+])
+
+with reform_era_tabs[0]:
+    st.markdown("""
+    Upon achieving independence in 1980, the new government moved swiftly to reshape the education system along self‑reliant lines. The dual British–French colonial school networks were unified under a national Ministry of Education, and officials aimed to indigenize curricula and expand access (David, 2020). Prime Minister Lini's first education plan made primary schooling compulsory for ages 6–11 and targeted a 20% increase in primary schools (David, 2020). 
+    
+    Crucially, these quantitative goals were tied to a radical qualitative shift: colonial curricula were to be overhauled to serve local needs (David, 2020). It was "no longer a question of bringing children the 'enlightenment' of British or French education, but of preparing them to take charge of their country" (David, 2020). Schools were encouraged to teach practical skills and local content so that graduates could use their knowledge for rural community development rather than migrating to towns (David, 2020). 
+    
+    Education was seen as a "lever of development" to foster self‑sufficient villages—for example, by training youth to become farmers, artisans, or entrepreneurs who would revitalize the local economy (David, 2020). This early post‑independence vision explicitly linked education with economic self‑reliance and the reduction of colonial‑era inequalities.
+    """)
+
+with reform_era_tabs[1]:
+    st.markdown("""
+    ### Vanua'aku Pati and Father Lini's Influence
+    The socialist-oriented Vanua'aku Pati government under Father Walter Lini was the driving force behind these transformative policies. Lini's personal influence ensured that Melanesian socialism was more than rhetoric—it informed concrete reforms in schooling, land, and local governance (Premdas, 1987). For instance, the VP's development slogan of the 1980s centered on achieving economic self-reliance, and education was reoriented to support this national goal (David, 2020)​. Lini believed education should produce citizens capable of "self-help" and stewardship of their resources, reflecting both Marxist and Christian principles of social justice (David, 2020). Under his leadership, the government promoted vernacular literacy programs and rural training centers to reach communities outside the formal school system (McCormick, 2016; Premdas, 1987)​. Organizations such as the Vanuatu Rural Development Training Centres Association (VRDTCA) emerged to provide non-formal education in villages, teaching basic vocational skills to those with little formal schooling. By empowering local people through education, Lini and the Vanua'aku Pati saw themselves as fostering a "Melanesian renaissance"—a revival of indigenous values and knowledge suppressed under colonial rule (McCormick, 2016; Premdas, 1987).
+    """)
+
+with reform_era_tabs[2]:
+    st.markdown("""
+    ### Challenges and Evolution of Education Policy
+    Despite the bold start, implementing these radical reforms proved challenging over time. Vanuatu's small size and colonial legacy created practical constraints that tempered the revolution in education. Scholars note that formal, Western-style educational planning often clashed with local cultural realities; the process "has often been subverted by tensions based in local cultural contexts" (Hindson, 1995)​. In the early 1980s, political strains including a secessionist revolt on Espiritu Santo in 1980 and later frequent changes of government hindered steady progress in the education sector (Hindson, 1995). The inherited bilingual system (with distinct English and French streams) also complicated unified policy-making (Hindson, 1995). As the 1990s unfolded, economic austerity under the Comprehensive Reform Program (1997) reduced public spending, affecting schools and staffing. Many of Lini's socialist initiatives (e.g. cooperatives and communal development schemes) waned amid a turn to market-oriented policies. 
+    Yet the core ideals did not disappear. Community-based education efforts and church-run schools continued to instill values of service and self-help at the local level.By the early 21st century, the government re-emphasized education access and equity — notably introducing fee-free primary education in 2010 to uphold the principle that basic education is a universal right (School‑Community Relations and Fee‑Free Education Policy in Vanuatu, n.d.)​. The balance between the revolutionary zeal and practical realities led to a hybrid approach: while standard curricula and donor-driven projects took root, Vanuatu also sought to preserve the spirit of independence-era reforms wherever possible.
+    """)
+
+st.markdown("### Timeline of Key Educational Developments")
+mark("Education timeline")
+# Prepare timeline data with key events only
+timeline_data = [
+    {"year": "1980", "numeric_year": 1980, "short_label": "Independence", 
+     "event": "Independence achieved; dual British-French school systems unified"},
+    {"year": "1985", "numeric_year": 1985, "short_label": "Vernacular programs", 
+     "event": "Vernacular literacy programs and rural training centers established"},
+    {"year": "1997", "numeric_year": 1997, "short_label": "Economic reforms", 
+     "event": "Comprehensive Reform Program introduces economic austerity"},
+    {"year": "2010", "numeric_year": 2010, "short_label": "Fee-free education", 
+     "event": "Fee-free primary education introduced"},
+    {"year": "2012", "numeric_year": 2012, "short_label": "Traditional economy", 
+     "event": "National Council of Chiefs advocates for 'traditional economy' in curriculum"},
+    {"year": "2015", "numeric_year": 2015, "short_label": "Vernacular integration", 
+     "event": "Increased integration of vernacular languages in early education"}
+]
+
+# Convert list to DataFrame and sort chronologically
+timeline_df = pd.DataFrame(timeline_data)
+timeline_df = timeline_df.sort_values('numeric_year')
+
+fig = go.Figure()
+# Create alternating positions above and below the timeline
+for i, row in timeline_df.iterrows():
+    y_val = 0.5 if i % 2 == 0 else -0.5
+    
+    # Define text position before using it
+    text_pos = "top center" if i % 2 == 0 else "bottom center"
+    
+    # Add marker and label
+    fig.add_trace(go.Scatter(
+        x=[row["numeric_year"]],
+        y=[y_val],
+        mode="markers+text",
+        marker=dict(
+            size=14,
+            color="#2b5797",
+            line=dict(width=2, color="DarkSlateGrey")
+        ),
+        text=[row["short_label"]],
+        textposition=text_pos,
+        hovertext=f"<b>{row['year']}</b><br>{row['event']}",
+        hoverinfo="text"
+    ))
+    text_pos = "top center" if i % 2 == 0 else "bottom center"
+    
+    # Add dotted line connector
+    fig.add_shape(
+        type="line",
+        x0=row["numeric_year"],
+        y0=0,
+        x1=row["numeric_year"],
+        y1=y_val,
+        line=dict(color="gray", width=1, dash="dot")
+    )
+    
+    # Add marker and label
+    fig.add_trace(go.Scatter(
+        x=[row["numeric_year"]],
+        y=[y_val],
+        mode="markers+text",
+        marker=dict(
+            size=14,
+            color="#2b5797",
+            line=dict(width=2, color="DarkSlateGrey")
+        ),
+        text=[row["short_label"]],
+        textposition=text_pos,
+        hovertext=f"<b>{row['year']}</b><br>{row['event']}",
+        hoverinfo="text"
+    ))
+
+# Define timeline bounds
+min_year = timeline_df['numeric_year'].min() - 2
+max_year = timeline_df['numeric_year'].max() + 2
+
+# Draw the main timeline
+fig.add_shape(
+    type="line",
+    x0=min_year,
+    y0=0,
+    x1=max_year,
+    y1=0,
+    line=dict(color="gray", width=2)
+)
+
+# Update layout for a more compact display - removed decade markers and year labels
+fig.update_layout(
+    template="simple_white",
+    showlegend=False,
+    xaxis=dict(
+        title="Year",
+        range=[min_year, max_year],
+        tickmode="linear",
+        dtick=10,
+        zeroline=False,
+        showticklabels=False  # Hide the year labels on the x-axis
+    ),
+    yaxis=dict(visible=False, range=[-0.8, 0.8]),
+    margin=dict(l=20, r=20, t=30, b=50),
+    height=350,
+    hoverlabel=dict(bgcolor="white", font_size=14)
+)
+
+plotly_chart(fig, width="stretch")
+
+
+st.markdown("""
+### Kastom, Melanesian Values, and Contemporary Reforms
+
+In the 21st century, Vanuatu's education policy continues to be shaped by the ideals of self-determination and respect for kastom (customary culture). The discourse of decolonizing education remains prominent, invoked by policymakers and civil society alike (McCormick, 2016). Recent national plans explicitly reference the importance of indigenous knowledge and languages in schooling.
+
+In 2012, the National Council of Chiefs (Malvatumauri) successfully advocated for recognizing the "traditional economy"—subsistence agriculture, customary exchanges, and indigenous skills—as a foundation for the national curriculum and development strategy (McCormick, 2016). This shows a continued effort to value local ways of learning and living alongside formal education.
+
+As a result, early-grade instruction in many schools now includes vernacular languages and cultural content, helping bridge students' community life with academic learning. Such measures echo the original post-independence aim of aligning education with Melanesian values. Studies confirm that the "decolonising discourses of self‑reliance" from the independence era still inform Vanuatu's education and development policies today (McCormick, 2016).
+
+In practice, schools are encouraged to work with local communities, use local examples in teaching, and produce graduates who are not only globally competent but also firmly rooted in their culture and capable of contributing to their villages.
+
+### Legacy of Early Reforms and Key Modern Figures
+
+The legacy of Vanuatu's early socialist education reforms is visible in contemporary policy and leadership. Concepts like **self-reliance**, **community participation**, and **social equity** remain cornerstones of educational planning. Modern leaders and scholars have rejuvenated these themes in current initiatives.
+
+For instance, politician Ralph Regenvanu has championed the preservation of kastom and promoted the idea of a kastom-based education as part of a broader "traditional economy" revival (McCormick, 2016). Likewise, educators at tertiary institutions such as the University of the South Pacific continue to emphasize Melanesian pedagogy—teaching methods that integrate storytelling, communal activities, and respect for elders—reflecting Vanuatu's cultural context.
+
+The Ministry of Education's vision statement today still calls for students to gain "the skills, values, and confidence to be self‑reliant," underscoring continuity with the independence generation's goals. In recent years, Vanuatu has navigated global education agendas (e.g., the Sustainable Development Goals) on its own terms: policymakers engage with international standards but filter them through local priorities of resilience and self-determination (McCormick, 2016).
+
+In summary, while the revolutionary zeal of the 1970s–80s has been tempered by experience, Vanuatu's 21st-century education system remains guided by the ethos of Melanesian socialism—valuing communal welfare, cultural pride, and the capacity for Ni-Vanuatu to shape their own future through education (McCormick, 2016).
+""")
+
+# -----------------------------------------------------------------------------
+# Curriculum Reforms, TEK, and Teacher Development (Inserted from Report)
+# -----------------------------------------------------------------------------
+mark("Curriculum reforms")
+st.subheader("Curriculum Reforms and TEK Integration")
+st.markdown("""
+Recent curriculum reforms aim to improve teaching quality and student engagement by promoting learner-centered pedagogies (Cassity, Cheng, & Wong, 2021; Cassity, Chainey, Cheng, & Wong, 2022; Cassity, Wong, Wendiady, & Chainey, 2023). Key elements of these reforms include:
+
+- **Professional Development of Teachers**: Training modules designed to strengthen lesson planning, encourage collaborative learning, and incorporate local cultural contexts​. This ongoing professional development has improved instructional quality, although consistent follow-up is needed to support teachers in remote areas (Cassity et al., 2023)​
+- **Language Transition Skills**: Programs supporting teachers and students in navigating the transition from vernacular languages and Bislama in early years to English or French in later grades, aligning with national bilingual policies​. These help bridge early learning in mother tongues with proficiency in the official languages.
+- **Inclusion of Traditional Ecological Knowledge (TEK)**: Efforts to embed local knowledge of ecosystems, agriculture, and cultural practices into science and social studies content. This approach fosters cultural pride, community engagement, and environmental awareness​. For example, lessons incorporate knowledge of medicinal plants or traditional farming techniques (McCarter & Gavin, 2011), connecting students with indigenous wisdom as part of their formal learning.
+
+However, challenges such as limited locally-developed resources, geographical isolation, and variable post-training support underline the need for more sustainable, consistently funded professional learning frameworks (Cassity et al., 2023)​. Ensuring that curriculum reforms take hold across all islands will require continued collaboration between the Ministry of Education, communities, and international partners.
+""")
+
+st.subheader("Language-in-Education Practices")
+st.markdown("""
+#### Bislama and Vernacular Languages
+Research has shown the importance of mother-tongue instruction in Vanuatu's early education. Daly and Barbour (2019) show that teachers and community members find vernacular-based instruction crucial for early engagement and literacy, although pressures from national exams and global forces still push the use of English or French in later grades​. Vandeputte-Tavo (2013) observes that acceptance of Bislama as a medium of instruction varies; debates continue over whether Bislama should serve as a primary language of instruction or only as a support language​. Willans (2015) documents practical strategies teachers use to blend local languages with English or French to ensure comprehension, essentially code-switching to help students grasp content​.
+
+#### Multilingualism in Practice
+While official policy supports local languages in education, classroom practices differ widely. Some teachers struggle with limited teaching materials in vernacular languages, while others successfully integrate community knowledge and languages to make lessons more relevant and inclusive. Multilingual education in Vanuatu is therefore implemented unevenly: in some schools, young children learn to read and write in their native tongue before adding English or French; in others, the colonial languages dominate from the start. The tension between policy and practice in multilingual education reflects ongoing negotiation between the advantages of mother-tongue instruction and the perceived socioeconomic opportunities tied to English and French​. Strengthening teacher training and providing resources in local languages are seen as vital steps to move multilingual education forward (Willans, 2013, 2015).
+""")
+
+st.subheader("Decolonization of Schooling in Vanuatu")
+st.markdown("""
+#### Colonial Legacy and Independence
+Vanuatu's education system was shaped by its unique colonial history as an Anglo-French Condominium. At independence in 1980, the new nation inherited two separate school systems – one English-medium (British) and one French-medium – which created linguistic and cultural divisions in Ni-Vanuatu society. Francophone and Anglophone communities often attended different schools with different curricula, leading to cleavages in educational experience​. After independence, the government recognized that these parallel colonial-era structures were inefficient and divisive, and it began efforts to unify the education administration. Over time, the formerly separate British and French education bureaucracies merged under a single Ministry of Education, culminating in the Education Act of 2014 which formally established one national system instead of two​. This was a crucial step in decolonizing Vanuatu's schooling. Nonetheless, remnants of the dual system persist, most visibly in the continued use of English and French as parallel languages of instruction in schools.
+
+#### Vernacular Languages and Culturally Relevant Curriculum
+A cornerstone of decolonizing education in Vanuatu has been the promotion of indigenous languages and knowledge in the classroom. Since independence, educators and policymakers have debated how to reduce reliance on colonial languages (English and French) and better integrate Bislama and vernacular languages (the mother tongues of Ni-Vanuatu) into schooling​. In the late 1990s, this debate led to concrete action. The Education Master Plan 2000–2010 recommended introducing local languages in early education, prompting the government to draft a National Vernacular Education Policy in 1999. Pilot programs were launched in which children were taught in their mother tongue during the first years of primary school, with English or French introduced later​. This marked a radical shift from the colonial model where European languages dominated from Grade 1. By the mid-2010s, the Ministry of Education formally encouraged bilingual literacy: children start schooling in a vernacular language or Bislama, then gradually transition to English or French in later grades​.
+
+This bilingual policy is decolonizing in that it validates Ni-Vanuatu linguistic heritage within formal education, rather than privileging only the former colonial tongues.
+
+#### Indigenous Knowledge and "Kastom" in Schools
+Alongside language changes, Vanuatu has sought to indigenize the curriculum by incorporating kastom (traditional knowledge, values, and practices) into education. There was growing recognition that Western-style schooling had marginalized local culture, leading to calls for contextualizing the curriculum to Vanuatu's realities​. Researchers noted that the lack of vernacular language use and local content in schools contributed to the erosion of traditional knowledge in communities. In response, the Vanuatu Cultural Centre and education authorities initiated curriculum reforms around 2010 to infuse courses with traditional ecological knowledge, local history, music, and arts​. 
+
+These efforts aimed to ensure that what students learn in school resonates with their heritage and community life.
+""")
+
+# Add tabbed interface with key reforms
+reform_tabs = st.tabs(["Unified Administration", "Language Policy", "Bilingual Curriculum", "Integration of Kastom"])
+
+with reform_tabs[0]:
+    st.markdown("""
+    ### Unified Education Administration (1980s–2010s)
+    Merging the dual French/English school systems into one national system under the Ministry of Education, culminating 
+    in the Education Act 2014. This eliminated parallel curricula and governance, creating a more cohesive national 
+    education structure.
+    """)
+
+with reform_tabs[1]:
+    st.markdown("""
+    ### National Language Policy (1999–2005)
+    Development of a vernacular language in education policy to introduce indigenous languages (and Bislama, the lingua franca) 
+    as languages of instruction in early primary grades. By using children's first languages in schooling, this policy aims to 
+    improve literacy and preserve local languages that were previously excluded from formal classrooms.
+    """)
+
+with reform_tabs[2]:
+    st.markdown("""
+    ### Bilingual Curriculum Reform (2010s)
+    Implementation of a new bilingual national curriculum that balances English and French and incorporates vernacular instruction. 
+    Students now begin learning in their mother tongue or Bislama, then gradually transition to English or French, an approach 
+    designed to strengthen foundational learning and bridge to colonial languages.
+    """)
+
+with reform_tabs[3]:
+    st.markdown("""
+    ### Integration of Kastom and Local Content (2010–present)
+    Ongoing revision of curricula to include traditional knowledge, cultural skills, and local examples across subjects. 
+    The National Curriculum Framework emphasizes Vanuatu's cultural heritage, and partnerships with the Vanuatu Cultural 
+    Centre have helped produce teaching resources on kastom. For instance, local stories and environmental knowledge are 
+    used to contextualize literacy and science lessons, validating indigenous perspectives in formal education.
+    """)
+
+st.subheader("Education for Resilience and Sustainable Development")
+st.markdown("""
+Vanuatu's extreme vulnerability to natural hazards (cyclones, earthquakes, volcanic activity) demands robust disaster risk reduction (DRR) education​. Yet historically, formal curricula introduced topics like climate change and disaster preparedness only in later years of schooling, limiting exposure for younger students. Experts suggest that integrating resilience concepts and traditional knowledge at earlier grade levels could strengthen community-level preparedness and adaptive capacity​. For example, lessons for primary-age children can include identifying traditional environmental warning signs and practicing safety drills, so that resilience becomes part of foundational learning.
+
+Incorporating traditional ecological knowledge (TEK) into sustainability education is also seen as vital. McCarter and Gavin (2011) emphasize including ethnobiological knowledge—such as medicinal plants and local agricultural practices—as part of the mainstream curriculum​. This approach enriches science education, fosters local pride, and addresses real-world community challenges by linking classroom learning to the students' own environment. By learning how past generations managed natural resources and coped with environmental stress, students gain tools that are directly relevant to issues like climate change and food security.
+""")
+
+st.subheader("Marine Resources and Curriculum Integration")
+st.markdown("""
+Another critical aspect of sustainable education in Vanuatu is the integration of marine resources and maritime knowledge into curricula. As an island nation, Vanuatu’s economy and cultural practices are closely tied to the ocean, and educational programs have increasingly reflected this connection. For instance, the Vanuatu Maritime College, established in 1999, provides competency‐based training in near‐coastal seamanship, fishing operations, and marine safety, thereby aligning vocational education with the country’s maritime needs (FAO, n.d.-a). These programs range from rural fishing skills to certification of crew for international shipping, ensuring that local people can acquire skills for employment in fishing industries and seafaring careers without leaving Vanuatu (FAO, n.d.-b).
+At the primary and secondary school levels, efforts have been made to include marine conservation and resource management in the curriculum. A Teachers’ Resource Kit on Fisheries for Vanuatu (introduced in 2017) integrates fisheries and marine ecology topics into lessons, linking national curriculum objectives with local knowledge of ocean life (SPCCFPSTORE1.blob.core.windows.net, n.d.-a). The kit provides information sheets and activity guides on subjects such as fish species, aquaculture, sustainable fishing practices, and the impacts of climate change on marine ecosystems (SPCCFPSTORE1.blob.core.windows.net, n.d.-b). Community and NGO-led initiatives also complement formal curricula in promoting ocean literacy. For example, conservation groups carry out school programs that teach children—through games and interactive sessions—the importance of protecting marine environments from overfishing and other human-induced changes (OceansWatch.org, n.d.).
+""")
+
+# -----------------------------------------------------------------------------
+# Insights and Interventions
+# -----------------------------------------------------------------------------
+mark("Insights and recommendations")
+st.header("Insights and Interventions")
+st.markdown("""
+Integrating traditional ecological knowledge (TEK) and local languages from the earliest stages of education can help children and families see schooling as culturally relevant, potentially mitigating late entry and dropout. When the curriculum reflects students' home culture and language, parents are often more supportive of sending young children to school on time, and students themselves feel a greater sense of belonging. Early childhood programs that use local language and culturally familiar content have shown promise in easing the transition into formal education. Additionally, flexible initiatives like "second-chance education" or community-based classes allow over-age learners to re-enter schooling or gain basic literacy outside the formal system. Vanuatu's strong tradition of community involvement is an asset here: villages, chiefs, and church groups have been mobilized in some areas to encourage every child of school age to attend. Going forward, continued monitoring of age-specific enrollment patterns through the Vanuatu Education Management Information System (OpenVEMIS) will be important to identify where progress is being made and where gaps remain.
+""")
+
+# -----------------------------------------------------------------------------
+# Recommendations and Future Directions
+# -----------------------------------------------------------------------------
+st.header("Recommendations and Future Directions")
+st.markdown("""
+Based on the comprehensive analysis above and the findings of multiple studies, the following actions are recommended to strengthen education in Vanuatu:
+
+### Short-term Recommendations
+
+1. **Sustain Teacher Professional Development**: Establish localized mentoring and refresher courses, ensuring teachers in remote areas have consistent, ongoing support. This could involve experienced mentors traveling to outer islands periodically, and creating peer support networks using radio or mobile phone communication for teachers to share experiences.
+
+2. **Enhance Resource Distribution**: Prioritize the distribution of bilingual and vernacular-language teaching materials to underserved provinces. In the immediate term, an audit of textbook availability by language and location should be conducted, with emergency supplies sent to schools that lack core materials.
+
+### Medium-term Strategies
+
+1. **Integrate TEK and Resilience Education**: Strengthen curriculum content around disaster preparedness and climate change at earlier grade levels. Collaborate with local experts and community elders to formalize TEK-based lesson plans so that traditional knowledge (e.g., safe building practices, food preservation methods) becomes part of the taught curriculum.
+
+2. **Improve Data Monitoring**: Invest in the Vanuatu Education Management Information System (OpenVEMIS) to ensure up-to-date and accurate data on enrollment, teacher qualifications, and learning outcomes. Better data will enable more responsive policy adjustments and resource allocation to where needs are greatest.
+
+### Long-term Vision
+
+1. **Consolidate Multilingual Education**: Continue refining language-in-education policy to balance the benefits of vernacular instruction with the economic and global opportunities linked to English and French. This could mean extending bilingual education into higher grade levels and providing pathways for students to become truly trilingual (local language, Bislama, and English/French) by the end of secondary school.
+
+2. **Develop Culturally Anchored Curriculum**: Embed local customs, traditional authority structures, and ecological knowledge across subjects to reinforce community identity and sustainable development. A long-term goal is a curriculum that fully reflects Vanuatu's unique cultural context while equipping students with skills for the modern world. This includes engaging community leaders in curriculum development and review, and periodically updating content to include regional cultural diversity.
+
+Implementing these recommendations will require concerted effort from government agencies, educators, communities, and development partners. Vanuatu's experience since independence shows that educational change is most effective when it involves local voices and adapts global ideas to local realities. By building on the progress made and addressing the gaps with culturally informed strategies, Vanuatu can continue to move toward an inclusive and resilient education system for all Ni-Vanuatu.
+""")
+
+# -----------------------------------------------------------------------------
+# Methodology and Data Sources
+# -----------------------------------------------------------------------------
+mark("Methodology and references")
+st.header(" Methodology and Data Sources")
+st.markdown("""
+**Methodology Overview**: This report synthesizes findings from peer-reviewed studies, government policy documents, and educational data analyses. A mixed-methods approach was used, combining quantitative data (enrollment figures, demographic trends, etc.) with qualitative insights (historical and cultural context).
+
+**Quantitative Analysis**: Enrollment numbers, teacher distribution data, age breakdowns, and well-being indices (e.g., HPI rankings) were analyzed using descriptive statistics, trend analysis, and comparative charts. Using python 3.11.2.
+
+**Qualitative Insights**: Literature on colonial/postcolonial influences, language policy, indigenous knowledge integration, and gender factors provided contextual understanding of ongoing reforms and challenges. Interviews and focus group findings from prior studies (e.g., the Barriers to Education Study 2020) were considered to incorporate community perspectives on issues like dropout causes and resource needs.
+
+**Data Sources**: Key sources of data and information included:
+- Vanuatu Ministry of Education and Training (MoET) statistics (for enrollment by year and province, teacher postings, age distributions, etc., including the OpenVEMIS database)
+- Happy Planet Index (HPI) rankings and associated indicators for well-being and sustainability
+- National census data and population projections (2009–2020) for understanding demographic pressures
+- Policy documents such as the Vanuatu Education and Training Sector Strategic Plan 2020–2030 (MoET, 2020) and historical plans (e.g., Education Master Plans) for official targets and frameworks
+- Academic journals and reports covering Vanuatu's education (e.g., Comparative Education, International Education Journal, regional conference papers) for analysis of policy implementation and case studies
+
+**Limitations**: Some limitations should be acknowledged. Geographic constraints and infrastructural limitations can lead to gaps in data collection, particularly in remote islands where record-keeping is challenging and surveys are infrequent. Thus, some statistics (e.g., dropout rates or literacy levels) may be estimated with a margin of error. Also, while policies and reforms are well-documented on paper, real-world implementation varies considerably and can be underreported in official statistics. This analysis tried to account for that by including qualitative evidence from specific communities. Nonetheless, the diversity of Vanuatu's islands means educational experiences are not uniform, and exceptions to the general trends discussed may exist.
+""")
+
+st.markdown("""
+### References 
+
+**Application Form for Diploma in General Nurse Training. (n.d.).** [PDF document]. Retrieved from https://17965218293175009171.googlegroups.com/attach/2ab0d763a40a4/Aplication_Form%20English%20.pdf?part=0.2&vt=ANaJVrEVkJgPvom3cpgumGB4X6c7nkYTUeriTo_ZkxeYqQY78hbrwmfjUpdhH8gva8-Xl1L_HICxmDmFnt8FQUzYzzd0ryfUIXcp2DMvG4B4qaxMr5LQeDM#:~:text=LOCATION%3A%20The%20Vanuatu%20College%20of,all%20the%20people%20in%20Vanuatu
+
+**Cassity, E., Chainey, J., Cheng, J., & Wong, D. (2022).** *Teacher development multi-year study series. 
+Vanuatu: Interim report 2.* Australian Council for Educational Research. https://doi.org/10.37517/978-1-74286-659-8  
+
+**Cassity, E., Cheng, J., & Wong, D. (2021).** *Teacher development multi-year study series. Vanuatu: 
+Interim report 1.* Australian Council for Educational Research. https://doi.org/10.37517/978-1-74286-672-7  
+
+**Cassity, E., Wong, D., Wendiady, J., & Chainey, J. (2023).** *Teacher development multi-year study series. 
+Vanuatu: Final report.* Australian Council for Educational Research. https://doi.org/10.37517/978-1-74286-729-8  
+
+**Cypher Learning. (n.d.).** LMS Best practice: $3.3 million saved with AI-powered course creation. Retrieved from https://www.cypherlearning.com/best-practices/vanuatu-institute-of-technology#:~:text=Image%3A%202024%20Customer%20of%20the,skilled%20labour%20force%20across%20Vanuatu
+
+**Daly, N., & Barbour, J. (2019).** 'Because, they are from here. It is their identity, and it is important': 
+teachers' understanding of the role of translation in vernacular language maintenance in Malekula, Vanuatu. 
+*International Journal of Bilingual Education and Bilingualism, 24,* 1414–1430. https://doi.org/10.1080/13670050.2019.1604625  
+
+**David, G. (2020).** Vanuatu's 40th anniversary: Review of the first decade of political independence from 1980 to 1990. 
+*Pacific Geographies, (54),* 15–24. https://doi.org/10.23791/541524
+
+**DFAT (Australian Government). (2007).** Vanuatu: The Unfinished State – Drivers of Change. Canberra: AusAID/DFAT analysis report.
+
+**FAO. (n.d.-a).** Major fields of interest: Vanuatu Maritime College. Retrieved from https://www.fao.org/4/x7308e/x7308e1n.htm#:~:text=Major%20Fields%20of%20Interest%3A
+
+**FAO. (n.d.-b).** Fishing: Maritime training details. Retrieved from https://www.fao.org/4/x7308e/x7308e1n.htm#:~:text=Fishing%3A
+
+**François, A., Lacrampe, S., Franjieh, M., & Schnell, S. (Eds.). (2015).** *The languages of Vanuatu: Unity and diversity.* 
+Canberra, Australia: Asia-Pacific Linguistics, Australian National University.
+
+**Government of Vanuatu, Ministry of Education and Training (MoET). (2020).** Vanuatu Education and Training Sector Strategic Plan 2020–2030. Port Vila: MoET.
+
+**Hindson, C. E. (1995).** Educational planning in Vanuatu – an alternative analysis. *Comparative Education, 31(3),* 
+327–338. https://doi.org/10.1080/03050069529010  
+
+**MastersPortal. (n.d.).** Vanuatu Institute of Technology | University Info. Retrieved from https://www.mastersportal.com/universities/14651/vanuatu-institute-of-technology.html#:~:text=VIT%20has%20rich%20roots%20reaching,dual%20language%20programs%20in%201980
+
+**McCarter, J., & Gavin, M. (2011).** Perceptions of the value of traditional ecological knowledge to formal 
+school curricula: opportunities and challenges from Malekula Island, Vanuatu. *Journal of Ethnobiology and 
+Ethnomedicine, 7,* 38–38. https://doi.org/10.1186/1746-4269-7-38  
+
+**McCormick, A. (2016).** Vanuatu education policy post-2015: "Alternative", decolonising processes for 
+"development". *International Education Journal: Comparative Perspectives, 15(3),* 16–29.  
+
+**Ministry of Education and Training. (n.d.-a).** Tertiary Education. Retrieved from https://moet.gov.vu/index.php?id=tertiary-education#:~:text=The%20USP%20Emalus%20campus%20is,for%20local%20and%20overseas%20students
+
+**Ministry of Education and Training. (n.d.-b).** Australia-Pacific Technical College overview. Retrieved from https://moet.gov.vu/index.php?id=tertiary-education#:~:text=The%20APTC%20offers%20Australian%20Certificate,Hospitality%20and%20Community%20Services%20areas
+
+**Ministry of Education and Training. (2024).** JAHVC and VAC Cooperation Framework. Retrieved from https://moet.gov.vu/docs/press-releases/ministry/JAHVC%20and%20VAC%20Cooperation%20Framework_08_2024.pdf#:~:text=On%20August%208%2C%202024%2C%20Vanuatu,Director
+
+**Ministry of Education and Training (MoET). (n.d.).** Non-Governmental Organizations in Education – VRDTCA (Vanuatu Rural Development Training Centres Association). Retrieved from https://moet.gov.vu/
+
+**Naidu, S. (2010).** Right to education for all children in Vanuatu – Are girls getting a fair chance? University of Warwick Legal Studies.
+Retrieved from https://warwick.ac.uk/fac/soc/law/elj/lgd/2010_2/naidu/
+
+**National University of Vanuatu. (n.d.-a).** Overview. Retrieved from https://www.univ.edu.vu/en/structure/overview#:~:text=The%20Act%20n%C2%B034%20of%202019,on%20the%2024th%20January%202020
+
+**National University of Vanuatu. (n.d.-b).** Programs and partnerships. Retrieved from https://www.univ.edu.vu/en/structure/overview#:~:text=,Jaur%C3%A8s%20University%20%28Bachelor%20in%20tourism
+
+**OceansWatch.org. (n.d.).** Marine conservation education programs in Vanuatu. Retrieved from OceansWatch.org
+
+**Paviour-Smith, M. (2005).** "Is it Aulua or education dressed up in "kastom"? Ongoing negotiation of literacy and identity in a Ni-Vanuatu community. Current Issues in Language Planning, 6(2), 224–238.
+
+**Pierce, C., & Hemstock, S. (2021).** Resilience in Formal School Education in Vanuatu: A Mismatch with 
+National, Regional and International Policies. *Journal of Education for Sustainable Development, 15,* 
+206–233. https://doi.org/10.1177/09734082211031350  
+
+**Pierce, C., & Hemstock, S. (2022).** Cyclone Harold and the role of traditional knowledge in fostering resilience in Vanuatu. 
+*Australasian Journal of Disaster and Trauma Studies, 26(1),* 41–56. Retrieved from http://trauma.massey.ac.nz/issues/2022-1/AJDTS_26_1_Pierce.pdf
+
+**Premdas, R. R. (1987).** Melanesian socialism: Vanuatu's quest for self‑definition and problems of implementation. 
+*Pacific Studies, 11(1),* 107–127.
+
+**School‑Community Relations and Fee‑Free Education Policy in Vanuatu. (n.d.).** *Pacific Affairs, 92(1),* 71–91. 
+Retrieved from https://www.jstor.org/stable/48541517
+
+**SPCCFPSTORE1.blob.core.windows.net. (n.d.-a).** Teachers' Resource Kit on Fisheries for Vanuatu (Introduction). Retrieved from SPCCFPSTORE1.blob.core.windows.net
+
+**SPCCFPSTORE1.blob.core.windows.net. (n.d.-b).** Teachers' Resource Kit on Fisheries for Vanuatu (Activity guides). Retrieved from SPCCFPSTORE1.blob.core.windows.net
+
+**Talua Theological Training Institute. (n.d.).** About/History. Retrieved from https://ttti.edu.vu/about/history/#:~:text=Presbyterian%20Bible%20College%20on%20Tangoa,course%20to%20train%20lay%20people
+
+**Tamtam, H. L. (2008).** The status of English as a language of education and communication in Vanuatu [Conference paper]. Commonwealth of Learning (COL) Oasis repository.
+
+**Trauma.massey.ac.nz. (n.d.).** Education statistics from Vanuatu MOET. Retrieved from Trauma.massey.ac.nz
+
+**University of the South Pacific. (n.d.).** History. Retrieved from https://en.wikipedia.org/wiki/University_of_the_South_Pacific#:~:text=,106%20%20An%20extension
+
+**Urban Coconuts. (n.d.).** Theological education in Vanuatu. Retrieved from https://urbancoconuts.org/theological-education/#:~:text=Talua%20Theological%20Training%20Institute%20is,and%20it%20is%20still%20expanding
+
+**USP Emalus. (n.d.).** Emalus Campus overview. Retrieved from https://www.usp.ac.fj/emalus/#:~:text=Emalus%20campus%20in%20Port%20Vila,six%20schools%C2%A0and%20two%20interdisciplinary%20colleges
+
+**Vandeputte-Tavo, L. (2013).** Bislama in the educational system? Debate around the legitimacy of a 
+creole at school in a post-colonial country. *Current Issues in Language Planning, 14,* 254–269. 
+https://doi.org/10.1080/14664208.2013.837217  
+
+**Vanuatu Agriculture College. (n.d.).** Provider profile and courses. Retrieved from https://vqa.edu.vu/index.php/registered-providers-providers-side/276-vanuatu-agriculture-college#:~:text=,Diploma%20of%20Agriculture
+
+**Vanuatu College of Nursing Education. (n.d.).** Registered provider info. Retrieved from https://vqa.edu.vu/index.php/registered-providers-providers-side/278-vanuatu-college-of-nursing-education#:~:text=Latest%20%20Info
+
+**Vanuatu Institute of Technology. (n.d.).** Provider profile. Retrieved from https://vqa.edu.vu/index.php/registered-providers-providers-side/242-vanuatu-institute-of-technology#:~:text=,Computer%20Operations
+
+**Vanuatu Ministry of Education. (2010).** National Curriculum Review Report [Unpublished policy document].
+
+**Vanuatu National Council of Chiefs (Malvatumauri). (2012).** Alternative Indicators of Well-Being for Melanesia: Vanuatu Pilot Study Report. Port Vila: Malvatumauri Press.
+
+**Warwick.ac.uk. (2010a).** Vanuatu educational gender equity data. Retrieved from Warwick.ac.uk
+
+**Warwick.ac.uk. (2010b).** Adolescent pregnancy statistics in Vanuatu. Retrieved from Warwick.ac.uk
+
+**Warwick.ac.uk. (2010c).** Girls' education barriers in Vanuatu. Retrieved from Warwick.ac.uk
+
+**Willans, F. (2013).** The engineering of plurilingualism following a blueprint for multilingualism: The case of Vanuatu's 
+education language policy. *TESOL Quarterly, 47(3),* 546–573. https://doi.org/10.1002/tesq.113
+
+**Willans, F. (2014).** Moving multilingual education forward in Vanuatu: Rethinking the familiar stories about language and education (Summary report of PhD research, University of Oxford).
+
+**Willans, F. (2015).** Traces of globalised discourses within and around spaces for multilingualism: 
+prospects for education policy change in Vanuatu. *Current Issues in Language Planning, 16,* 113–97. 
+https://doi.org/10.1080/14664208.2014.947021  
+""")
@@ -0,0 +1,58 @@
+"""Population: census population by age group."""
+import streamlit as st
+
+from data_loader import load_dataset
+from figure_payload import plotly_chart
+from profiler import mark, profiled_fragment
+from visualizations import create_population_trend_visualization
+
+
+# -----------------------------------------------------------------------------
+# Population Trends Section
+# -----------------------------------------------------------------------------
+mark("Population trends")
+st.header("Population Trends")
+
+
+@st.fragment
+@profiled_fragment("Population trends")
+def population_trends_section():
+    """Population chart and statistics; the school-age toggle reruns only this section."""
+    try:
+        population_data = load_dataset("Population")
+    
+        # Add toggle for school-age only view
+        school_age_only = st.checkbox("Show only school-age population (0-19 years)", value=True)
+    
+        col1, col2 = st.columns([2,1])
+        with col1:
+            pop_fig = create_population_trend_visualization(population_data, school_age_only)
+            plotly_chart(pop_fig, width="stretch")
+    
+        with col2:
+            st.markdown("""
+            **Population Growth Analysis**
+        
+    The population trends in Vanuatu show consistent growth, with a significant portion under 19 years of age. Nearly half of the population is school-aged (0–19), underscoring the urgent need for accessible, high-quality education to serve this youthful demographic. Notably, growth is especially robust in rural areas, which raises logistical challenges for resource distribution and school provisioning in the outer islands. Over the years, increased demand for schooling has put pressure on the teacher workforce and educational infrastructure. Key statistics as of 2020 include: a total population of about 300,000; roughly 144,746 individuals aged 0–19 (approximately 48% of the population); and about 28% population growth since 2009. These trends highlight why expanding educational access remains a top priority. A growing cohort of children each year requires more teachers, classrooms, and learning materials, particularly in remote areas.
+
+            """)
+        
+            # Calculate and display key statistics
+            total_growth = (population_data['Total Population'].iloc[-1] / population_data['Total Population'].iloc[0] - 1) * 100
+            school_age_pop = population_data[['0--4', '5--9', '10--14', '15--19']].sum(axis=1).iloc[-1]
+            school_age_percent = (school_age_pop / population_data['Total Population'].iloc[-1]) * 100
+        
+            latest_year = population_data['Year'].max()
+            st.markdown(f"""
+            **Key Statistics ({latest_year}):**
+            - Total Population: {population_data['Total Population'].iloc[-1]:,.0f}
+            - School-age Population (0-19): {school_age_pop:,.0f}
+            - School-age percentage: {school_age_percent:.1f}%
+            - Population growth (2009-2020): {total_growth:.1f}%
+            """)
+
+    except Exception as e:
+        st.error(f"Error loading population data: {e}")
+
+
+population_trends_section()
@@ -0,0 +1,61 @@
+"""Teachers: teacher distribution and qualifications."""
+import streamlit as st
+
+from data_loader import load_dataset
+from figure_payload import plotly_chart
+from profiler import mark
+from visualizations import create_teacher_distribution
+
+
+# -----------------------------------------------------------------------------
+# Teaching Resources
+# -----------------------------------------------------------------------------
+mark("Teaching resources")
+st.header("Teaching Resources")
+st.subheader("Teacher Distribution and Qualifications")
+
+col1, col2 = st.columns([2,1])
+with col1:
+    try:
+        teacher_data = load_dataset("Teachers Distribution")
+    except Exception as e:
+        st.error(f"Error loading teacher data: {e}")
+        st.stop()
+    fig = create_teacher_distribution(teacher_data)
+    plotly_chart(fig, width="stretch")
+
+with col2:
+    # Create tabs for better organization of the content
+    teacher_tabs = st.tabs(["Overview", "Challenges", "Initiatives"])
+    
+    with teacher_tabs[0]:
+        st.markdown("""
+        **Teaching Resource Distribution**
+        
+        Vanuatu faces significant disparities in teacher allocation between urban and rural areas. 
+        Recent studies (Cassity et al., 2021-2023) show professional development programs have 
+        improved teaching quality, but geographical isolation limits ongoing support for 
+        remote teachers.
+        """)
+    
+    with teacher_tabs[1]:
+        st.markdown("""
+        **Key Challenges**
+        
+        • **Rural retention**: Higher turnover and vacancy rates in remote islands
+        • **Qualifications gap**: Lower proportion of certified teachers in remote areas
+        • **Resource shortages**: Limited textbooks in English/French and fewer in local languages
+        • **Follow-up support**: Teachers attend training but receive minimal mentoring afterward
+        """)
+        
+    with teacher_tabs[2]:
+        st.markdown("""
+        **Current Initiatives**
+        
+        • Volunteer teacher deployment to understaffed schools
+        • Housing/salary incentives for remote postings
+        • Technology solutions for remote training where feasible
+        • Development of vernacular teaching materials through cultural centers
+        
+        *Addressing these disparities is crucial for equitable education across provinces.*
+        """)
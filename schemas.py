@@ -0,0 +1,184 @@
+"""Declared column types for every dataset, enforced when a file is loaded.
+
+Each column is converted to a compact dtype. Labels become categoricals,
+counts become int32 (int64 when a value needs it) so sums and appended
+years cannot overflow, bounded integers such as Year and Age use the
+smallest width that holds their declared range, and ratios become float32.
+A conversion that would leave a column in the same dtype and no smaller,
+such as stripping labels that had no padding, is skipped. Values that do
+not fit the declaration are rejected with a SchemaError that names the
+dataset, the column and the offending rows.
+"""
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# How many offending values a SchemaError quotes.
+_MAX_QUOTED = 5
+_INT32 = np.iinfo(np.int32)
+
+
+class SchemaError(ValueError):
+    """A dataset does not match its declared schema."""
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Declared type of one column.
+
+    Attributes:
+        kind (str): "category", "string", "count" (non-negative integer),
+            "integer", "ratio" (float32) or "float".
+        min (float, optional): Smallest allowed value.
+        max (float, optional): Largest allowed value.
+        values (tuple, optional): The only labels allowed in a category column.
+        nullable (bool): Whether missing values are allowed.
+    """
+    kind: str
+    min: float = None
+    max: float = None
+    values: tuple = None
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """
+    Columns of one dataset, by exact name or by regular expression.
+
+    Columns named in ``columns`` must be present. Columns matching a pattern
+    in ``patterns`` are typed when present, and at least one must match each
+    pattern. Any other column is left as read.
+    """
+    columns: dict
+    patterns: dict = field(default_factory=dict)
+
+
+COUNT = Column("count", min=0)
+
+SCHEMAS = {
+    "NER for ECCE": DatasetSchema(
+        columns={"Province": Column("category"), "School_Type": Column("category")},
+        patterns={r"(Female|Male|Total)_\d{4}": Column("ratio", min=0, max=1, nullable=True)},
+    ),
+    "Enrollment by School Type": DatasetSchema(
+        columns={"Province": Column("category"), "ECCE": COUNT, "Primary_School": COUNT,
+                 "Secondary_School": COUNT, "Total": COUNT},
+    ),
+    "Detailed Enrollment": DatasetSchema(
+        columns={"Province": Column("category"), "PreSchool": COUNT, "PreSchool_Total": COUNT,
+                 "Primary_Total": COUNT, "Secondary_Total": COUNT, "Total": COUNT},
+        patterns={r"Grade_\d+": COUNT},
+    ),
+    "Teachers Distribution": DatasetSchema(
+        columns={"Province": Column("category"), "Gender": Column("category", values=("F", "M")),
+                 "ECE": COUNT, "PS": COUNT, "PSET": COUNT, "SC": COUNT, "SS": COUNT, "Total": COUNT},
+    ),
+    "Age Distribution": DatasetSchema(
+        columns={"Year": Column("integer", min=1900, max=2100), "Age": Column("integer", min=0, max=30),
+                 "Province": Column("category"), "Female": COUNT, "Male": COUNT, "Total": COUNT},
+    ),
+    "HPI": DatasetSchema(
+        columns={"country": Column("string"),
+                 "HPI": Column("float", min=0, max=100, nullable=True),
+                 "Life Expectancy in Years": Column("float", min=0, max=120, nullable=True),
+                 "Ladder Of Life": Column("float", min=0, max=10, nullable=True),
+                 "Ecological Footprint": Column("float", min=0, nullable=True)},
+    ),
+    "Population": DatasetSchema(
+        columns={"Year": Column("integer", min=1900, max=2100), "Total Population": COUNT},
+        patterns={r"\d+--\d+|\d+\+": COUNT},
+    ),
+}
+
+
+def _quote(values):
+    shown = ", ".join(f"row {index}: {value!r}" for index, value in list(values.items())[:_MAX_QUOTED])
+    more = len(values) - _MAX_QUOTED
+    return shown + (f" and {more} more" if more > 0 else "")
+
+
+def _coerce(name, col, series, spec):
+    """Converts one column to its declared dtype, raising SchemaError on violations."""
+    def fail(problem, values):
+        raise SchemaError(f"{name}: column '{col}' {problem} ({_quote(values)})")
+
+    missing = series.isna()
+    if missing.any() and not spec.nullable:
+        fail("has missing values", series[missing])
+
+    if spec.kind in ("category", "string"):
+        text = series.astype("string").str.strip()
+        if spec.values is not None:
+            unknown = text.notna() & ~text.isin(spec.values)
+            if unknown.any():
+                fail(f"has values outside {list(spec.values)}", series[unknown])
+        return text.astype("category") if spec.kind == "category" else text.astype(str)
+
+    numbers = pd.to_numeric(series, errors="coerce")
+    unparsed = numbers.isna() & ~missing
+    if unparsed.any():
+        fail("has non-numeric values", series[unparsed])
+    if spec.min is not None and (numbers < spec.min).any():
+        fail(f"has values below {spec.min}", series[numbers < spec.min])
+    if spec.max is not None and (numbers > spec.max).any():
+        fail(f"has values above {spec.max}", series[numbers > spec.max])
+
+    if spec.kind in ("count", "integer"):
+        fractional = numbers.notna() & (numbers != np.floor(numbers))
+        if fractional.any():
+            fail("has non-integer values", series[fractional])
+        if missing.any():
+            return numbers.astype("Int64")
+        if spec.kind == "integer" and spec.min is not None and spec.max is not None:
+            # Narrow by the declared range, not the values, so every file gets the same dtype
+            return numbers.astype(next(dtype for dtype in (np.int8, np.int16, np.int32, np.int64)
+                                       if np.iinfo(dtype).min <= spec.min and spec.max <= np.iinfo(dtype).max))
+        fits = numbers.empty or (numbers.min() >= _INT32.min and numbers.max() <= _INT32.max)
+        return numbers.astype("int32" if fits else "int64")
+    if spec.kind == "ratio":
+        return numbers.astype("float32")
+    return numbers.astype("float64")
+
+
+def apply_schema(name, frame):
+    """
+    Converts a loaded dataset to its declared compact dtypes.
+
+    Args:
+        name (str): The dataset name, a key of SCHEMAS.
+        frame (pd.DataFrame): The frame as read (and cleaned).
+
+    Returns:
+        pd.DataFrame: A new frame with typed columns; undeclared columns are kept as read.
+
+    Raises:
+        SchemaError: A declared column is missing, or holds values of the wrong
+            type or outside the declared range.
+    """
+    schema = SCHEMAS.get(name)
+    if schema is None:
+        return frame
+    missing = [col for col in schema.columns if col not in frame.columns]
+    if missing:
+        raise SchemaError(f"{name}: missing column(s) {', '.join(missing)}")
+
+    typed = {}
+    for pattern, spec in schema.patterns.items():
+        matched = [col for col in frame.columns if re.fullmatch(pattern, col) and col not in schema.columns]
+        if not matched:
+            raise SchemaError(f"{name}: no columns match '{pattern}'")
+        typed.update({col: spec for col in matched})
+    typed.update(schema.columns)
+    converted = {}
+    for col, spec in typed.items():
+        column = _coerce(name, col, frame[col], spec)
+        if (column.dtype == frame[col].dtype
+                and column.memory_usage(deep=True) >= frame[col].memory_usage(deep=True)
+                and column.equals(frame[col])):
+            continue
+        converted[col] = column
+    return frame.assign(**converted)
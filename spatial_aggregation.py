@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+
+from data_loader import DATA_DIR, write_atomic
+from geography import (
+    ATTENDANCE_YEARS,
+    DETAIL_LEVELS,
+    boundary_fingerprint,
+    load_area_councils,
+    memoize_for_boundaries,
+)
+
+logger = logging.getLogger(__name__)
+
+DERIVED_DIR = os.path.join(DATA_DIR, ".derived")
+PROVINCES_PATH = os.path.join(DERIVED_DIR, "provinces.geojson")
+
+
+def normalize_province(name):
+    """Normalizes a province name for matching: trimmed and case-folded."""
+    return str(name).strip().casefold()
+
+
+def _build_crosswalk():
+    councils = load_area_councils()
+    crosswalk = (councils[["province", "province_code"]]
+                 .drop_duplicates()
+                 .sort_values("province_code", ignore_index=True))
+    crosswalk["key"] = crosswalk["province"].map(normalize_province)
+    return crosswalk
+
+
+def province_crosswalk():
+    """
+    Returns the province key crosswalk built from the boundary file.
+
+    Columns are province (the name used in the CSVs and admin1Name_en),
+    province_code (admin1Pcode) and key (the normalized name used for matching).
+    """
+    return memoize_for_boundaries("province_crosswalk", _build_crosswalk)
+
+
+def province_codes(names):
+    """
+    Maps province names from any CSV table to admin1Pcode values.
+
+    Rows that are not provinces ("F", "M", "Grand Total", "National", ...)
+    map to NaN.
+
+    Args:
+        names (pd.Series): Province names.
+
+    Returns:
+        pd.Series: admin1Pcode per row, aligned with names.
+    """
+    crosswalk = province_crosswalk()
+    lookup = dict(zip(crosswalk["key"], crosswalk["province_code"]))
+    keys = names.astype("string").str.strip().str.casefold()
+    return keys.map(lookup)
+
+
+def _dissolve():
+    import geopandas as gpd
+    import shapely
+
+    councils = load_area_councils()
+    attendance_cols = [f"attendance_{year}" for year in ATTENDANCE_YEARS]
+    grouped = councils.groupby("province_code", sort=True)
+    provinces = grouped.agg(
+        province=("province", "first"),
+        councils=("geocode", "size"),
+        councils_with_data=(attendance_cols[-1], "count"),
+    )
+    totals = grouped[attendance_cols].sum(min_count=1)
+    # Area Councils tile each province, so their coverage union is exact and fast
+    union = shapely.coverage_union_all if hasattr(shapely, "coverage_union_all") else shapely.union_all
+    geometry = [union(councils.geometry.values[idx]) for idx in grouped.indices.values()]
+    return gpd.GeoDataFrame(provinces.join(totals).reset_index(), geometry=geometry, crs=councils.crs)
+
+
+def _read_persisted(version):
+    import geopandas as gpd
+
+    try:
+        with open(PROVINCES_PATH, encoding="utf-8") as handle:
+            collection = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if collection.get("source_sha256") != version:
+        return None
+    provinces = gpd.GeoDataFrame.from_features(collection["features"], crs="EPSG:4326")
+    return provinces[[col for col in provinces.columns if col != "geometry"] + ["geometry"]]
+
+
+def _write_persisted(provinces, version):
+    collection = json.loads(provinces.to_json())
+    collection["source_sha256"] = version
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(collection, handle)
+
+    write_atomic(PROVINCES_PATH, write)
+
+
+def _load_or_dissolve():
+    version = boundary_fingerprint().sha256
+    provinces = _read_persisted(version)
+    if provinces is None:
+        provinces = _dissolve()
+        try:
+            _write_persisted(provinces, version)
+        except OSError as e:
+            logger.warning("Could not persist dissolved provinces: %s", e)
+    return provinces
+
+
+def province_boundaries():
+    """
+    Returns province polygons dissolved from the Area Councils, with attendance totals.
+
+    The result is persisted to data/.derived/provinces.geojson, tagged with the
+    boundary file's hash. The union is only recomputed when that file changes.
+
+    Returns:
+        geopandas.GeoDataFrame: One row per province with province_code, province,
+        councils, councils_with_data, attendance_<year> totals and geometry.
+    """
+    return memoize_for_boundaries("province_boundaries", _load_or_dissolve)
+
+
+def _simplify_provinces(level):
+    import shapely
+
+    provinces = province_boundaries()
+    settings = DETAIL_LEVELS[level]
+    geometry = provinces.geometry.values
+    if settings["tolerance"] > 0:
+        geometry = shapely.simplify(geometry, settings["tolerance"], preserve_topology=True)
+    geometry = shapely.set_precision(geometry, settings["grid"])
+    features = [
+        {"type": "Feature", "id": code, "properties": {}, "geometry": json.loads(shape)}
+        for code, shape in zip(provinces["province_code"], shapely.to_geojson(geometry))
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def province_geometry(level):
+    """
+    Returns the province polygons at one level of detail, as GeoJSON.
+
+    Feature ids are the admin1Pcode values. Each level is computed once per
+    version of the boundary file.
+
+    Args:
+        level (int): Index into geography.DETAIL_LEVELS; 0 is full resolution.
+    """
+    return memoize_for_boundaries(("province_geometry", level), lambda: _simplify_provinces(level))
+
+
+def province_totals(table, value_col, province_col="Province"):
+    """
+    Sums a column of a province-keyed CSV table per province, keyed by admin1Pcode.
+
+    Matching goes through the cached crosswalk; rows that are not provinces
+    are left out, and provinces without rows get NaN.
+
+    Args:
+        table (pd.DataFrame): Any table with a province-name column, e.g. teacher_distribution.
+        value_col (str): The column to sum.
+        province_col (str): Name of the province column.
+
+    Returns:
+        pd.DataFrame: province_code, province and value, one row per province
+        in the boundary file.
+    """
+    keyed = table.assign(province_code=province_codes(table[province_col]))
+    keyed = keyed[keyed["province_code"].notna()]
+    totals = keyed.groupby("province_code")[value_col].sum().rename("value").reset_index()
+    return province_crosswalk()[["province_code", "province"]].merge(totals, on="province_code", how="left")
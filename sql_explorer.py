@@ -0,0 +1,346 @@
+"""Ad-hoc SQL over every dataset, for the Explore page.
+
+The datasets are registered with an in-process DuckDB database as views over
+the frames data_loader already holds, so nothing is copied or re-parsed:
+
+    ner_ecce, enrollment_by_school, detailed_enrollment, teacher_distribution,
+    age_distribution, hpi, population    one per dataset in data_loader.DATASETS
+    area_councils                        the GeoJSON properties, one row per council
+
+Only single SELECT statements are accepted, and file and network access are
+turned off, so a query can read the registered tables and nothing else.
+
+A query runs once per data version: its result is streamed back as Arrow
+record batches and kept (up to RESULT_CACHE_MAX_BYTES in total), and pages
+are slices of it. A result too large to keep is paged with LIMIT/OFFSET
+instead, with its row count computed once.
+
+DuckDB is optional: without it ``run_query`` raises RuntimeError and the rest
+of the dashboard is unaffected.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import pandas as pd
+
+from data_loader import DATASETS, dataset_fingerprint, load_dataset
+from geography import attendance_table, boundary_fingerprint
+
+PAGE_SIZE = 100
+# Bytes of query results kept in memory for paging, across all queries.
+RESULT_CACHE_MAX_BYTES = int(os.environ.get("EXPLORE_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+AGGREGATE_FUNCTIONS = ("sum", "avg", "min", "max", "count")
+FILTER_OPERATORS = ("=", "!=", ">", ">=", "<", "<=", "contains")
+
+# SQL table name -> dataset name
+DATASET_TABLES = {os.path.splitext(file)[0].lower(): name for name, file in DATASETS.items()}
+COUNCIL_TABLE = "area_councils"
+
+_ROW_COUNT_CACHE_SIZE = 128
+_BATCH_ROWS = 64 * 1024
+_result_lock = threading.Lock()
+# (sql, params, versions) -> (pyarrow.Table of the whole result, its bytes)
+_results = OrderedDict()
+_result_bytes = 0
+# Row counts of results too large to keep, same keys
+_row_counts = OrderedDict()
+# Idle connections as (versions, connection). A connection serves one query at
+# a time, and frames registered on it are visible to it only, so each query
+# checks one out; at most _POOL_SIZE are kept between queries.
+_POOL_SIZE = 4
+_pool_lock = threading.Lock()
+_pool = []
+
+
+class QueryError(ValueError):
+    """A query that was rejected or failed to run."""
+
+
+@dataclass(frozen=True)
+class QueryPage:
+    """
+    One page of a query result.
+
+    Attributes:
+        rows (pd.DataFrame): The rows of this page.
+        page (int): 1-based page number.
+        page_count (int): Number of pages in the whole result.
+        total_rows (int): Rows in the whole result.
+        seconds (float): Time spent running the query for this page.
+    """
+    rows: pd.DataFrame
+    page: int
+    page_count: int
+    total_rows: int
+    seconds: float
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise RuntimeError("The Explore page requires duckdb (pip install duckdb)") from e
+    return duckdb
+
+
+def quote_identifier(name):
+    """Quotes a table or column name for SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def data_versions():
+    """Returns table -> SHA-256 of the file it is read from."""
+    versions = {table: dataset_fingerprint(name).sha256 for table, name in DATASET_TABLES.items()}
+    versions[COUNCIL_TABLE] = boundary_fingerprint().sha256
+    return versions
+
+
+def _connect():
+    duckdb = _import_duckdb()
+    connection = duckdb.connect()
+    for table, name in DATASET_TABLES.items():
+        connection.register(table, load_dataset(name))
+    connection.register(COUNCIL_TABLE, attendance_table())
+    # Queries may only read the registered frames
+    connection.execute("SET enable_external_access = false")
+    connection.execute("SET lock_configuration = true")
+    return connection
+
+
+@contextmanager
+def _connection(versions):
+    """
+    Checks out a connection with the tables of versions registered.
+
+    Idle connections for older data versions are closed, and a connection
+    is returned to the pool afterwards only while it has room.
+    """
+    connection = None
+    with _pool_lock:
+        stale = [idle for idle_versions, idle in _pool if idle_versions != versions]
+        current = [idle for idle_versions, idle in _pool if idle_versions == versions]
+        if current:
+            connection = current.pop()
+        _pool[:] = [(versions, idle) for idle in current]
+    for idle in stale:
+        idle.close()
+    if connection is None:
+        connection = _connect()
+    try:
+        yield connection
+    finally:
+        with _pool_lock:
+            if len(_pool) < _POOL_SIZE:
+                _pool.append((versions, connection))
+                connection = None
+        if connection is not None:
+            connection.close()
+
+
+def table_columns():
+    """
+    Lists the columns of every table.
+
+    Returns:
+        dict: Table name -> DataFrame with column_name and column_type.
+    """
+    with _connection(data_versions()) as connection:
+        return {table: connection.execute(f"DESCRIBE {quote_identifier(table)}").df()[["column_name", "column_type"]]
+                for table in list(DATASET_TABLES) + [COUNCIL_TABLE]}
+
+
+def numeric_columns(columns):
+    """Returns the names of the numeric columns in a table_columns() frame."""
+    numeric = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT", "UINTEGER",
+               "UBIGINT", "FLOAT", "DOUBLE", "DECIMAL")
+    return [row.column_name for row in columns.itertuples() if row.column_type.startswith(numeric)]
+
+
+def validate_query(sql):
+    """
+    Checks that sql is a single SELECT statement.
+
+    Returns:
+        str: The statement as parsed, without the trailing semicolon or comments
+        after it.
+
+    Raises:
+        QueryError: If sql is empty, has several statements or is not a SELECT.
+    """
+    duckdb = _import_duckdb()
+    try:
+        # Parsing needs no tables, so no registered connection is checked out
+        statements = duckdb.extract_statements(sql)
+    except duckdb.Error as e:
+        raise QueryError(str(e)) from e
+    if len(statements) != 1:
+        raise QueryError("Enter exactly one SQL statement")
+    if statements[0].type != duckdb.StatementType.SELECT:
+        raise QueryError("Only SELECT queries can be run here")
+    return statements[0].query
+
+
+def _remember(key, value, size):
+    global _result_bytes
+    with _result_lock:
+        # Two sessions can run the same query at once; the later result replaces the earlier one
+        if key in _results:
+            _result_bytes -= _results.pop(key)[1]
+        _results[key] = (value, size)
+        _result_bytes += size
+        while _result_bytes > RESULT_CACHE_MAX_BYTES and len(_results) > 1:
+            _, (_, evicted) = _results.popitem(last=False)
+            _result_bytes -= evicted
+
+
+def _recall(key):
+    with _result_lock:
+        if key not in _results:
+            return None
+        _results.move_to_end(key)
+        return _results[key][0]
+
+
+def _fetch_result(connection, sql, params):
+    """Streams the result as Arrow batches; returns a pyarrow.Table, or None if it is too large to keep."""
+    import pyarrow as pa
+
+    result = connection.execute(sql, list(params))
+    reader = (result.to_arrow_reader(_BATCH_ROWS) if hasattr(result, "to_arrow_reader")
+              else result.fetch_record_batch(_BATCH_ROWS))
+    batches, size = [], 0
+    for batch in reader:
+        batches.append(batch)
+        size += batch.nbytes
+        if size > RESULT_CACHE_MAX_BYTES:
+            return None
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def _to_frame(table):
+    """Converts a page to pandas; DuckDB's 128-bit sums become plain numbers."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = []
+    for column in table.columns:
+        if pa.types.is_decimal(column.type):
+            try:
+                column = pc.cast(column, pa.int64()) if column.type.scale == 0 else pc.cast(column, pa.float64())
+            except pa.ArrowInvalid:
+                column = pc.cast(column, pa.float64())
+        columns.append(column)
+    return pa.table(columns, names=table.column_names).to_pandas()
+
+
+def run_query(sql, params=(), page=1, page_size=PAGE_SIZE):
+    """
+    Runs a SELECT query and returns one page of its result.
+
+    The query runs once per data version; further pages are sliced from the
+    kept result.
+
+    Args:
+        sql (str): A single SELECT statement over the registered tables.
+        params (sequence, optional): Values for ``?`` placeholders in sql.
+        page (int): 1-based page to return; clamped to the last page.
+        page_size (int): Rows per page.
+
+    Returns:
+        QueryPage: The requested page.
+
+    Raises:
+        QueryError: If the query is rejected or fails.
+        RuntimeError: If duckdb is not installed.
+    """
+    duckdb = _import_duckdb()
+    sql = validate_query(sql)
+    versions = data_versions()
+    key = (sql, tuple(params), tuple(sorted(versions.items())))
+    start = time.perf_counter()
+    try:
+        table = _recall(key)
+        if table is None:
+            with _connection(versions) as connection:
+                table = _fetch_result(connection, sql, params)
+            if table is not None:
+                _remember(key, table, table.nbytes)
+        if table is not None:
+            total_rows = table.num_rows
+            page_count = max(1, -(-total_rows // page_size))
+            page = min(max(int(page), 1), page_count)
+            rows = _to_frame(table.slice((page - 1) * page_size, page_size))
+        else:
+            # Too large to keep: page through it in the database. The newlines keep
+            # a trailing line comment in sql from swallowing the closing parenthesis.
+            with _connection(versions) as connection:
+                total_rows = _row_count(connection, sql, params, key)
+                page_count = max(1, -(-total_rows // page_size))
+                page = min(max(int(page), 1), page_count)
+                result = connection.execute(f"SELECT * FROM (\n{sql}\n) AS result LIMIT ? OFFSET ?",
+                                            [*params, page_size, (page - 1) * page_size])
+                rows = _to_frame(result.to_arrow_table() if hasattr(result, "to_arrow_table")
+                                 else result.fetch_arrow_table())
+    except duckdb.Error as e:
+        raise QueryError(str(e)) from e
+    return QueryPage(rows, page, page_count, total_rows, time.perf_counter() - start)
+
+
+def _row_count(connection, sql, params, key):
+    with _result_lock:
+        if key in _row_counts:
+            _row_counts.move_to_end(key)
+            return _row_counts[key]
+    count = connection.execute(f"SELECT count(*) FROM (\n{sql}\n) AS result", list(params)).fetchone()[0]
+    with _result_lock:
+        _row_counts[key] = count
+        while len(_row_counts) > _ROW_COUNT_CACHE_SIZE:
+            _row_counts.popitem(last=False)
+    return count
+
+
+def build_query(table, group_by=(), measures=(), filters=()):
+    """
+    Builds the SQL for a group/filter selection made in the guided builder.
+
+    Args:
+        table (str): A registered table.
+        group_by (sequence of str): Columns to group by.
+        measures (sequence of tuple): (function, column) pairs, function one
+            of AGGREGATE_FUNCTIONS; column "*" counts rows.
+        filters (sequence of tuple): (column, operator, value) triples,
+            operator one of FILTER_OPERATORS. Values become query parameters.
+
+    Returns:
+        tuple: (sql, params)
+    """
+    group_columns = [quote_identifier(column) for column in group_by]
+    selected = list(group_columns)
+    for function, column in measures:
+        if function not in AGGREGATE_FUNCTIONS:
+            raise QueryError(f"Unknown aggregate '{function}'")
+        argument = "*" if column == "*" else quote_identifier(column)
+        alias = quote_identifier("rows" if column == "*" else f"{function}_{column}")
+        selected.append(f"{function}({argument}) AS {alias}")
+
+    conditions, params = [], []
+    for column, operator, value in filters:
+        if operator not in FILTER_OPERATORS:
+            raise QueryError(f"Unknown operator '{operator}'")
+        if operator == "contains":
+            conditions.append(f"CAST({quote_identifier(column)} AS VARCHAR) ILIKE ?")
+            params.append(f"%{value}%")
+        else:
+            conditions.append(f"{quote_identifier(column)} {operator} ?")
+            params.append(value)
+
+    sql = f"SELECT {', '.join(selected) or '*'} FROM {quote_identifier(table)}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if group_columns:
+        sql += f" GROUP BY {', '.join(group_columns)} ORDER BY {', '.join(group_columns)}"
+    return sql, params
@@ -0,0 +1,184 @@
+"""Streaming parser for the stacked Ministry of Education enrollment layout.
+
+The MoE extract lists each province's overall row followed by its "F" and
+"M" rows, and ends with a "Grand Total" block:
+
+    Province,PreSchool,PreSchool_Total,Grade_1,...,Total
+    Torba,654,654,349,...
+    F,317,317,179,...
+    M,337,337,170,...
+    ...
+    Grand Total,16572,...
+
+The file is read a chunk at a time. The province that owns the next gender
+rows is carried across chunk boundaries, so a block split between chunks is
+still attributed correctly. Each chunk becomes tidy
+(Province, Gender, Level, Grade, Enrollment) records. Subtotal and total
+columns are left out because they can be derived.
+"""
+import itertools
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from data_loader import write_atomic
+from enrollment_transforms import LEVEL_GRADES
+
+DEFAULT_CHUNK_ROWS = 100_000
+GENDERS = ["F", "M"]
+GRAND_TOTAL = "Grand Total"
+
+_GRADE_LEVEL = {grade: level for level, grades in LEVEL_GRADES.items() for grade in grades}
+GENDER_DTYPE = pd.CategoricalDtype(["Overall"] + GENDERS)
+LEVEL_DTYPE = pd.CategoricalDtype(list(LEVEL_GRADES), ordered=True)
+GRADE_DTYPE = pd.CategoricalDtype(list(_GRADE_LEVEL), ordered=True)
+
+
+@dataclass
+class ParseReport:
+    """What a streaming parse saw: row counts and the gender rows it could not place."""
+    rows: int = 0
+    records: int = 0
+    chunks: int = 0
+    summary_rows: int = 0
+    orphans: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.orphans
+
+
+def _tidy_chunk(chunk, owner, year):
+    """Melts the kept rows of one chunk into tidy records."""
+    labels = chunk["Province"].astype("string").str.strip()
+    gender = labels.where(labels.isin(GENDERS), "Overall")
+    grades = [grade for grade in _GRADE_LEVEL if grade in chunk.columns]
+    counts = chunk[grades].to_numpy()
+    n_rows, n_grades = counts.shape
+    records = pd.DataFrame({
+        "Province": owner.to_numpy().repeat(n_grades),
+        "Gender": pd.Categorical(gender.to_numpy().repeat(n_grades), dtype=GENDER_DTYPE),
+        "Level": pd.Categorical([_GRADE_LEVEL[grade] for grade in grades] * n_rows, dtype=LEVEL_DTYPE),
+        "Grade": pd.Categorical(grades * n_rows, dtype=GRADE_DTYPE),
+        # Nullable, so a chunk with a blank cell keeps the same dtype as one without
+        "Enrollment": pd.array(counts.reshape(-1), dtype="Int64"),
+    })
+    if year is not None:
+        records.insert(0, "Year", int(year))
+    return records
+
+
+def iter_stacked_records(source, year=None, chunk_rows=DEFAULT_CHUNK_ROWS, report=None):
+    """
+    Parses a stacked extract in one pass, yielding tidy records chunk by chunk.
+
+    A gender row belongs to the closest overall row above it, even if that row
+    was in an earlier chunk. A gender row is an orphan when no province row
+    precedes it (at the top of the file) or when it repeats a gender its
+    province already has. Orphans are skipped and recorded in
+    ``report.orphans`` as (1-based line number, label, reason). The "Grand Total" row
+    and the gender rows below it summarize the file and are skipped too.
+
+    Args:
+        source (str or file-like): The extract CSV.
+        year (int, optional): Adds a Year column to every record.
+        chunk_rows (int): Rows read per chunk; bounds memory use.
+        report (ParseReport, optional): Filled in as the parse goes.
+
+    Yields:
+        pd.DataFrame: Records of one chunk with Province, Gender, Level, Grade
+        and Enrollment (nullable Int64), plus Year when given.
+    """
+    report = report if report is not None else ParseReport()
+    carry = None
+    carry_genders = set()
+    for chunk in pd.read_csv(source, chunksize=chunk_rows):
+        report.chunks += 1
+        report.rows += len(chunk)
+        labels = chunk["Province"].astype("string").str.strip()
+        is_gender = labels.isin(GENDERS)
+        # Each gender row takes the label of the nearest overall row above it
+        owner = labels.where(~is_gender).ffill()
+        if carry is not None:
+            owner = owner.fillna(carry)
+
+        # Block 0 continues the block the previous chunk ended in
+        block = (~is_gender).cumsum()
+        repeated = is_gender & pd.DataFrame({"block": block, "gender": labels}).duplicated()
+        repeated |= is_gender & block.eq(0) & labels.isin(carry_genders)
+        unowned = is_gender & owner.isna()
+        orphan = unowned | repeated
+        summary = owner.eq(GRAND_TOTAL).fillna(False).astype(bool)
+        for index in chunk.index[orphan]:
+            reason = "has no province row above it" if unowned[index] else f"repeats a gender of {owner[index]}"
+            report.orphans.append((int(index) + 2, labels[index], reason))
+        report.summary_rows += int(summary.sum())
+
+        if len(chunk):
+            last_block = block.iloc[-1]
+            genders = set(labels[is_gender & block.eq(last_block)])
+            carry_genders = carry_genders | genders if last_block == 0 else genders
+            if pd.notna(owner.iloc[-1]):
+                carry = owner.iloc[-1]
+
+        keep = ~(orphan | summary)
+        if not keep.any():
+            continue
+        records = _tidy_chunk(chunk[keep], owner[keep], year)
+        report.records += len(records)
+        yield records
+
+
+def record_schema(year=False):
+    """
+    Returns the Arrow schema write_records_arrow writes records with.
+
+    Args:
+        year (bool): Whether the records have a Year column.
+    """
+    import pyarrow as pa
+
+    category = pa.dictionary(pa.int8(), pa.string())
+    ordered = pa.dictionary(pa.int8(), pa.string(), ordered=True)
+    fields = [("Year", pa.int32())] if year else []
+    fields += [("Province", pa.string()), ("Gender", category), ("Level", ordered), ("Grade", ordered),
+               ("Enrollment", pa.int64())]
+    return pa.schema(fields)
+
+
+def write_records_arrow(batches, path):
+    """
+    Streams record batches into one Arrow IPC file without holding them all in memory.
+
+    Every batch is cast to record_schema(), so a chunk with blank counts or an
+    unusual province label cannot change the column types mid-file.
+
+    Args:
+        batches (iterable of pd.DataFrame): E.g. the output of iter_stacked_records.
+        path (str): The .arrow file to write; replaced atomically when complete.
+
+    Returns:
+        int: Number of records written.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise RuntimeError("Writing Arrow files requires pyarrow (pip install pyarrow)") from e
+
+    batches = iter(batches)
+    first = next(batches, None)
+    if first is None:
+        return 0
+    schema = record_schema(year="Year" in first.columns)
+    written = 0
+
+    def write(tmp_path):
+        nonlocal written
+        with pa.ipc.new_file(tmp_path, schema) as writer:
+            for batch in itertools.chain([first], batches):
+                table = pa.Table.from_pandas(batch, preserve_index=False).select(schema.names).cast(schema)
+                writer.write_table(table)
+                written += len(batch)
+
+    write_atomic(path, write)
+    return written
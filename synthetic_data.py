@@ -0,0 +1,268 @@
+"""Synthetic data in the exact layout of the files in data/, at any scale.
+
+Every CSV keeps its real schema, including the quirks the loaders must cope
+with: the stacked Province/F/M/Grand Total blocks of detailed_enrollment.csv,
+the wide year columns of ner_ecce.csv (with the final Total column missing its
+"%" signs, as in the real file) and the long Year x Age x Province rows of
+age_distribution.csv. The Area Council GeoJSON is a jittered tiling whose
+neighbours share their borders vertex for vertex, like real boundaries.
+
+Output is fully determined by the seed: each file draws from its own random
+stream, so adding a file or changing one file's size leaves the others alone.
+
+Usage:
+    python manage.py generate-data TARGET [--scale N] [--seed S] [--years Y ...] [--councils N]
+"""
+import json
+import math
+import os
+import zlib
+
+import numpy as np
+import pandas as pd
+
+PROVINCES = ["Torba", "Sanma", "Penama", "Malampa", "Shefa", "Tafea"]
+NER_YEARS = [2018, 2019, 2020]
+CENSUS_YEARS = [2009, 2016, 2020]
+ATTENDANCE_YEARS = ["2016", "2020"]
+AGES = list(range(12))
+GRADES = [f"Grade_{grade}" for grade in range(1, 15)]
+TEACHER_LEVELS = ["ECE", "PS", "PSET", "SC", "SS"]
+POPULATION_BANDS = ["0--4", "5--9", "10--14", "15--19", "20--24", "25--29", "30--34", "35--39",
+                    "40--44", "45--49", "50--54", "55--59", "60--64", "65--69", "70+"]
+
+# Real-data sizes that scale multiplies.
+BASE_COUNTRIES = 147
+BASE_COUNCILS = 66
+
+# Longitude/latitude box the synthetic councils tile.
+BOUNDS = (166.5, -20.3, 170.3, -13.0)
+
+
+def _rng(seed, name):
+    """Independent random stream for one output file."""
+    return np.random.default_rng([seed, zlib.crc32(name.encode())])
+
+
+def province_names(count):
+    """The real province names first, then "Province 7", "Province 8", ..."""
+    return (PROVINCES + [f"Province {i}" for i in range(len(PROVINCES) + 1, count + 1)])[:count]
+
+
+def ner_ecce(provinces, years, rng):
+    """Net enrollment rates: one row per province plus "NER Overall", wide by year."""
+    frame = pd.DataFrame({"Province": provinces + ["NER Overall"], "School_Type": "ECCE"})
+    for year in years:
+        female = rng.integers(40, 96, len(provinces))
+        male = np.clip(female + rng.integers(-8, 9, len(provinces)), 30, 99)
+        total = (female + male) / 2
+        for column, rates in (("Female", female), ("Male", male), ("Total", total)):
+            rates = np.rint(np.append(rates, rates.mean())).astype(int)
+            frame[f"{column}_{year}"] = [f"{rate}%" for rate in rates]
+    # The real file's last column has bare numbers
+    last = f"Total_{years[-1]}"
+    frame[last] = frame[last].str.rstrip("%")
+    return frame
+
+
+def enrollment_by_school(provinces, rng):
+    """School counts by type per province, with a closing "National" row."""
+    frame = pd.DataFrame({
+        "Province": provinces,
+        "ECCE": rng.integers(30, 180, len(provinces)),
+        "Primary_School": rng.integers(20, 100, len(provinces)),
+        "Secondary_School": rng.integers(3, 30, len(provinces)),
+    })
+    frame["Total"] = frame[["ECCE", "Primary_School", "Secondary_School"]].sum(axis=1)
+    national = frame.drop(columns="Province").sum().to_frame().T.assign(Province="National")
+    return pd.concat([frame, national[frame.columns]], ignore_index=True)
+
+
+def _with_level_totals(counts):
+    counts.insert(1, "PreSchool_Total", counts["PreSchool"])
+    counts.insert(counts.columns.get_loc("Grade_6") + 1, "Primary_Total", counts[GRADES[:6]].sum(axis=1))
+    counts["Secondary_Total"] = counts[GRADES[6:]].sum(axis=1)
+    counts["Total"] = counts[["PreSchool_Total", "Primary_Total", "Secondary_Total"]].sum(axis=1)
+    return counts
+
+
+def detailed_enrollment(provinces, rng):
+    """
+    Enrollment by grade in the stacked layout: each province row is followed by
+    its "F" and "M" rows, and the file ends with a "Grand Total" row.
+    """
+    levels = ["PreSchool"] + GRADES
+    # Enrollment thins out through secondary school
+    means = np.concatenate([[800], np.full(6, 420), np.linspace(260, 10, 8)])
+    size = rng.uniform(0.3, 3.0, (len(provinces), 1))
+    female = rng.poisson(means * size / 2)
+    male = rng.poisson(means * size / 2)
+    blocks = []
+    for i, province in enumerate(provinces):
+        blocks.extend([(province, female[i] + male[i]), ("F", female[i]), ("M", male[i])])
+    counts = pd.DataFrame([values for _, values in blocks], columns=levels)
+    counts = _with_level_totals(counts)
+    counts.insert(0, "Province", [name for name, _ in blocks])
+    grand_total = counts[~counts["Province"].isin(["F", "M"])].drop(columns="Province").sum()
+    grand_total = grand_total.to_frame().T.assign(Province="Grand Total")
+    return pd.concat([counts, grand_total[counts.columns]], ignore_index=True)
+
+
+def teacher_distribution(provinces, rng):
+    """Teachers by level for each province and gender, plus the "Unknown" rows."""
+    rows = []
+    for province in provinces + ["Unknown"]:
+        for gender in ["F", "M"]:
+            if province == "Unknown":
+                counts = [0, 0, 0, int(rng.integers(50, 200)), 0]
+            else:
+                counts = [int(c) for c in rng.poisson([120 if gender == "F" else 10, 150, 3, 0.2, 70])]
+            rows.append([province, gender] + counts + [sum(counts)])
+    return pd.DataFrame(rows, columns=["Province", "Gender"] + TEACHER_LEVELS + ["Total"])
+
+
+def age_distribution(provinces, years, rng):
+    """Enrolled children by single year of age, in long Year x Age x Province rows."""
+    index = pd.MultiIndex.from_product([years, AGES, provinces], names=["Year", "Age", "Province"])
+    frame = index.to_frame(index=False)
+    # Early-childhood enrollment peaks at ages 4 and 5
+    means = np.interp(frame["Age"], [0, 3, 4, 5, 6, 8, 11], [1, 20, 120, 150, 60, 5, 0.5])
+    frame["Female"] = rng.poisson(means)
+    frame["Male"] = rng.poisson(means)
+    frame["Total"] = frame["Female"] + frame["Male"]
+    return frame
+
+
+def hpi(countries, rng):
+    """Happy Planet Index table; always contains Vanuatu and United States."""
+    names = ["Vanuatu", "United States"] + [f"Country {i:05d}" for i in range(1, max(countries - 1, 1))]
+    names = names[:countries]
+    frame = pd.DataFrame({
+        "country": names,
+        "HPI": rng.uniform(20, 65, len(names)).round(1),
+        "Life Expectancy in Years": rng.uniform(50, 85, len(names)).round(1),
+        "Ladder Of Life": rng.uniform(3, 8, len(names)).round(2),
+        "Ecological Footprint": rng.uniform(0.5, 15, len(names)).round(2),
+    })
+    return frame.sort_values("HPI", ascending=False, ignore_index=True)
+
+
+def population(years, rng):
+    """Census population by five-year age band."""
+    base = np.linspace(40000, 6000, len(POPULATION_BANDS))
+    rows = []
+    for i, year in enumerate(years):
+        bands = rng.poisson(base * (1 + 0.1 * i) * rng.uniform(0.9, 1.1))
+        rows.append([year, int(bands.sum())] + bands.tolist())
+    return pd.DataFrame(rows, columns=["Year", "Total Population"] + POPULATION_BANDS)
+
+
+def _council_rings(count, rng, vertices_per_edge):
+    """
+    Tiles BOUNDS with count jittered cells; yields each cell's closed exterior ring.
+
+    Cells are cut from one shared lattice of jittered points, so neighbouring
+    rings contain exactly the same vertices along their common border.
+    """
+    min_x, min_y, max_x, max_y = BOUNDS
+    cols = max(1, math.ceil(math.sqrt(count * (max_x - min_x) / (max_y - min_y))))
+    rows = math.ceil(count / cols)
+    k = vertices_per_edge
+    xs = np.linspace(min_x, max_x, cols * k + 1)
+    ys = np.linspace(min_y, max_y, rows * k + 1)
+    lattice = np.stack(np.meshgrid(xs, ys), axis=-1)
+    spacing = np.array([xs[1] - xs[0] if len(xs) > 1 else 1.0, ys[1] - ys[0] if len(ys) > 1 else 1.0])
+    lattice[1:-1, 1:-1] += rng.uniform(-0.3, 0.3, lattice[1:-1, 1:-1].shape) * spacing
+    for cell in range(count):
+        r, c = divmod(cell, cols)
+        block = lattice[r * k:(r + 1) * k + 1, c * k:(c + 1) * k + 1]
+        # Counter-clockwise: bottom edge, right edge, top edge reversed, left edge down
+        ring = np.concatenate([block[0, :-1], block[:-1, -1], block[-1, :0:-1], block[:0:-1, 0], block[:1, 0]])
+        yield ring
+
+
+def _ring_measures(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    area = 0.5 * abs(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+    length = float(np.hypot(np.diff(x), np.diff(y)).sum())
+    return length, area
+
+
+def write_area_councils(path, councils, provinces, rng, vertices_per_edge=8, missing_share=0.03):
+    """
+    Writes a GeoJSON FeatureCollection of councils Area Councils to path.
+
+    Councils are spread over the provinces in contiguous runs. Properties follow
+    indicator_school-attendance.geojson, including councils without attendance
+    data that carry only their admin2 name and code. Features are written one at
+    a time, so national-scale files never sit in memory whole.
+    """
+    missing = set(rng.choice(councils, size=int(councils * missing_share), replace=False).tolist())
+    assignment = np.minimum(np.arange(councils) * len(provinces) // max(councils, 1), len(provinces) - 1)
+    attendance = rng.integers(50, 5000, (councils, len(ATTENDANCE_YEARS)))
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('{"type": "FeatureCollection", "features": [\n')
+        for i, ring in enumerate(_council_rings(councils, rng, vertices_per_edge)):
+            province = int(assignment[i])
+            province_code = f"VU{province + 1:02d}"
+            geocode = f"{province_code}{i + 1:04d}"
+            name = f"Area Council {i + 1}"
+            length, area = _ring_measures(ring)
+            properties = {
+                "admin2RefName": None, "admin2AltName1_en": None, "admin2AltName2_en": None,
+                "admin1Name_en": provinces[province], "admin1Pcode": province_code,
+                "admin0Name_en": "Vanuatu", "admin0Pcode": "VU",
+                "date": "2017/10/31 00:00:00", "validOn": "2018/08/24 00:00:00", "validTo": None,
+                "Shape_Length": length, "Shape_Area": area,
+            }
+            if i in missing:
+                properties = {"admin2Name_en": name, "admin2Pcode": geocode, **properties}
+            else:
+                properties.update({
+                    "disaggregations": [{"Area Council": name}],
+                    "values": [{year: float(v) for year, v in zip(ATTENDANCE_YEARS, attendance[i])}],
+                    "name": name,
+                    "geocode": geocode,
+                })
+            feature = {"type": "Feature", "properties": properties,
+                       "geometry": {"type": "Polygon", "coordinates": [np.round(ring, 6).tolist()]}}
+            handle.write((",\n" if i else "") + json.dumps(feature))
+        handle.write("\n]}\n")
+
+
+def generate_data_dir(target, scale=1, seed=0, years=None, councils=None):
+    """
+    Writes a complete synthetic data directory.
+
+    Args:
+        target (str): Directory to write into; created if needed.
+        scale (int): Multiplies the real number of provinces, countries and Area Councils.
+        seed (int): Random seed; the same seed always writes the same files.
+        years (list of int, optional): Survey years for the NER and age tables.
+        councils (int, optional): Number of Area Councils; defaults to 66 x scale.
+
+    Returns:
+        dict: File name -> number of rows (features for the GeoJSON).
+    """
+    os.makedirs(target, exist_ok=True)
+    years = list(years or NER_YEARS)
+    provinces = province_names(len(PROVINCES) * scale)
+    councils = councils or BASE_COUNCILS * scale
+    tables = {
+        "ner_ecce.csv": lambda rng: ner_ecce(provinces, years, rng),
+        "enrollment_by_school.csv": lambda rng: enrollment_by_school(provinces, rng),
+        "detailed_enrollment.csv": lambda rng: detailed_enrollment(provinces, rng),
+        "teacher_distribution.csv": lambda rng: teacher_distribution(provinces, rng),
+        "age_distribution.csv": lambda rng: age_distribution(provinces, years, rng),
+        "hpi.csv": lambda rng: hpi(BASE_COUNTRIES * scale, rng),
+        "Population.csv": lambda rng: population(CENSUS_YEARS, rng),
+    }
+    written = {}
+    for name, build in tables.items():
+        frame = build(_rng(seed, name))
+        frame.to_csv(os.path.join(target, name), index=False)
+        written[name] = len(frame)
+    geojson = "indicator_school-attendance.geojson"
+    write_area_councils(os.path.join(target, geojson), councils, provinces, _rng(seed, geojson))
+    written[geojson] = councils
+    return written
@@ -0,0 +1,96 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+import api_server
+from api_server import _matches, clear_response_cache, get_response, make_server
+
+
+@pytest.fixture(autouse=True)
+def fresh_responses():
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = make_server("127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, path, headers=None, method="GET"):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        connection.request(method, path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+    ('"ab"', False),
+    ("", False),
+])
+def test_if_none_match(header, expected):
+    assert _matches(header, '"abc"') is expected
+
+
+def test_responses_are_built_once_per_version():
+    etag, body = get_response("/api/teachers", {})
+    assert get_response("/api/teachers", {}) == (etag, body)
+    payload = json.loads(body)
+    assert payload["endpoint"] == "/api/teachers"
+    assert set(payload["sources"]) == {"Teachers Distribution"}
+    assert payload["data"]
+
+
+def test_etag_depends_on_params_and_data_version(monkeypatch):
+    etag, _ = get_response("/api/hpi/rankings", {})
+    assert get_response("/api/hpi/rankings", {"metric": "HPI"})[0] != etag
+
+    monkeypatch.setattr(api_server, "source_versions", lambda sources: {source: "changed" for source in sources})
+    assert get_response("/api/hpi/rankings", {})[0] != etag
+
+
+def test_conditional_get_returns_304(server):
+    status, headers, body = _request(server, "/api/enrollment/summary")
+    assert status == 200
+    assert json.loads(body)["data"]
+    etag = headers["ETag"]
+
+    status, headers, body = _request(server, "/api/enrollment/summary", {"If-None-Match": etag})
+    assert status == 304
+    assert body == b""
+    assert headers["ETag"] == etag
+
+    status, _, body = _request(server, "/api/enrollment/summary", {"If-None-Match": '"stale"'})
+    assert status == 200 and body
+
+
+def test_head_sends_headers_only(server):
+    status, headers, body = _request(server, "/api/teachers", method="HEAD")
+    assert status == 200
+    assert int(headers["Content-Length"]) > 0
+    assert body == b""
+
+
+def test_errors(server):
+    assert _request(server, "/api/nothing")[0] == 404
+    assert _request(server, "/api/hpi/rankings?metric=Wealth")[0] == 400
+    assert _request(server, "/api/teachers?year=2020")[0] == 400
+    status, _, body = _request(server, "/api")
+    assert status == 200
+    assert set(json.loads(body)["endpoints"]) == set(api_server.ENDPOINTS)
@@ -0,0 +1,50 @@
+import os
+
+from data_watcher import DEPENDENCIES, DataWatcher, _invalidator, dependents, source_paths
+
+
+def test_dependents_are_transitive():
+    affected = dependents(["dataset:Detailed Enrollment"])
+    assert "frame:Detailed Enrollment" in affected
+    assert "enrollment_cube" in affected
+    assert "figures:detailed_enrollment_visualizations.create_total_enrollment_bar_chart" in affected
+    assert "figures:create_province_choropleth" in affected
+
+
+def test_unrelated_artefacts_stay_warm():
+    affected = dependents(["dataset:Teachers Distribution"])
+    assert affected == [
+        "frame:Teachers Distribution",
+        "figures:visualizations.create_teacher_distribution",
+        "figures:create_province_choropleth",
+    ]
+    assert dependents(["nothing:depends-on-this"]) == []
+
+
+def test_order_follows_the_graph_and_cycles_terminate():
+    graph = {"c": ["b"], "a": ["source"], "b": ["a", "c"]}
+    assert dependents(["source"], graph) == ["c", "a", "b"]
+
+
+def test_graph_is_closed():
+    sources = set(source_paths())
+    for artefact, inputs in DEPENDENCIES.items():
+        assert all(node in sources or node in DEPENDENCIES for node in inputs), artefact
+        assert callable(_invalidator(artefact))
+
+
+def test_watcher_reports_content_changes_only(tmp_path):
+    path = tmp_path / "source.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    graph = {"figures:first": ["source"], "figures:second": ["figures:first"]}
+    watcher = DataWatcher(graph=graph, paths={"source": str(path)}, reload=False)
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert watcher.check() == {"changed": [], "invalidated": []}
+
+    path.write_text("a,b\n1,3\n", encoding="utf-8")
+    assert watcher.check() == {"changed": ["source"], "invalidated": ["figures:first", "figures:second"]}
+
+    path.unlink()
+    assert watcher.check()["changed"] == ["source"]
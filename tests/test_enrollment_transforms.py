@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from data_loader import load_dataset
+from enrollment_transforms import (
+    GRADE_COLS,
+    LEVEL_TOTAL_COLS,
+    build_enrollment_cube,
+    clear_enrollment_cube_cache,
+    create_enrollment_by_grade,
+    create_enrollment_summary,
+    create_gender_enrollment_summary,
+    preprocess_data,
+)
+
+TOTAL_COLS = LEVEL_TOTAL_COLS + ["Total"]
+
+
+@pytest.fixture
+def detailed():
+    clear_enrollment_cube_cache()
+    return load_dataset("Detailed Enrollment")
+
+
+def _baseline_rows(data):
+    """The original groupby input: preprocessed rows without the Grand Total block."""
+    rows = preprocess_data(data)
+    return rows[rows["Province_Name"] != "Grand Total"]
+
+
+def _compare(actual, expected):
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_dtype=False)
+
+
+def test_summary_matches_groupby(detailed):
+    overall = _baseline_rows(detailed)
+    overall = overall[overall["Gender"] == "Overall"]
+    expected = (overall.groupby("Province_Name")[TOTAL_COLS].sum().reset_index()
+                .rename(columns={"Province_Name": "Province"}))
+    _compare(create_enrollment_summary(detailed), expected)
+
+
+def test_gender_summary_matches_groupby(detailed):
+    rows = _baseline_rows(detailed)
+    rows = rows[rows["Gender"].isin(["F", "M"])]
+    expected = (rows.groupby(["Province_Name", "Gender"])[TOTAL_COLS].sum().reset_index()
+                .rename(columns={"Province_Name": "Province"}))
+    _compare(create_gender_enrollment_summary(detailed), expected)
+
+
+def test_by_grade_matches_groupby(detailed):
+    overall = _baseline_rows(detailed)
+    overall = overall[overall["Gender"] == "Overall"]
+    expected = (overall.groupby("Province_Name")[GRADE_COLS].sum().reset_index()
+                .rename(columns={"Province_Name": "Province"}))
+    _compare(create_enrollment_by_grade(detailed), expected)
+
+
+def test_grand_total_is_not_counted_as_tafea(detailed):
+    # The Grand Total row follows Tafea; forward-filling province names used to
+    # add the national totals to Tafea's.
+    tafea_row = detailed[detailed["Province"].astype(str) == "Tafea"].iloc[0]
+    summary = create_enrollment_summary(detailed).set_index("Province")
+    assert summary.loc["Tafea", "Total"] == tafea_row["Total"]
+    assert "Grand Total" not in summary.index
+
+    grand_total = detailed[detailed["Province"].astype(str) == "Grand Total"].iloc[0]
+    assert summary["Total"].sum() == grand_total["Total"]
+
+
+def test_raw_and_preprocessed_frames_agree(detailed):
+    _compare(create_enrollment_summary(preprocess_data(detailed)), create_enrollment_summary(detailed))
+
+
+def test_cube_is_indexed_by_categoricals(detailed):
+    cube = build_enrollment_cube(detailed)
+    assert list(cube.index.names) == ["Province", "Gender", "Level", "Grade"]
+    assert all(isinstance(level.dtype, pd.CategoricalDtype) for level in cube.index.levels)
+    assert cube.xs("Overall", level="Gender")["Enrollment"].sum() == create_enrollment_summary(detailed)["Total"].sum()
+
+
+def test_results_are_copies(detailed):
+    summary = create_enrollment_summary(detailed)
+    summary["Total"] = 0
+    assert (create_enrollment_summary(detailed)["Total"] > 0).all()
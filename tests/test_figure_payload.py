@@ -0,0 +1,76 @@
+import base64
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from figure_payload import (
+    _compact_array,
+    _decode_typed_array,
+    figure_from_payload,
+    minimize_figure,
+    minimized_payload,
+)
+
+
+def test_non_numeric_values_are_unchanged():
+    labels = ["Torba", "Sanma"]
+    assert _compact_array(labels) is labels
+    assert _compact_array([]) == []
+    spec = {"not": "typed"}
+    assert _compact_array(spec) is spec
+
+
+def test_integers_are_kept_exactly():
+    compact = _compact_array([1, 2, 3_000_000_000])
+    assert compact.dtype == np.int64
+    assert compact.tolist() == [1, 2, 3_000_000_000]
+
+
+def test_whole_floats_become_integers():
+    compact = _compact_array([1.0, 2.0, 16572.0])
+    assert compact.dtype == np.int64
+    assert compact.tolist() == [1, 2, 16572]
+
+
+def test_whole_floats_with_gaps_stay_float():
+    compact = _compact_array([1.0, np.nan, 3.0])
+    assert compact.dtype == np.float32
+    assert np.isnan(compact[1]) and compact[2] == 3
+
+
+def test_each_value_keeps_six_significant_digits():
+    values = np.array([123456.789, 0.000123456789, -0.61803398875, 1e-40])
+    compact = _compact_array(values)
+    # A value below float32's range keeps the array in float64
+    assert compact.dtype == np.float64
+    np.testing.assert_allclose(compact, values, rtol=5e-6)
+    assert compact[1] == pytest.approx(0.000123457, rel=1e-9)
+
+
+def test_fractions_fit_float32():
+    values = np.array([0.123456789, 0.987654321, 12.3456789])
+    compact = _compact_array(values)
+    assert compact.dtype == np.float32
+    np.testing.assert_allclose(compact, values, rtol=5e-6)
+
+
+def test_decodes_plotly_typed_arrays():
+    spec = {"dtype": "f8", "bdata": base64.b64encode(np.array([0.25, 0.5], dtype="<f8").tobytes()).decode()}
+    np.testing.assert_array_equal(_decode_typed_array(spec), [0.25, 0.5])
+    assert _compact_array(spec).dtype == np.float32
+
+
+def test_minimized_figure_draws_the_same_data():
+    fig = go.Figure(go.Scatter(x=np.arange(5), y=np.linspace(0, 1, 5) / 3, text=None))
+    fig.update_layout(title="Test")
+    minimized = minimize_figure(fig)
+    np.testing.assert_allclose(minimized.data[0].y, fig.data[0].y, rtol=5e-6)
+    assert minimized.layout.title.text == "Test"
+
+    payload = minimized_payload(fig)
+    assert len(payload) < len(fig.to_json())
+    restored = figure_from_payload(payload)
+    assert minimized_payload(restored) == payload
+    assert json.loads(restored.to_json())["data"][0]["type"] == "scatter"
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from data_loader import derive_fingerprint, frame_fingerprint, known_fingerprint, load_dataset
+from enrollment_transforms import create_enrollment_by_grade, preprocess_data
+from visualizations import create_teacher_distribution
+
+
+def _hashed(frame):
+    return frame_fingerprint(frame.copy(deep=True))
+
+
+def test_loaded_frames_are_known_without_hashing():
+    first, second = load_dataset("HPI"), load_dataset("HPI")
+    assert known_fingerprint(first) is not None
+    assert frame_fingerprint(first) == frame_fingerprint(second)
+
+
+def test_edits_drop_the_tag():
+    edits = [
+        lambda frame: frame.__setitem__("Total", 0),
+        lambda frame: frame.loc.__setitem__((frame.index[0], "ECE"), -1),
+        lambda frame: frame.iloc.__setitem__((0, 2), 0),
+        lambda frame: frame.sort_values("Total", inplace=True),
+        lambda frame: frame.rename(columns={"ECE": "ece"}, inplace=True),
+        lambda frame: frame.drop(columns="SS", inplace=True),
+    ]
+    for edit in edits:
+        frame = load_dataset("Teachers Distribution")
+        edit(frame)
+        assert known_fingerprint(frame) is None
+        assert frame_fingerprint(frame) == _hashed(frame)
+
+
+def test_edited_frames_do_not_hit_cached_figures():
+    frame = load_dataset("Teachers Distribution")
+    before = create_teacher_distribution(frame).to_json()
+    frame[frame.select_dtypes("number").columns] = 0
+    assert create_teacher_distribution(frame).to_json() != before
+
+
+def test_edited_frames_do_not_hit_the_enrollment_cube():
+    frame = load_dataset("Detailed Enrollment")
+    assert create_enrollment_by_grade(frame)["Grade_1"].sum() > 0
+    frame.loc[:, "Grade_1"] = 0
+    assert create_enrollment_by_grade(frame)["Grade_1"].sum() == 0
+
+
+def test_derived_frames_keep_a_tag_until_edited():
+    derived = preprocess_data(load_dataset("Detailed Enrollment"))
+    assert known_fingerprint(derived) is not None
+    derived.loc[derived.index[0], "Gender"] = "F"
+    assert known_fingerprint(derived) is None
+
+    untagged = pd.DataFrame({"a": [1]})
+    assert known_fingerprint(derive_fingerprint(untagged.copy(), untagged, "copy")) is None
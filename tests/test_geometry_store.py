@@ -0,0 +1,87 @@
+import json
+
+import pytest
+import shapely
+from shapely.geometry import shape
+
+from geography import GEOJSON_PATH
+from geometry_store import GeometryStore, iter_geojson_features
+
+
+def _square(x, y, size=1.0):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+def _write(tmp_path, collection):
+    path = tmp_path / "boundaries.geojson"
+    path.write_text(json.dumps(collection), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def neighbours():
+    """Two unit squares sharing an edge, and a MultiPolygon made of two more."""
+    return {
+        "type": "FeatureCollection",
+        "name": "test",
+        "features": [
+            {"type": "Feature", "properties": {"code": "A"},
+             "geometry": {"type": "Polygon", "coordinates": [_square(168.0, -16.0)]}},
+            {"type": "Feature", "properties": {"code": "B"},
+             "geometry": {"type": "Polygon", "coordinates": [_square(169.0, -16.0)]}},
+            {"type": "Feature", "properties": {"code": "C"},
+             "geometry": {"type": "MultiPolygon",
+                          "coordinates": [[_square(170.5, -16.0, 0.5)], [_square(171.5, -16.0, 0.25)]]}},
+        ],
+        "crs": {"type": "name", "properties": {"name": "EPSG:4326"}},
+    }
+
+
+@pytest.mark.parametrize("read_size", [7, 64, 1 << 16])
+def test_streaming_matches_json_load(tmp_path, neighbours, read_size):
+    path = _write(tmp_path, neighbours)
+    assert list(iter_geojson_features(path, read_size=read_size)) == neighbours["features"]
+
+
+def test_streams_a_feature_larger_than_the_buffer(tmp_path):
+    ring = [[168 + i * 1e-4, -16 + (i % 5) * 1e-4] for i in range(5000)] + [[168, -16]]
+    feature = {"type": "Feature", "properties": {}, "geometry": {"type": "Polygon", "coordinates": [ring]}}
+    path = _write(tmp_path, {"type": "FeatureCollection", "features": [feature]})
+    assert list(iter_geojson_features(path, read_size=16)) == [feature]
+
+
+def test_truncated_file_is_an_error(tmp_path, neighbours):
+    path = tmp_path / "truncated.geojson"
+    path.write_text(json.dumps(neighbours)[:200], encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_geojson_features(str(path)))
+
+
+def test_roundtrip_and_shared_edges(tmp_path, neighbours):
+    store = GeometryStore.from_file(_write(tmp_path, neighbours), id_field="code")
+    assert store.ids == ["A", "B", "C"]
+
+    decoded = store.to_geojson()
+    for original, feature in zip(neighbours["features"], decoded["features"]):
+        assert feature["id"] == original["properties"]["code"]
+        assert feature["properties"] == original["properties"]
+        assert feature["geometry"]["type"] == original["geometry"]["type"]
+        assert shape(feature["geometry"]).equals(shape(original["geometry"]))
+
+    # A and B share one edge; it is stored once and referenced by both rings
+    assert store.summary()["arc_references"] == store.summary()["arcs"] + 1
+    assert store.to_plotly_geojson(["B"])["features"][0]["properties"] == {}
+
+
+def test_roundtrip_of_the_boundary_file():
+    with open(GEOJSON_PATH, encoding="utf-8") as handle:
+        features = json.load(handle)["features"]
+    store = GeometryStore.from_file(GEOJSON_PATH)
+    decoded = store.to_geojson()["features"]
+    assert len(decoded) == len(features)
+
+    original = shapely.set_precision([shape(f["geometry"]) for f in features], 1e-6)
+    stored = [shape(f["geometry"]) for f in decoded]
+    assert all(shapely.is_valid(stored))
+    difference = shapely.area(shapely.symmetric_difference(original, stored))
+    assert (difference <= 1e-6 * shapely.area(original)).all()
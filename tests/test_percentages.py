@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_loader import clean_percentage, load_dataset, parse_percentage_column
+
+
+def test_percent_signs_and_thousands_separators():
+    parsed = parse_percentage_column(pd.Series(["62%", " 45.5 % ", "1,234%"]))
+    assert parsed.unit == "percent"
+    assert parsed.values.tolist() == pytest.approx([0.62, 0.455, 12.34])
+    assert parsed.invalid.empty
+
+
+def test_bare_numbers_above_one_are_percentage_points():
+    parsed = parse_percentage_column(pd.Series([62, 45]))
+    assert parsed.unit == "percent"
+    assert parsed.values.tolist() == pytest.approx([0.62, 0.45])
+
+
+def test_fractions_are_kept():
+    parsed = parse_percentage_column(pd.Series(["0.62", "0.5"]))
+    assert parsed.unit == "fraction"
+    assert parsed.values.tolist() == pytest.approx([0.62, 0.5])
+
+
+def test_unit_is_decided_per_cell():
+    parsed = parse_percentage_column(pd.Series(["0.62", "62%"]))
+    assert parsed.unit == "mixed"
+    assert parsed.values.tolist() == pytest.approx([0.62, 0.62])
+
+
+def test_missing_and_invalid_cells():
+    series = pd.Series(["50%", "", None, "n/a"])
+    parsed = parse_percentage_column(series)
+    assert parsed.values.iloc[0] == pytest.approx(0.5)
+    assert parsed.values.iloc[1:].isna().all()
+    assert parsed.invalid.to_dict() == {3: "n/a"}
+
+
+@pytest.mark.parametrize("value", ["62%", "0.62", 0.62, "", np.nan, "n/a"])
+def test_matches_clean_percentage_on_single_values(value):
+    expected = clean_percentage(value)
+    parsed = parse_percentage_column(pd.Series([value], dtype=object)).values.iloc[0]
+    if pd.isna(expected):
+        assert pd.isna(parsed)
+    else:
+        assert parsed == pytest.approx(expected)
+
+
+def test_ner_table_is_in_fractions():
+    ner = load_dataset("NER for ECCE")
+    rates = ner[[col for col in ner.columns if col.startswith("Total_")]]
+    assert ((rates >= 0) & (rates <= 1)).all().all()
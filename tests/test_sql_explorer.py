@@ -0,0 +1,96 @@
+import pytest
+
+import sql_explorer
+from data_loader import load_dataset
+from sql_explorer import QueryError, build_query, run_query, validate_query
+
+
+@pytest.fixture(autouse=True)
+def fresh_results():
+    sql_explorer._results.clear()
+    sql_explorer._row_counts.clear()
+    sql_explorer._result_bytes = 0
+
+
+@pytest.mark.parametrize("sql", [
+    "",
+    "DELETE FROM hpi",
+    "CREATE TABLE t AS SELECT 1",
+    "COPY hpi TO 'out.csv'",
+    "SELECT 1; SELECT 2",
+    "SELEC 1",
+])
+def test_rejects_everything_but_one_select(sql):
+    with pytest.raises(QueryError):
+        validate_query(sql)
+
+
+def test_accepts_a_select_with_comments():
+    assert validate_query("SELECT * FROM hpi -- top").startswith("SELECT * FROM hpi")
+
+
+def test_build_query_quotes_names_and_parameterizes_values():
+    sql, params = build_query("teacher_distribution", ["Gender"], [("sum", "ECE"), ("count", "*")],
+                              [("Province", "contains", "an"), ("Total", ">", 3)])
+    assert sql == ('SELECT "Gender", sum("ECE") AS "sum_ECE", count(*) AS "rows" FROM "teacher_distribution"'
+                   ' WHERE CAST("Province" AS VARCHAR) ILIKE ? AND "Total" > ?'
+                   ' GROUP BY "Gender" ORDER BY "Gender"')
+    assert params == ["%an%", 3]
+    assert build_query('odd"name')[0] == 'SELECT * FROM "odd""name"'
+
+
+@pytest.mark.parametrize("measures, filters", [
+    ([("median", "ECE")], []),
+    ([], [("Total", "LIKE", "x")]),
+])
+def test_build_query_rejects_unknown_functions_and_operators(measures, filters):
+    with pytest.raises(QueryError):
+        build_query("teacher_distribution", [], measures, filters)
+
+
+def test_guided_query_matches_pandas():
+    sql, params = build_query("teacher_distribution", ["Gender"], [("sum", "Total")], [("Total", ">=", 0)])
+    result = run_query(sql, params).rows
+    expected = load_dataset("Teachers Distribution").groupby("Gender", observed=True)["Total"].sum()
+    assert dict(zip(result["Gender"].astype(str), result["sum_Total"])) == expected.to_dict()
+
+
+def test_trailing_line_comment():
+    page = run_query("SELECT * FROM hpi -- top")
+    assert page.total_rows == len(load_dataset("HPI"))
+
+
+def test_pages_are_slices_of_one_result():
+    sql = "SELECT country FROM hpi ORDER BY country"
+    first = run_query(sql, page=1, page_size=50)
+    assert first.page_count == -(-first.total_rows // 50)
+    last = run_query(sql, page=999, page_size=50)
+    assert last.page == first.page_count
+    assert len(last.rows) == first.total_rows - 50 * (first.page_count - 1)
+    assert len(sql_explorer._results) == 1
+
+
+def test_results_over_the_budget_are_paged_in_the_database(monkeypatch):
+    monkeypatch.setattr(sql_explorer, "RESULT_CACHE_MAX_BYTES", 1)
+    sql = "SELECT country FROM hpi ORDER BY country -- paged"
+    page = run_query(sql, page=2, page_size=50)
+    assert not sql_explorer._results
+    monkeypatch.undo()
+    assert page.rows.equals(run_query(sql, page=2, page_size=50).rows)
+
+
+def test_storing_a_result_twice_counts_it_once():
+    sql_explorer._remember("key", "first", 10)
+    sql_explorer._remember("key", "second", 12)
+    assert sql_explorer._recall("key") == "second"
+    assert sql_explorer._result_bytes == 12
+
+
+def test_sums_arrive_as_plain_integers():
+    rows = run_query("SELECT sum(Total) AS total FROM teacher_distribution").rows
+    assert rows["total"].dtype.kind == "i"
+
+
+def test_files_cannot_be_read():
+    with pytest.raises(QueryError):
+        run_query("SELECT * FROM read_csv('data/hpi.csv')")
@@ -0,0 +1,89 @@
+import io
+
+import pandas as pd
+import pyarrow.feather as feather
+import pytest
+
+from data_loader import dataset_path
+from enrollment_transforms import build_enrollment_cube, preprocess_data
+from stacked_enrollment import ParseReport, iter_stacked_records, record_schema, write_records_arrow
+
+HEADER = "Province,PreSchool,PreSchool_Total,Grade_1,Grade_2,Total"
+
+
+def _extract(*rows):
+    return io.StringIO("\n".join([HEADER, *rows]) + "\n")
+
+
+def _records(source, **kwargs):
+    report = ParseReport()
+    batches = list(iter_stacked_records(source, report=report, **kwargs))
+    frame = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    return frame, report
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 5, 100_000])
+def test_matches_the_enrollment_cube(chunk_rows):
+    path = dataset_path("Detailed Enrollment")
+    records, report = _records(path, chunk_rows=chunk_rows)
+    assert report.ok
+    assert report.summary_rows == 1
+
+    cube = build_enrollment_cube(preprocess_data(pd.read_csv(path)))["Enrollment"]
+    parsed = records.groupby(["Province", "Gender", "Level", "Grade"], observed=True)["Enrollment"].sum()
+    parsed.index = parsed.index.set_levels(parsed.index.levels[0].astype(str), level=0)
+    expected = cube.rename(index=str, level="Province")
+    pd.testing.assert_series_equal(parsed.sort_index(), expected.sort_index(), check_dtype=False,
+                                   check_index_type=False, check_categorical=False)
+
+
+def test_gender_rows_split_from_their_province_by_a_chunk_boundary():
+    source = _extract("Torba,1,1,2,3,6", "F,0,0,1,1,2", "M,1,1,1,2,4", "Sanma,2,2,2,2,6", "F,1,1,1,1,3")
+    records, report = _records(source, chunk_rows=2)
+    assert report.ok and report.chunks == 3
+    owners = records.drop_duplicates(["Province", "Gender"])[["Province", "Gender"]].astype(str)
+    assert owners.values.tolist() == [["Torba", "Overall"], ["Torba", "F"], ["Torba", "M"],
+                                      ["Sanma", "Overall"], ["Sanma", "F"]]
+
+
+def test_orphans_are_reported_and_skipped():
+    source = _extract("F,9,9,9,9,27", "Torba,1,1,2,3,6", "F,0,0,1,1,2", "F,0,0,1,1,2",
+                      "Grand Total,1,1,2,3,6", "F,0,0,1,1,2")
+    records, report = _records(source, chunk_rows=3)
+    assert [(line, label) for line, label, _ in report.orphans] == [(2, "F"), (5, "F")]
+    assert report.summary_rows == 2
+    assert set(records["Province"]) == {"Torba"}
+    assert len(records) == 2 * 3
+
+
+def test_arrow_file_has_one_schema_across_chunks(tmp_path):
+    # The blank count in the last chunk would otherwise change Enrollment to float64
+    source = _extract("Torba,1,1,2,3,6", "F,0,0,1,1,2", "Sanma,2,2,2,,4")
+    target = str(tmp_path / "records.arrow")
+    written = write_records_arrow(iter_stacked_records(source, year=2021, chunk_rows=2), target)
+
+    table = feather.read_table(target)
+    assert written == table.num_rows == 9
+    assert table.schema == record_schema(year=True)
+    assert table.column("Enrollment").null_count == 1
+
+
+def test_empty_extract_writes_nothing(tmp_path):
+    target = tmp_path / "records.arrow"
+    assert write_records_arrow(iter_stacked_records(_extract()), str(target)) == 0
+    assert not target.exists()
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    target = tmp_path / "records.arrow"
+    write_records_arrow(iter_stacked_records(_extract("Torba,1,1,2,3,6")), str(target))
+    previous = target.read_bytes()
+
+    def batches():
+        yield from iter_stacked_records(_extract("Sanma,2,2,2,2,6"))
+        raise ValueError("extract truncated")
+
+    with pytest.raises(ValueError):
+        write_records_arrow(batches(), str(target))
+    assert target.read_bytes() == previous
+    assert list(tmp_path.iterdir()) == [target]
@@ -0,0 +1,79 @@
+"""Pure-pandas preparation of the survey tables for the charts in visualizations.
+
+Importing this module does not load Streamlit or Plotly.
+"""
+import pandas as pd
+
+TEACHER_LEVELS = ['ECE', 'PS', 'PSET', 'SC', 'SS']
+
+# Age group -> the ages (in years) it is made of, in display order.
+AGE_GROUPS = {
+    'Under 3': [0, 1, 2],
+    '3-4 years': [3, 4],
+    '5-6 years': [5, 6],
+    'Over 6': [7, 8, 9, 10, 11]
+}
+
+SCHOOL_AGE_GROUPS = ['0--4', '5--9', '10--14', '15--19']
+
+
+def teacher_totals(data):
+    """Sums teachers per province and gender for each education level."""
+    return data.groupby(['Province', 'Gender'], observed=True)[TEACHER_LEVELS].sum().reset_index()
+
+
+def age_group_totals(data):
+    """
+    Totals the age distribution into AGE_GROUPS per year and province.
+
+    Args:
+        data (pd.DataFrame): The Age Distribution dataset.
+
+    Returns:
+        pd.DataFrame: Year, Province, Age Group and Number of Students, long format.
+    """
+    # Pivot and aggregate the data
+    age_pivot = data.pivot_table(
+        values='Total',
+        index=['Year', 'Province'],
+        columns='Age',
+        fill_value=0,
+        observed=True
+    ).reset_index()
+
+    # Calculate totals for each age group
+    for group, ages in AGE_GROUPS.items():
+        age_pivot[group] = age_pivot[ages].sum(axis=1)
+
+    return pd.melt(
+        age_pivot,
+        id_vars=['Year', 'Province'],
+        value_vars=list(AGE_GROUPS),
+        var_name='Age Group',
+        value_name='Number of Students'
+    )
+
+
+def population_by_age_group(population_data, school_age_only=False):
+    """
+    Reshapes the census table to one row per year and age group.
+
+    Args:
+        population_data (pd.DataFrame): The Population dataset.
+        school_age_only (bool): Keep only SCHOOL_AGE_GROUPS.
+
+    Returns:
+        pd.DataFrame: Year (as a string, so charts treat it as a category),
+        Age Group and Population.
+    """
+    if school_age_only:
+        age_groups = SCHOOL_AGE_GROUPS
+    else:
+        age_groups = [col for col in population_data.columns if '--' in col]
+
+    return population_data.assign(Year=population_data['Year'].astype(str)).melt(
+        id_vars=['Year'],
+        value_vars=age_groups,
+        var_name='Age Group',
+        value_name='Population'
+    )
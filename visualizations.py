@@ -1,9 +1,17 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-import json
+import time
 import streamlit as st
 
+from data_loader import dataset_fingerprint, load_dataset
+from figure_cache import cached_build, cached_figure
+from figure_payload import figure_from_payload, minimized_payload
+from profiler import record_build
+from materialized import aggregate
+from transforms import AGE_GROUPS
+from geography import area_council_geometry, attendance_table, boundary_fingerprint, level_for_zoom, viewport
+
 def create_bar_chart(data: pd.DataFrame, column: str):
     """
     Creates a bar chart using Plotly.
@@ -49,15 +57,55 @@ def display_table(data: pd.DataFrame):
     """
     st.dataframe(data)
 
+def lazy_tabs(labels, key):
+    """
+    Creates tabs that report which one is open, so only that tab's content needs building.
+
+    Selecting another tab reruns the enclosing script or fragment, which then
+    builds the newly opened tab. On Streamlit versions without stateful tabs
+    every tab is reported open and content is built eagerly as before.
+
+    Args:
+        labels (list of str): The tab labels.
+        key (str): Widget key that holds the selected tab.
+
+    Returns:
+        list of (DeltaGenerator, bool): Each tab container and whether it is open.
+    """
+    try:
+        tabs = st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return [(tab, True) for tab in st.tabs(labels)]
+    return [(tab, getattr(tab, "open", True)) for tab in tabs]
+
+def session_figure(key, params, build):
+    """
+    Returns a figure cached in this session, building it only on first use or when params change.
+
+    Args:
+        key (hashable): Identifies the figure slot, e.g. ("hpi", metric).
+        params (hashable): Inputs the figure depends on, such as a data fingerprint.
+        build (callable): Creates the figure.
+
+    Returns:
+        plotly.graph_objects.Figure: The cached or newly built figure.
+    """
+    start = time.perf_counter()
+    figures = st.session_state.setdefault("_session_figures", {})
+    cached = figures.get(key)
+    hit = cached is not None and cached[0] == params
+    if not hit:
+        fig = build()
+        # Stored minimized, so the session holds the compact arrays rather than the full figure
+        cached = (params, figure_from_payload(minimized_payload(fig)) if fig is not None else None)
+        figures[key] = cached
+    record_build(f"session_figure{key!r}", time.perf_counter() - start, hit)
+    return cached[1]
+
+@cached_figure
 def create_teacher_distribution(data):
     """Creates an enhanced stacked bar chart showing teacher distribution."""
-    teacher_summary = data.groupby(['Province', 'Gender']).agg({
-        'ECE': 'sum',
-        'PS': 'sum',
-        'PSET': 'sum',
-        'SC': 'sum',
-        'SS': 'sum'
-    }).reset_index()
+    teacher_summary = aggregate('teacher_totals', data)
     
     fig = px.bar(teacher_summary,
                  x='Province',
@@ -76,14 +124,15 @@ def create_teacher_distribution(data):
     
     return fig
 
+@cached_figure
 def create_gender_ratio_plot(data, data_type="enrollment"):
     """Creates an enhanced bar chart comparing gender ratios with map."""
     try:
         if data_type == "enrollment":
             gender_data = data[data['Province'].isin(['F', 'M'])].copy()
-            gender_summary = gender_data.groupby('Province')['Total'].sum().reset_index()
+            gender_summary = gender_data.groupby('Province', observed=True)['Total'].sum().reset_index()
         elif data_type == "teacher":
-            gender_summary = data.groupby(['Province', 'Gender'])['Total'].sum().unstack().reset_index()
+            gender_summary = data.groupby(['Province', 'Gender'], observed=True)['Total'].sum().unstack().reset_index()
             gender_summary['Ratio'] = gender_summary['F'] / (gender_summary['F'] + gender_summary['M'])
         
         fig = px.bar(gender_summary,
@@ -104,9 +153,10 @@ def create_gender_ratio_plot(data, data_type="enrollment"):
         print(f"Error in create_gender_ratio_plot: {e}")
         return None
 
+@cached_figure
 def create_enrollment_heatmap(data):
     """Creates a heatmap of enrollment numbers."""
-    numeric_cols = data.select_dtypes(include=['float64', 'int64']).columns
+    numeric_cols = data.select_dtypes(include='number').columns
     fig = go.Figure(data=go.Heatmap(
         z=data[numeric_cols].values,
         x=numeric_cols,
@@ -115,6 +165,7 @@ def create_enrollment_heatmap(data):
     fig.update_layout(title='Enrollment Heatmap by Grade and Province')
     return fig
 
+@cached_figure
 def create_percentage_plot(data, year_cols):
     """Creates a plot showing percentages over time."""
     if not all(col in data.columns for col in year_cols):
@@ -128,36 +179,10 @@ def create_percentage_plot(data, year_cols):
                   labels={'value': 'Percentage', 'variable': 'Year'})
     return fig
 
+@cached_figure
 def create_age_distribution_analysis(data):
     """Creates an enhanced visualization for age distribution analysis."""
-    # Pivot and aggregate the data
-    age_pivot = data.pivot_table(
-        values='Total',
-        index=['Year', 'Province'],
-        columns='Age',
-        fill_value=0
-    ).reset_index()
-    
-    # Create age group categories
-    age_groups = {
-        'Under 3': [0, 1, 2],
-        '3-4 years': [3, 4],
-        '5-6 years': [5, 6],
-        'Over 6': [7, 8, 9, 10, 11]
-    }
-    
-    # Calculate totals for each age group
-    for group, ages in age_groups.items():
-        age_pivot[group] = age_pivot[ages].sum(axis=1)
-    
-    # Melt the data for visualization
-    plot_data = pd.melt(
-        age_pivot,
-        id_vars=['Year', 'Province'],
-        value_vars=list(age_groups.keys()),
-        var_name='Age Group',
-        value_name='Number of Students'
-    )
+    plot_data = aggregate('age_group_totals', data)
     
     # Create the visualization
     fig = px.bar(
@@ -169,13 +194,14 @@ def create_age_distribution_analysis(data):
         barmode='stack',
         title='Age Distribution by Province (2018-2020)',
         labels={'Number of Students': 'Number of Enrolled Students'},
-        category_orders={"Age Group": list(age_groups.keys())},
+        category_orders={"Age Group": list(AGE_GROUPS)},
         color_discrete_sequence=px.colors.qualitative.Set3
     )
     
     # Update layout for better readability
     fig.update_layout(
         height=800,
+        margin=dict(l=20, r=20, t=40, b=20),
         showlegend=True,
         legend=dict(
             orientation="h",
@@ -192,25 +218,11 @@ def create_age_distribution_analysis(data):
     
     return fig
 
+@cached_figure
 def create_population_trend_visualization(population_data, school_age_only=False):
     """Creates a visualization of population trends with option to show only school-age groups."""
-    # Define age groups to show
-    if school_age_only:
-        age_groups = ['0--4', '5--9', '10--14', '15--19']
-    else:
-        age_groups = [col for col in population_data.columns if '--' in col]
-
-    # Convert Year to string to force categorical treatment
-    population_data = population_data.copy()
-    population_data['Year'] = population_data['Year'].astype(str)
-
-    # Melt the dataframe for plotting
-    melted_data = population_data.melt(
-        id_vars=['Year'],
-        value_vars=age_groups,
-        var_name='Age Group',
-        value_name='Population'
-    )
+    melted_data = aggregate('population_by_school_age_group' if school_age_only else 'population_by_age_group',
+                            population_data)
 
     # Create stacked bar chart
     fig = px.bar(
@@ -251,3 +263,121 @@ def create_population_trend_visualization(population_data, school_age_only=False
     fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='LightGray')
 
     return fig
+
+
+def create_attendance_choropleth(year="2020", province=None):
+    """
+    Creates a choropleth of school attendance by Area Council.
+
+    The map is fitted to the whole country or to one province, and the
+    boundaries are drawn at the lightest precomputed level of detail that
+    looks unchanged at that fitted zoom. Streamlit does not report the
+    user's own zooming back, so the level follows the selection, not
+    later zooming in the browser.
+
+    Args:
+        year (str): Attendance year to show, "2016" or "2020".
+        province (str, optional): Restrict the map to one province's councils.
+
+    Returns:
+        plotly.graph_objects.Figure: The choropleth map.
+    """
+    center, zoom = viewport(province)
+    level = level_for_zoom(zoom)
+    key = ("create_attendance_choropleth", boundary_fingerprint().sha256, year, province, level)
+
+    def build():
+        attendance = attendance_table()
+        geojson = area_council_geometry(level)
+        if province is not None:
+            attendance = attendance[attendance['province'] == province]
+            geocodes = set(attendance['geocode'])
+            geojson = {
+                "type": "FeatureCollection",
+                "features": [f for f in geojson["features"] if f["id"] in geocodes],
+            }
+
+        fig = go.Figure(go.Choroplethmap(
+            geojson=geojson,
+            locations=attendance['geocode'],
+            z=attendance[f'attendance_{year}'],
+            text=attendance['name'],
+            customdata=attendance['province'],
+            colorscale='YlGnBu',
+            marker_line_width=0.5,
+            marker_line_color='white',
+            colorbar_title='Attendance',
+            hovertemplate='<b>%{text}</b> (%{customdata})<br>Attendance: %{z:,.0f}<extra></extra>'
+        ))
+        fig.update_layout(
+            title=f'School Attendance by Area Council ({year})',
+            map=dict(style='carto-positron', center=center, zoom=zoom),
+            height=600,
+            margin=dict(l=0, r=0, t=40, b=0)
+        )
+        return fig
+
+    return cached_build(key, build)
+
+
+# Province map metric -> (dataset, column summed per province); None is the
+# attendance aggregated from the Area Councils.
+PROVINCE_METRICS = {
+    "School attendance": None,
+    "Enrollment": ("Detailed Enrollment", "Total"),
+    "Teachers": ("Teachers Distribution", "Total"),
+}
+
+
+def create_province_choropleth(metric="School attendance", year="2020"):
+    """
+    Creates a choropleth of one metric per province.
+
+    Province polygons are dissolved from the Area Councils once per boundary
+    file (see spatial_aggregation), and CSV tables are matched to them
+    through the cached province crosswalk.
+
+    Args:
+        metric (str): A key of PROVINCE_METRICS.
+        year (str): Attendance year, used by "School attendance" only.
+
+    Returns:
+        plotly.graph_objects.Figure: The choropleth map.
+    """
+    source = PROVINCE_METRICS[metric]
+    center, zoom = viewport()
+    level = level_for_zoom(zoom)
+    versions = (boundary_fingerprint().sha256,) + ((dataset_fingerprint(source[0]).sha256,) if source else ())
+    key = ("create_province_choropleth", versions, metric, year if source is None else None, level)
+
+    def build():
+        from spatial_aggregation import province_boundaries, province_geometry, province_totals
+
+        if source is None:
+            table = province_boundaries()[['province_code', 'province', f'attendance_{year}']]
+            table = table.rename(columns={f'attendance_{year}': 'value'})
+            title = f'School Attendance by Province ({year})'
+        else:
+            table = province_totals(load_dataset(source[0]), source[1])
+            title = f'{metric} by Province'
+
+        fig = go.Figure(go.Choroplethmap(
+            geojson=province_geometry(level),
+            locations=table['province_code'],
+            z=table['value'],
+            text=table['province'],
+            colorscale='YlGnBu',
+            marker_line_width=1,
+            marker_line_color='white',
+            colorbar_title=metric,
+            hovertemplate=f'<b>%{{text}}</b><br>{metric}: %{{z:,.0f}}<extra></extra>'
+        ))
+        fig.update_layout(
+            title=title,
+            map=dict(style='carto-positron', center=center, zoom=zoom),
+            height=600,
+            margin=dict(l=0, r=0, t=40, b=0)
+        )
+        return fig
+
+    return cached_build(key, build)